@@ -1,62 +1,8 @@
 from genetic_algorithm import *
-
-def run(POPULATION_SIZE,
-        CROSSOVER_RATE,
-        MUTATION_RATE,
-        NUMBER_OF_GENERATIONS,
-        MIN_VALUE,
-        RANDOM_STATE,
-        generate_population, 
-        evaluate_population, 
-        stopping_criterion, 
-        parent_selection_strategy, 
-        crossover_strategy, 
-        mutation_strategy, 
-        survivor_selection_strategy,
-        return_best_individual_and_score_function):
-    """
-    Executa o algoritmo genético.
-
-    Args:
-        POPULATION_SIZE: Tamanho da população que vai ser gerada.
-        CROSSOVER_RATE: Taxa de cruzamento.
-        MUTATION_RATE: Taxa de mutação dos filhos.
-        NUMBER_OF_GENERATIONS: Número de gerações que serão criadas.
-        MIN_VALUE: O valor minimo da função de custo.
-        RANDOM_STATE: O estado aleátorio definido.
-        generate_population: A função reponsável por gerar a população.
-        evaluate_population: A função reponsável por avaliar os individuos.
-        stopping_criterion: A função reponsável por verificar se o critério de parada foi atendido.
-        parent_selection_strategy: A função reponsável por selecionar os pares para reprodução.
-        crossover_strategy: A função reponsável por realizar o cruzamento.
-        mutation_strategy: A função reponsável por selecionar alguns filhos e aplicar a mutação dos genes neles.
-        survivor_selection_strategy: A função reponsável por selecionar os sobreviventes que irão constituir a próxima geração.
-        return_best_individual_and_score_function: A reponsável por selecionar o melhor individuo ao final da execução do código e retornar ele e a sua pontuação.
-
-    Returns:
-        O melhor individuo encontrado e o número de execuções.
-    """
-    
-    endRound = 0
-    population = generate_population(POPULATION_SIZE, RANDOM_STATE)
-    evaluates = evaluate_population(population)
-
-    for round in range(NUMBER_OF_GENERATIONS):
-        endRound = round+1
-
-        if stopping_criterion(evaluates, MIN_VALUE) == True:
-            break
-
-        parents = parent_selection_strategy(population, evaluates, round, RANDOM_STATE)
-        sons = crossover_strategy(parents, CROSSOVER_RATE, round, RANDOM_STATE)
-        mutateSons = mutation_strategy(sons, MUTATION_RATE, round, RANDOM_STATE)
-        sonsEvaluates = evaluate_population(mutateSons)
-
-        population, evaluates =  survivor_selection_strategy(population, mutateSons, evaluates, sonsEvaluates, POPULATION_SIZE)
-
-    bestIndividual, bestScore = return_best_individual_and_score_function(population, evaluates)
-
-    return bestIndividual, bestScore, endRound
+from runner import getBestIndividual
+from experiment_executor import iterate_experiments
+from solution_harvester import harvest_solutions
+from fitness_table import TABLE_PATH, LookupTableEvaluator, build_collision_table, metadata_path
 
 POPULATION_SIZE: int = 20
 CROSSOVER_RATE: float = 0.8
@@ -64,79 +10,73 @@ MUTATION_RATE:float = 0.03
 
 NUMBER_OF_GENERATIONS: int = 1000
 MIN_VALUE: int = 0
-RANDOM_STATES: list[int] = [41, 42, 769, 18, 27]
-# Individuos distintos que chegaram no 0: 41, 42, 769, 18, 27
-
-def getBestIndividual(individuals: list[list[int]], scores: list[int]) -> list[list[int], int]:
-    minValue = min(scores)
-    minValueIndex = scores.index(minValue)
-    return individuals[minValueIndex], scores[minValueIndex]
-
-print("\nTask, c) As 5 melhores soluções distintas encontradas:")
-
-for RANDOM_STATE in RANDOM_STATES:
-    bestIndividual, bestScore, endRound = run(POPULATION_SIZE,
-        CROSSOVER_RATE,
-        MUTATION_RATE,
-        NUMBER_OF_GENERATIONS,
-        MIN_VALUE,
-        RANDOM_STATE,
-        generate_population = PopulationGenerator.generate_eight_queen_vector,
-        evaluate_population = PopulationAssessor.evaluate_eight_queen_vector, 
-        stopping_criterion = StoppingCriteria.stop_eight_queen_vector_min,
-        parent_selection_strategy = ParentSelector.select_parent_roulette_eight_queen_vector,
-        crossover_strategy = CrossoverMethods.cut_point_eight_eight_queen_vector,
-        mutation_strategy = Modifier.apply_bit_flip_eight_queen_vector,
-        survivor_selection_strategy = SuvivorCriteria.elitist_replacement_eight_queen_vector,
-        return_best_individual_and_score_function = getBestIndividual)
-
-    print(f"Melhor individuo: {bestIndividual} | Pontuação: {bestScore} | Encontrado no round: {endRound}")
-
-print("\nTask, b) A média e o desvio-padrão do número de iterações até a parada do algoritmo:")
-
-import numpy as np
-from random import randint
-from time import time
-import json
-
-numberOfExecutions = 5000
-maxRandomState = 2**32
-printRound = 50
-
-results = {
-    "Individuals" : [],
-    "Scores" : [],
-    "End Rounds" : [],
-    "Execution Times" : []
-}
-
-roundCounter = 1
-for RANDOM_STATE in [randint(0, maxRandomState) for _ in range(numberOfExecutions)]:
-    if roundCounter % printRound == 0:
-        print(f"Round: {roundCounter}")
-    roundCounter += 1
-
-    startTime = time()
-
-    bestIndividual, bestScore, endRound = run(POPULATION_SIZE,
-        CROSSOVER_RATE,
-        MUTATION_RATE,
-        NUMBER_OF_GENERATIONS,
-        MIN_VALUE,
-        RANDOM_STATE,
-        generate_population = PopulationGenerator.generate_eight_queen_vector,
-        evaluate_population = PopulationAssessor.evaluate_eight_queen_vector, 
-        stopping_criterion = StoppingCriteria.stop_eight_queen_vector_min,
-        parent_selection_strategy = ParentSelector.select_parent_roulette_eight_queen_vector,
-        crossover_strategy = CrossoverMethods.cut_point_eight_eight_queen_vector,
-        mutation_strategy = Modifier.apply_bit_flip_eight_queen_vector,
-        survivor_selection_strategy = SuvivorCriteria.elitist_replacement_eight_queen_vector,
-        return_best_individual_and_score_function = getBestIndividual)
-
-    results["Individuals"].append(bestIndividual)
-    results["Scores"].append(bestScore)
-    results["End Rounds"].append(endRound)
-    results["Execution Times"].append(time() - startTime)
-
-with open("documentation/results.json", "w", encoding="utf-8") as file:
-    json.dump(results, file, indent=4)
+NUMBER_OF_DISTINCT_SOLUTIONS: int = 5
+
+if __name__ == "__main__":
+    import os
+
+    numberOfWorkers = None # None usa todos os núcleos.
+
+    # A tabela com as colisões de todos os genótipos é criada uma vez e compartilhada pelos processos.
+    if not os.path.isfile(TABLE_PATH) or not os.path.isfile(metadata_path(TABLE_PATH)):
+        build_collision_table(TABLE_PATH)
+
+    runArguments = {
+        "POPULATION_SIZE": POPULATION_SIZE,
+        "CROSSOVER_RATE": CROSSOVER_RATE,
+        "MUTATION_RATE": MUTATION_RATE,
+        "NUMBER_OF_GENERATIONS": NUMBER_OF_GENERATIONS,
+        "MIN_VALUE": MIN_VALUE,
+        "generate_population": PopulationGenerator.generate_eight_queen_vector,
+        "evaluate_population": LookupTableEvaluator(TABLE_PATH),
+        "stopping_criterion": StoppingCriteria.stop_eight_queen_vector_min,
+        "parent_selection_strategy": ParentSelector.select_parent_roulette_eight_queen_vector,
+        "crossover_strategy": CrossoverMethods.cut_point_eight_eight_queen_vector,
+        "mutation_strategy": Modifier.apply_bit_flip_eight_queen_vector,
+        "survivor_selection_strategy": SuvivorCriteria.elitist_replacement_eight_queen_vector,
+        "return_best_individual_and_score_function": getBestIndividual
+    }
+
+    print("\nTask, c) As 5 melhores soluções distintas encontradas:")
+
+    # As seeds são executadas em paralelo até aparecerem soluções de classes de simetria diferentes.
+    solutions, numberOfRuns = harvest_solutions(runArguments, NUMBER_OF_DISTINCT_SOLUTIONS, numberOfWorkers=numberOfWorkers, countImages=False)
+    for RANDOM_STATE, bestIndividual, endRound in solutions.values():
+        print(f"Melhor individuo: {bestIndividual} | Seed: {RANDOM_STATE} | Encontrado no round: {endRound}")
+    print(f"Execuções necessárias: {numberOfRuns}")
+
+    print("\nTask, b) A média e o desvio-padrão do número de iterações até a parada do algoritmo:")
+
+    from random import randint
+    from results_store import ResultsStore
+
+    numberOfExecutions = 5000
+    maxRandomState = 2**32
+    printRound = 50
+    resultsPath = "documentation/results"
+
+    with ResultsStore(resultsPath) as store:
+        # O plano é apagado quando a varredura termina, então um plano salvo significa que a execução anterior
+        # foi interrompida e é retomada de onde parou.
+        seeds = store.load_plan()
+        if seeds is None:
+            if store.count > 0:
+                print(f"{resultsPath} já tem {store.count} execuções de varreduras anteriores. A nova varredura é acrescentada a elas.")
+            # Seeds já usadas seriam consideradas concluídas por pending_seeds, então não entram no plano novo.
+            usedSeeds = store.completed_seeds()
+            seeds = []
+            while len(seeds) < numberOfExecutions:
+                seed = randint(0, maxRandomState)
+                if seed not in usedSeeds:
+                    seeds.append(seed)
+            store.save_plan(seeds)
+
+        roundCounter = store.count + 1
+        for RANDOM_STATE, bestIndividual, bestScore, endRound, executionTime in iterate_experiments(store.pending_seeds(seeds), runArguments, numberOfWorkers):
+            if roundCounter % printRound == 0:
+                print(f"Round: {roundCounter}")
+            roundCounter += 1
+
+            store.append(RANDOM_STATE, bestIndividual, bestScore, endRound, executionTime)
+
+        store.delete_plan()
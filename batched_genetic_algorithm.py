@@ -0,0 +1,199 @@
+import numpy as np
+
+from genetic_algorithm import PopulationAssessor
+
+# Esquema de aleatoriedade:
+# Cada execução recebe uma chave de 64 bits derivada de np.random.SeedSequence(RANDOM_STATE).
+# Todo número aleatório é obtido aplicando o hash SplitMix64 sobre (chave, round, fluxo, tentativa, índice),
+# ou seja, é um gerador baseado em contador. Assim o resultado de uma execução depende apenas
+# da sua seed, e não de quais outras execuções estão no mesmo lote ou de quando elas terminaram.
+STREAM_GENERATION = 0
+STREAM_SELECTION = 1
+STREAM_CROSSOVER = 2
+STREAM_CROSSOVER_POINT = 3
+STREAM_MUTATION = 4
+STREAM_MUTATION_POSITION = 5
+STREAM_RESELECTION = 6
+NUMBER_OF_STREAMS = 8
+
+GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+
+def splitmix64(values: np.ndarray) -> np.ndarray:
+    """
+    Aplica a função de mistura do SplitMix64 elemento a elemento.
+
+    Args:
+        values: Array de uint64.
+
+    Returns:
+        Array de uint64 com os valores embaralhados.
+    """
+    values = values + GOLDEN_GAMMA
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+def seed_keys(randomStates: list[int]) -> np.ndarray:
+    """
+    Deriva a chave de cada execução a partir da sua seed.
+
+    Args:
+        randomStates: Lista com as seeds das execuções.
+
+    Returns:
+        Array de uint64 com uma chave por execução.
+    """
+    return np.array([np.random.SeedSequence(randomState).generate_state(1, np.uint64)[0] for randomState in randomStates], dtype=np.uint64)
+
+def uniform(keys: np.ndarray, round: int, stream: int, shape: tuple[int, ...], attempt: int = 0) -> np.ndarray:
+    """
+    Gera números uniformes em [0, 1) para cada execução.
+
+    Args:
+        keys: Chaves das execuções, uma por linha do resultado.
+        round: Round atual da execução.
+        stream: Identificador do operador que consome os números.
+        shape: Formato dos números gerados para cada execução.
+        attempt: Número da tentativa, para operadores que sorteiam mais de uma vez no mesmo round.
+
+    Returns:
+        Array (len(keys), *shape) de floats.
+    """
+    counter = splitmix64(np.array([round], dtype=np.uint64)) ^ np.uint64(attempt * NUMBER_OF_STREAMS + stream)
+    counter = splitmix64(counter)
+    runKeys = splitmix64(keys ^ counter).reshape((-1,) + (1,) * len(shape))
+    index = np.arange(int(np.prod(shape)), dtype=np.uint64).reshape(shape)
+    values = splitmix64(runKeys + index * GOLDEN_GAMMA)
+    return (values >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+def run_batched(POPULATION_SIZE: int,
+                CROSSOVER_RATE: float,
+                MUTATION_RATE: float,
+                NUMBER_OF_GENERATIONS: int,
+                MIN_VALUE: int,
+                RANDOM_STATES: list[int],
+                NUMBER_OF_QUEENS: int = 8) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Executa várias instâncias independentes do algoritmo genético em conjunto, avançando todas uma geração por passo.
+
+    Usa a configuração da atividade: roleta, ponto de corte, bit flip e substituição elitista.
+    As execuções que atingem MIN_VALUE deixam de ser processadas.
+
+    Args:
+        POPULATION_SIZE: Tamanho da população de cada execução.
+        CROSSOVER_RATE: Taxa de cruzamento.
+        MUTATION_RATE: Taxa de mutação dos filhos.
+        NUMBER_OF_GENERATIONS: Número de gerações que serão criadas.
+        MIN_VALUE: O valor minimo da função de custo.
+        RANDOM_STATES: Lista com a seed de cada execução.
+        NUMBER_OF_QUEENS: Tamanho do tabuleiro.
+
+    Returns:
+        Os melhores indivíduos (R, NUMBER_OF_QUEENS), as suas pontuações (R,) e o round de parada de cada execução (R,).
+    """
+    numberOfRuns = len(RANDOM_STATES)
+    populationSize = POPULATION_SIZE
+    numberOfQueens = NUMBER_OF_QUEENS
+
+    bestIndividuals = np.zeros((numberOfRuns, numberOfQueens), dtype=np.int64)
+    bestScores = np.zeros(numberOfRuns, dtype=np.int64)
+    endRounds = np.full(numberOfRuns, NUMBER_OF_GENERATIONS, dtype=np.int64)
+
+    activeRuns = np.arange(numberOfRuns)
+    keys = seed_keys(RANDOM_STATES)
+
+    population = np.argsort(uniform(keys, 0, STREAM_GENERATION, (populationSize, numberOfQueens)), axis=2)
+    evaluates = evaluate_batch(population)
+
+    bitsPerGene = max(1, int(numberOfQueens - 1).bit_length())
+    flipMask = 1 << (bitsPerGene // 2)
+    columns = np.arange(numberOfQueens)
+    runOffset = np.arange(numberOfRuns)[:, None]
+
+    def finish(finishedMask: np.ndarray):
+        finishedRuns = activeRuns[finishedMask]
+        bestIndex = np.argmin(evaluates[finishedMask], axis=1)
+        bestIndividuals[finishedRuns] = population[finishedMask, bestIndex]
+        bestScores[finishedRuns] = evaluates[finishedMask, bestIndex]
+
+    for round in range(NUMBER_OF_GENERATIONS):
+        finishedMask = np.any(evaluates == MIN_VALUE, axis=1)
+        if finishedMask.any():
+            finish(finishedMask)
+            endRounds[activeRuns[finishedMask]] = round + 1
+            keep = ~finishedMask
+            activeRuns, keys, population, evaluates = activeRuns[keep], keys[keep], population[keep], evaluates[keep]
+        if activeRuns.size == 0:
+            break
+
+        numberOfActive = activeRuns.size
+        offset = runOffset[:numberOfActive]
+
+        # Seleção dos pais pela roleta, com 1 / pontuação como peso. Pontuações 0 ficam com toda a probabilidade.
+        zeroScores = evaluates == 0
+        with np.errstate(divide="ignore"):
+            weights = np.where(zeroScores.any(axis=1, keepdims=True), zeroScores, 1 / evaluates)
+        cumulativeProbabilities = np.cumsum(weights, axis=1) / weights.sum(axis=1, keepdims=True)
+        cumulativeProbabilities[:, -1] = 1.0
+        globalCumulative = (cumulativeProbabilities + offset).ravel()
+
+        def draw(randomNumbers: np.ndarray, rows: np.ndarray) -> np.ndarray:
+            selectedIndex = np.searchsorted(globalCumulative, randomNumbers + rows, side="right") - rows * populationSize
+            return np.minimum(selectedIndex, populationSize - 1)
+
+        selectedIndex = draw(uniform(keys, round, STREAM_SELECTION, (populationSize, 2)), offset[:, :, None])
+        firstSelectedIndex = selectedIndex[:, :, 0]
+        secondSelectedIndex = selectedIndex[:, :, 1]
+
+        attempt = 0
+        repeated = firstSelectedIndex == secondSelectedIndex
+        while repeated.any():
+            randomNumbers = uniform(keys, round, STREAM_RESELECTION, (populationSize,), attempt)
+            secondSelectedIndex = np.where(repeated, draw(randomNumbers, offset), secondSelectedIndex)
+            repeated = firstSelectedIndex == secondSelectedIndex
+            attempt += 1
+
+        firstParent = np.take_along_axis(population, firstSelectedIndex[:, :, None], axis=1)
+        secondParent = np.take_along_axis(population, secondSelectedIndex[:, :, None], axis=1)
+
+        # Cruzamento por ponto de corte. Os pares que não cruzam geram filhos inválidos, descartados na seleção.
+        crossed = uniform(keys, round, STREAM_CROSSOVER, (populationSize,)) < CROSSOVER_RATE
+        crossoverPoints = 1 + (uniform(keys, round, STREAM_CROSSOVER_POINT, (populationSize,)) * (numberOfQueens - 1)).astype(np.int64)
+        headMask = columns < crossoverPoints[:, :, None]
+        sons = np.stack((np.where(headMask, firstParent, secondParent),
+                         np.where(headMask, secondParent, firstParent)), axis=2).reshape(numberOfActive, 2 * populationSize, numberOfQueens)
+        validSons = np.repeat(crossed, 2, axis=1)
+
+        # Mutação bit flip em um gene sorteado.
+        mutated = uniform(keys, round, STREAM_MUTATION, (2 * populationSize,)) < MUTATION_RATE
+        genePositions = (uniform(keys, round, STREAM_MUTATION_POSITION, (2 * populationSize,)) * numberOfQueens).astype(np.int64)
+        geneMask = mutated[:, :, None] & (columns == genePositions[:, :, None])
+        sons = np.where(geneMask, (sons ^ flipMask) % numberOfQueens, sons)
+
+        sonsEvaluates = np.where(validSons, evaluate_batch(sons), np.iinfo(np.int64).max)
+
+        # Substituição elitista, mantendo a ordem estável entre geração antiga e filhos.
+        allIndividuals = np.concatenate((population, sons), axis=1)
+        allScores = np.concatenate((evaluates, sonsEvaluates), axis=1)
+        survivorIndex = np.argsort(allScores, axis=1, kind="stable")[:, :populationSize]
+        population = np.take_along_axis(allIndividuals, survivorIndex[:, :, None], axis=1)
+        evaluates = np.take_along_axis(allScores, survivorIndex, axis=1)
+
+    if activeRuns.size > 0:
+        finish(np.ones(activeRuns.size, dtype=bool))
+
+    return bestIndividuals, bestScores, endRounds
+
+def evaluate_batch(populations: np.ndarray) -> np.ndarray:
+    """
+    Avalia as populações de todas as execuções.
+
+    Args:
+        populations: Array (R, numberOfIndividuals, numberOfQueens).
+
+    Returns:
+        Array (R, numberOfIndividuals) com as pontuações.
+    """
+    numberOfRuns, numberOfIndividuals, numberOfQueens = populations.shape
+    evaluates = PopulationAssessor.evaluate_n_queen_histogram(populations.reshape(-1, numberOfQueens))
+    return evaluates.reshape(numberOfRuns, numberOfIndividuals)
@@ -0,0 +1,246 @@
+import argparse
+import json
+import os
+import platform
+import sys
+from functools import partial
+from time import perf_counter
+
+import numpy as np
+
+from genetic_algorithm import *
+from runner import run, getBestIndividual
+
+BASELINE_PATH = "documentation/benchmark_baseline.json"
+POPULATION_SIZES = [20, 1000, 10000]
+NUMBER_OF_QUEENS = [8, 32, 128]
+RANDOM_STATES = [41, 42, 769, 18, 27]
+END_TO_END_GENERATIONS = 100
+
+# Limites de N * n² para a família de listas, cujos laços em Python ficariam lentos demais nos maiores tamanhos.
+LIST_FAMILY_LIMIT = 100_000
+LIST_FAMILY_END_TO_END_LIMIT = 25_000
+
+FAMILIES = {
+    "vector": {
+        "generate_population": lambda numberOfIndividuals, randomState, numberOfQueens: PopulationGenerator.generate_n_queen_array(numberOfIndividuals, randomState, numberOfQueens).tolist(),
+        "evaluate_population": PopulationAssessor.evaluate_eight_queen_vector,
+        "stopping_criterion": StoppingCriteria.stop_eight_queen_vector_min,
+        "parent_selection_strategy": ParentSelector.select_parent_roulette_eight_queen_vector,
+        "crossover_strategy": CrossoverMethods.cut_point_eight_eight_queen_vector,
+        "mutation_strategy": Modifier.apply_bit_flip_eight_queen_vector,
+        "elitist_replacement": SuvivorCriteria.elitist_replacement_eight_queen_vector,
+        "random_switch_all_population": SuvivorCriteria.random_switch_all_population_eight_queen_vector,
+        "return_best_individual_and_score_function": getBestIndividual
+    },
+    "array": {
+        "generate_population": PopulationGenerator.generate_n_queen_array,
+        "evaluate_population": PopulationAssessor.evaluate_n_queen_histogram,
+        "stopping_criterion": StoppingCriteria.stop_queen_array_min,
+        "parent_selection_strategy": ParentSelector.select_parent_roulette_queen_array,
+        "crossover_strategy": CrossoverMethods.cut_point_queen_array,
+        "mutation_strategy": Modifier.apply_bit_flip_queen_array,
+        "elitist_replacement": SuvivorCriteria.elitist_replacement_queen_array,
+        "random_switch_all_population": SuvivorCriteria.random_switch_all_population_queen_array,
+        "return_best_individual_and_score_function": BestIndividualSelector.get_best_queen_array
+    },
+    "binary": {
+        "generate_population": PopulationGenerator.generate_queen_binary,
+        "evaluate_population": PopulationAssessor.evaluate_queen_binary,
+        "stopping_criterion": StoppingCriteria.stop_queen_array_min,
+        "parent_selection_strategy": ParentSelector.select_parent_roulette_queen_array,
+        "crossover_strategy": CrossoverMethods.cut_point_queen_binary,
+        "mutation_strategy": Modifier.apply_bit_flip_queen_binary,
+        "elitist_replacement": SuvivorCriteria.elitist_replacement_queen_array,
+        "random_switch_all_population": SuvivorCriteria.random_switch_all_population_queen_array,
+        "return_best_individual_and_score_function": BestIndividualSelector.get_best_queen_binary
+    }
+}
+
+# Operadores que precisam do tamanho do tabuleiro, que não pode ser deduzido dos indivíduos compactados.
+BOARD_SIZE_OPERATORS = {
+    "binary": ["evaluate_population", "crossover_strategy", "mutation_strategy", "return_best_individual_and_score_function"]
+}
+
+def get_family(familyName: str, numberOfQueens: int) -> dict:
+    """
+    Retorna os operadores de uma família com o tamanho do tabuleiro já fixado onde for necessário.
+
+    Args:
+        familyName: Nome da família em FAMILIES.
+        numberOfQueens: Tamanho do tabuleiro.
+
+    Returns:
+        Dicionário com os operadores da família.
+    """
+    family = dict(FAMILIES[familyName])
+    for name in BOARD_SIZE_OPERATORS.get(familyName, []):
+        family[name] = partial(family[name], numberOfQueens=numberOfQueens)
+    return family
+
+def measure(function, repeat: int, minimumTime: float = 0.05) -> float:
+    """
+    Mede o tempo de uma chamada, repetindo a medição e ficando com o menor valor.
+
+    Args:
+        function: Função sem argumentos que será medida.
+        repeat: Número de medições.
+        minimumTime: Tempo mínimo de cada medição, em segundos. Funções rápidas são chamadas várias vezes por medição.
+
+    Returns:
+        O tempo de uma chamada em segundos.
+    """
+    numberOfCalls = 1
+    while True:
+        startTime = perf_counter()
+        for _ in range(numberOfCalls):
+            function()
+        elapsed = perf_counter() - startTime
+        if elapsed >= minimumTime or numberOfCalls >= 1 << 20:
+            break
+        numberOfCalls *= 2
+
+    timings = [elapsed / numberOfCalls]
+    for _ in range(repeat - 1):
+        startTime = perf_counter()
+        for _ in range(numberOfCalls):
+            function()
+        timings.append((perf_counter() - startTime) / numberOfCalls)
+    return min(timings)
+
+def benchmark_operators(familyName: str, populationSize: int, numberOfQueens: int, repeat: int) -> dict[str, float]:
+    """
+    Mede cada operador de uma família para um tamanho de população e de tabuleiro.
+
+    Returns:
+        Dicionário com o tempo por chamada de cada operador.
+    """
+    family = get_family(familyName, numberOfQueens)
+    randomState = 0
+    round = 0
+
+    population = family["generate_population"](populationSize, randomState, numberOfQueens)
+    evaluates = family["evaluate_population"](population)
+    parents = family["parent_selection_strategy"](population, evaluates, round, randomState)
+    sons = family["crossover_strategy"](parents, 1.0, round, randomState)
+    # A mutação da família de listas altera a lista recebida, então cada chamada recebe uma cópia rasa.
+    sonsCopy = (lambda: list(sons)) if isinstance(sons, list) else (lambda: sons)
+    mutateSons = family["mutation_strategy"](sonsCopy(), 0.03, round, randomState)
+    sonsEvaluates = family["evaluate_population"](mutateSons)
+
+    operations = {
+        "generate_population": lambda: family["generate_population"](populationSize, randomState, numberOfQueens),
+        "evaluate_population": lambda: family["evaluate_population"](population),
+        "parent_selection_strategy": lambda: family["parent_selection_strategy"](population, evaluates, round, randomState),
+        "crossover_strategy": lambda: family["crossover_strategy"](parents, 0.8, round, randomState),
+        "mutation_strategy": lambda: family["mutation_strategy"](sonsCopy(), 0.03, round, randomState),
+        "elitist_replacement": lambda: family["elitist_replacement"](population, mutateSons, evaluates, sonsEvaluates, populationSize),
+        "random_switch_all_population": lambda: family["random_switch_all_population"](population, mutateSons, evaluates, sonsEvaluates, populationSize, round, randomState)
+    }
+
+    return {name: measure(operation, repeat) for name, operation in operations.items()}
+
+def benchmark_end_to_end(familyName: str, populationSize: int, numberOfQueens: int, repeat: int) -> float:
+    """
+    Mede run() com as seeds fixas de RANDOM_STATES por END_TO_END_GENERATIONS gerações.
+
+    MIN_VALUE é -1, então o critério de parada nunca é atendido e todas as execuções fazem o mesmo número de gerações.
+
+    Returns:
+        O tempo médio de uma execução em segundos.
+    """
+    family = get_family(familyName, numberOfQueens)
+    generate_population = lambda numberOfIndividuals, randomState: family["generate_population"](numberOfIndividuals, randomState, numberOfQueens)
+
+    def run_all():
+        for RANDOM_STATE in RANDOM_STATES:
+            run(populationSize, 0.8, 0.03, END_TO_END_GENERATIONS, -1, RANDOM_STATE,
+                generate_population = generate_population,
+                evaluate_population = family["evaluate_population"],
+                stopping_criterion = family["stopping_criterion"],
+                parent_selection_strategy = family["parent_selection_strategy"],
+                crossover_strategy = family["crossover_strategy"],
+                mutation_strategy = family["mutation_strategy"],
+                survivor_selection_strategy = family["elitist_replacement"],
+                return_best_individual_and_score_function = family["return_best_individual_and_score_function"])
+
+    return measure(run_all, repeat, minimumTime=0) / len(RANDOM_STATES)
+
+def run_benchmarks(populationSizes: list[int], numberOfQueens: list[int], families: list[str], repeat: int, endToEnd: bool) -> dict[str, float]:
+    """
+    Executa toda a grade de benchmarks.
+
+    Returns:
+        Dicionário com chaves "família/operador/N=.../n=..." e o tempo por chamada em segundos.
+    """
+    results = {}
+    for familyName in families:
+        for populationSize in populationSizes:
+            for queens in numberOfQueens:
+                if familyName == "vector" and populationSize * queens ** 2 > LIST_FAMILY_LIMIT:
+                    continue
+
+                print(f"{familyName} N={populationSize} n={queens}", file=sys.stderr)
+                for name, seconds in benchmark_operators(familyName, populationSize, queens, repeat).items():
+                    results[f"{familyName}/{name}/N={populationSize}/n={queens}"] = seconds
+                if endToEnd and (familyName != "vector" or populationSize * queens ** 2 <= LIST_FAMILY_END_TO_END_LIMIT):
+                    results[f"{familyName}/run/N={populationSize}/n={queens}"] = benchmark_end_to_end(familyName, populationSize, queens, repeat)
+    return results
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """
+    Compara os resultados com a linha de base e imprime uma tabela.
+
+    Args:
+        results: Tempos atuais.
+        baseline: Tempos da linha de base.
+        threshold: Aumento relativo tolerado, por exemplo 0.1 para 10%.
+
+    Returns:
+        Lista com as chaves que regrediram além do limite.
+    """
+    regressions = []
+    print(f"{'Benchmark':<60} | {'Base (µs)':>12} | {'Atual (µs)':>12} | {'Razão':>7}")
+    for key, seconds in results.items():
+        if key not in baseline:
+            print(f"{key:<60} | {'-':>12} | {seconds * 1e6:>12.2f} | {'-':>7}")
+            continue
+        ratio = seconds / baseline[key]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(key)
+            flag = " <- regressão"
+        print(f"{key:<60} | {baseline[key] * 1e6:>12.2f} | {seconds * 1e6:>12.2f} | {ratio:>7.3f}{flag}")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks dos operadores e de run().")
+    parser.add_argument("--populations", type=int, nargs="+", default=POPULATION_SIZES)
+    parser.add_argument("--queens", type=int, nargs="+", default=NUMBER_OF_QUEENS)
+    parser.add_argument("--families", nargs="+", default=list(FAMILIES), choices=list(FAMILIES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-end-to-end", action="store_true", help="Não mede run() de ponta a ponta.")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="Salva os resultados como a nova linha de base.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Aumento relativo tolerado antes de acusar regressão.")
+    arguments = parser.parse_args()
+
+    results = run_benchmarks(arguments.populations, arguments.queens, arguments.families, arguments.repeat, not arguments.no_end_to_end)
+
+    if arguments.save:
+        with open(arguments.baseline, "w", encoding="utf-8") as file:
+            json.dump({
+                "machine": {"python": platform.python_version(), "numpy": np.__version__, "processor": platform.processor() or platform.machine()},
+                "results": results
+            }, file, indent=4)
+        print(f"Linha de base salva em: {arguments.baseline}")
+    elif os.path.isfile(arguments.baseline):
+        with open(arguments.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, arguments.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) acima do limite de {arguments.threshold:.0%}.")
+            sys.exit(1)
+    else:
+        compare(results, {}, arguments.threshold)
+        print(f"\nNenhuma linha de base em {arguments.baseline}. Use --save para criar uma.")
@@ -0,0 +1,140 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import BuiltinFunctionType, FunctionType, MethodType
+from typing import Callable
+
+import numpy as np
+
+class ChunkedEvaluator:
+    """
+    Avalia populações muito grandes em blocos, limitando a memória dos intermediários da função de avaliação.
+
+    Os blocos são avaliados em um pool de threads e cada resultado é escrito direto na sua fatia de um único
+    array de saída, sem concatenação. O array de saída tem o tipo do resultado do primeiro bloco. O paralelismo só aparece com funções que liberam o GIL, como as vetorizadas
+    com numpy. Funções em Python puro, como evaluate_eight_queen_vector, continuam usando um núcleo.
+
+    Os blocos só vão para as threads se a função de avaliação puder ser chamada por várias threads ao mesmo tempo.
+    Funções são consideradas seguras, e objetos só quando têm o atributo threadSafe igual a True. Avaliadores com
+    estado, como CachedEvaluator e IncrementalEvaluator, não são seguros e são avaliados bloco a bloco na thread atual.
+
+    Pode ser passado diretamente como evaluate_population para run().
+    """
+    def __init__(self,
+                 evaluate_population: Callable,
+                 memoryBudget: int = 256 * 2**20,
+                 bytesPerIndividual: Callable[[int], int] = None,
+                 numberOfWorkers: int = None):
+        """
+        Args:
+            evaluate_population: A função de avaliação que será envolvida.
+            memoryBudget: Memória máxima, em bytes, para os intermediários de todos os blocos em avaliação ao mesmo tempo.
+            bytesPerIndividual: Função que recebe numberOfQueens e estima os bytes de intermediários por indivíduo.
+                None usa ChunkedEvaluator.pairwise_bytes, a estimativa de evaluate_queen_array.
+            numberOfWorkers: Número de threads. None usa todos os núcleos.
+        """
+        self.evaluate_population = evaluate_population
+        self.memoryBudget = memoryBudget
+        self.bytesPerIndividual = bytesPerIndividual if bytesPerIndividual is not None else ChunkedEvaluator.pairwise_bytes
+        self.numberOfWorkers = numberOfWorkers if numberOfWorkers is not None else (os.cpu_count() or 1)
+        self.executor = None
+
+    @staticmethod
+    def is_thread_safe(evaluate_population: Callable) -> bool:
+        """
+        Verifica se a função de avaliação pode ser chamada por várias threads ao mesmo tempo.
+
+        Args:
+            evaluate_population: A função de avaliação, possivelmente um partial ou um método de um objeto.
+
+        Returns:
+            True para funções e para objetos marcados com threadSafe = True.
+        """
+        while isinstance(evaluate_population, partial):
+            evaluate_population = evaluate_population.func
+        if isinstance(evaluate_population, MethodType):
+            return bool(getattr(evaluate_population.__self__, "threadSafe", False))
+        if isinstance(evaluate_population, (FunctionType, BuiltinFunctionType)):
+            return True
+        return bool(getattr(evaluate_population, "threadSafe", False))
+
+    @staticmethod
+    def pairwise_bytes(numberOfQueens: int) -> int:
+        """
+        Estima os intermediários de evaluate_queen_array: as diferenças e distâncias int64 e as máscaras booleanas (n, n)
+        de cada indivíduo, que somam 16 * n² bytes medidos com tracemalloc. O dobro disso cobre a memória que o
+        alocador de cada thread ainda não devolveu ao sistema.
+        """
+        return 2 * 16 * numberOfQueens * numberOfQueens
+
+    @staticmethod
+    def histogram_bytes(numberOfQueens: int) -> int:
+        """
+        Estima os intermediários de evaluate_n_queen_histogram: as chaves e a ocupação das diagonais de cada indivíduo,
+        que somam 48 * n bytes medidos com tracemalloc, com a mesma margem de pairwise_bytes.
+        """
+        return 2 * 48 * numberOfQueens
+
+    def chunk_size(self, numberOfQueens: int) -> int:
+        """
+        Calcula quantos indivíduos cabem em um bloco, dividindo o orçamento entre as threads.
+        """
+        return max(1, self.memoryBudget // (self.numberOfWorkers * max(1, self.bytesPerIndividual(numberOfQueens))))
+
+    def __call__(self, population: list[list[int]] | np.ndarray) -> list[int] | np.ndarray:
+        """
+        Avalia a população em blocos.
+
+        Args:
+            population: Lista ou array de indivíduos.
+
+        Returns:
+            A avaliação de cada indivíduo, no mesmo formato que a função original (lista ou array).
+        """
+        isArray = isinstance(population, np.ndarray)
+        numberOfIndividuals = len(population)
+        if numberOfIndividuals == 0:
+            return np.zeros(0, dtype=np.int64) if isArray else []
+
+        chunkSize = self.chunk_size(len(population[0]))
+        if numberOfIndividuals <= chunkSize:
+            return self.evaluate_population(population)
+
+        # O primeiro bloco define o tipo da saída, então pontuações reais não são truncadas.
+        firstEvaluates = np.asarray(self.evaluate_population(population[:chunkSize]))
+        evaluates = np.empty(numberOfIndividuals, dtype=firstEvaluates.dtype)
+        evaluates[:chunkSize] = firstEvaluates
+        del firstEvaluates
+
+        def evaluate_chunk(start: int):
+            end = min(start + chunkSize, numberOfIndividuals)
+            evaluates[start:end] = self.evaluate_population(population[start:end])
+
+        starts = range(chunkSize, numberOfIndividuals, chunkSize)
+        if self.numberOfWorkers == 1 or not ChunkedEvaluator.is_thread_safe(self.evaluate_population):
+            for start in starts:
+                evaluate_chunk(start)
+        else:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.numberOfWorkers)
+            # No máximo numberOfWorkers blocos são avaliados ao mesmo tempo, o que mantém a memória dentro do orçamento.
+            list(self.executor.map(evaluate_chunk, starts))
+
+        return evaluates if isArray else evaluates.tolist()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getstate__(self) -> dict:
+        # O pool de threads não pode ser enviado para outro processo, então o destino cria o seu.
+        state = self.__dict__.copy()
+        state["executor"] = None
+        return state
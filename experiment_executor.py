@@ -0,0 +1,89 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import time
+from typing import Iterator
+
+from runner import run
+
+def run_seed_chunk(seeds: list[int], runArguments: dict) -> list[tuple[int, list[int], int, int, float]]:
+    """
+    Executa o algoritmo genético em sequência para um bloco de seeds.
+
+    Args:
+        seeds: Lista de seeds do bloco.
+        runArguments: Argumentos de run(), exceto RANDOM_STATE, passados por nome.
+
+    Returns:
+        Uma lista com (seed, melhor indivíduo, pontuação, round de parada, tempo de execução) de cada seed.
+    """
+    results = []
+    for RANDOM_STATE in seeds:
+        startTime = time()
+        bestIndividual, bestScore, endRound = run(RANDOM_STATE=RANDOM_STATE, **runArguments)
+        results.append((RANDOM_STATE, bestIndividual, bestScore, endRound, time() - startTime))
+    return results
+
+def iterate_experiments(seeds: list[int],
+                        runArguments: dict,
+                        numberOfWorkers: int = None,
+                        chunkSize: int = None,
+                        ordered: bool = True) -> Iterator[tuple[int, list[int], int, int, float]]:
+    """
+    Distribui as seeds em blocos por um pool de processos e entrega os resultados assim que ficam prontos.
+
+    Args:
+        seeds: Lista de seeds, uma por execução.
+        runArguments: Argumentos de run(), exceto RANDOM_STATE, passados por nome. As funções precisam ser serializáveis.
+        numberOfWorkers: Número de processos. None usa todos os núcleos e 1 executa no processo atual.
+        chunkSize: Número de seeds por tarefa. None divide as seeds em cerca de 4 blocos por processo.
+        ordered: Se True, os resultados saem na ordem das seeds, assim que todos os anteriores estiverem prontos.
+            Se False, saem na ordem em que terminam.
+
+    Returns:
+        Um iterador de (seed, melhor indivíduo, pontuação, round de parada, tempo de execução).
+    """
+    seeds = list(seeds)
+    numberOfWorkers = numberOfWorkers if numberOfWorkers is not None else (os.cpu_count() or 1)
+
+    if numberOfWorkers == 1:
+        for RANDOM_STATE in seeds:
+            yield from run_seed_chunk([RANDOM_STATE], runArguments)
+        return
+
+    if chunkSize is None:
+        chunkSize = max(1, len(seeds) // (4 * numberOfWorkers))
+    chunks = [seeds[i:i + chunkSize] for i in range(0, len(seeds), chunkSize)]
+
+    with ProcessPoolExecutor(max_workers=numberOfWorkers) as executor:
+        futures = {executor.submit(run_seed_chunk, chunk, runArguments): chunkIndex for chunkIndex, chunk in enumerate(chunks)}
+
+        if not ordered:
+            for future in as_completed(futures):
+                yield from future.result()
+            return
+
+        pendingChunks = {}
+        nextChunk = 0
+        for future in as_completed(futures):
+            pendingChunks[futures[future]] = future.result()
+            while nextChunk in pendingChunks:
+                yield from pendingChunks.pop(nextChunk)
+                nextChunk += 1
+
+def run_experiments(seeds: list[int],
+                    runArguments: dict,
+                    numberOfWorkers: int = None,
+                    chunkSize: int = None) -> list[tuple[int, list[int], int, int, float]]:
+    """
+    Executa todas as seeds em paralelo e retorna os resultados na ordem das seeds.
+
+    Args:
+        seeds: Lista de seeds, uma por execução.
+        runArguments: Argumentos de run(), exceto RANDOM_STATE, passados por nome.
+        numberOfWorkers: Número de processos. None usa todos os núcleos.
+        chunkSize: Número de seeds por tarefa.
+
+    Returns:
+        Uma lista de (seed, melhor indivíduo, pontuação, round de parada, tempo de execução).
+    """
+    return list(iterate_experiments(seeds, runArguments, numberOfWorkers, chunkSize, ordered=True))
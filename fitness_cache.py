@@ -0,0 +1,111 @@
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+class CachedEvaluator:
+    """
+    Guarda a pontuação dos genótipos já avaliados, descartando os menos usados recentemente quando a capacidade é atingida.
+
+    Pode ser passado diretamente como evaluate_population para run().
+    """
+    # O cache e os contadores são alterados a cada chamada, sem trava.
+    threadSafe = False
+
+    def __init__(self, evaluate_population: Callable, capacity: int = 100000, keyDtype: type = None):
+        """
+        Args:
+            evaluate_population: A função de avaliação que será envolvida.
+            capacity: Número máximo de genótipos guardados.
+            keyDtype: Tipo inteiro usado para codificar cada gene na chave. None usa o tipo dos genes da primeira
+                população avaliada. Genes que não cabem no tipo geram ValueError em vez de chaves truncadas.
+        """
+        if capacity < 1:
+            raise ValueError("capacity deve ser pelo menos 1.")
+
+        self.evaluate_population = evaluate_population
+        self.capacity = capacity
+        self.keyDtype = keyDtype
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, population: list[list[int]] | np.ndarray) -> list[int] | np.ndarray:
+        """
+        Avalia a população, chamando a função original somente para os genótipos que não estão guardados.
+
+        Args:
+            population: Lista ou array de indivíduos.
+
+        Returns:
+            A avaliação de cada indivíduo, no mesmo formato que a função original (lista ou array).
+        """
+        isArray = isinstance(population, np.ndarray)
+        if len(population) == 0:
+            return np.zeros(0, dtype=np.int64) if isArray else []
+
+        keys = [row.tobytes() for row in self.genome_keys(population)]
+        evaluates = [None] * len(keys)
+        missingIndex = {}
+
+        for i, key in enumerate(keys):
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                evaluates[i] = self.cache[key]
+                self.hits += 1
+            elif key in missingIndex:
+                self.hits += 1
+            else:
+                missingIndex[key] = i
+                self.misses += 1
+
+        if missingIndex:
+            firstIndex = list(missingIndex.values())
+            missing = population[firstIndex] if isArray else [population[i] for i in firstIndex]
+            newEvaluates = self.evaluate_population(missing)
+
+            for key, evaluate in zip(missingIndex, newEvaluates):
+                self.cache[key] = evaluate
+                if len(self.cache) > self.capacity:
+                    self.cache.popitem(last=False)
+                    self.evictions += 1
+
+            computed = dict(zip(missingIndex, newEvaluates))
+            evaluates = [computed[key] if evaluate is None else evaluate for key, evaluate in zip(keys, evaluates)]
+
+        return np.asarray(evaluates) if isArray else evaluates
+
+    def genome_keys(self, population: list[list[int]] | np.ndarray) -> np.ndarray:
+        """
+        Converte os genes para o tipo das chaves, garantindo que genótipos diferentes nunca tenham a mesma chave.
+        """
+        genomes = np.asarray(population)
+        if self.keyDtype is None:
+            # O tipo fica fixo depois da primeira chamada, então os mesmos genes geram sempre os mesmos bytes.
+            self.keyDtype = genomes.dtype
+
+        keys = np.ascontiguousarray(genomes, dtype=self.keyDtype)
+        if not np.array_equal(keys, genomes):
+            raise ValueError(f"Os genes não cabem no tipo {np.dtype(self.keyDtype)} usado nas chaves do cache.")
+        return keys
+
+    def stats(self) -> dict[str, int]:
+        """
+        Retorna os contadores de acertos, falhas, descartes e o tamanho atual do cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.cache)
+        }
+
+    def clear(self):
+        """
+        Esvazia o cache e zera os contadores.
+        """
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
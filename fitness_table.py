@@ -0,0 +1,150 @@
+import json
+import os
+import sys
+
+import numpy as np
+
+from genetic_algorithm import PopulationAssessor
+
+TABLE_PATH = "documentation/collision_table.npy"
+
+def genome_keys(population: np.ndarray, numberOfQueens: int) -> np.ndarray:
+    """
+    Codifica cada indivíduo como um número em base numberOfQueens, com a primeira coluna como dígito mais significativo.
+
+    Args:
+        population: Array (numberOfIndividuals, numberOfQueens) com os indivíduos.
+        numberOfQueens: Tamanho do tabuleiro.
+
+    Returns:
+        Array int64 com a chave de cada indivíduo.
+    """
+    powers = numberOfQueens ** np.arange(numberOfQueens - 1, -1, -1, dtype=np.int64)
+    return np.asarray(population, dtype=np.int64) @ powers
+
+def metadata_path(path: str) -> str:
+    """
+    Retorna o caminho do metadata.json da tabela, que guarda o tamanho do tabuleiro e o modo de contagem.
+    """
+    return os.path.splitext(path)[0] + ".json"
+
+def build_collision_table(path: str = TABLE_PATH, numberOfQueens: int = 8, countRowConflicts: bool = False, chunkSize: int = 2**20):
+    """
+    Calcula o número de colisões de todos os genótipos possíveis e salva a tabela em um arquivo .npy.
+
+    A tabela tem numberOfQueens^numberOfQueens entradas uint8, indexadas por genome_keys, e é escrita em blocos
+    direto no arquivo, sem ficar inteira na memória. Para 8 rainhas são 16.7M entradas, ou 16 MiB.
+    O tamanho do tabuleiro e countRowConflicts são salvos em um .json ao lado da tabela, veja metadata_path.
+
+    Args:
+        path: Caminho do arquivo .npy.
+        numberOfQueens: Tamanho do tabuleiro.
+        countRowConflicts: Se True, também conta os pares de rainhas na mesma linha.
+        chunkSize: Número de genótipos avaliados por bloco.
+    """
+    numberOfGenomes = numberOfQueens**numberOfQueens
+    maxCollisions = numberOfQueens * (numberOfQueens - 1) // 2 * (2 if countRowConflicts else 1)
+    if maxCollisions > np.iinfo(np.uint8).max:
+        raise ValueError(f"O número de colisões não cabe em uint8 para {numberOfQueens} rainhas.")
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # A tabela é escrita em um arquivo temporário, então um arquivo com o nome final está sempre completo.
+    temporaryPath = path + ".tmp.npy"
+    table = np.lib.format.open_memmap(temporaryPath, mode="w+", dtype=np.uint8, shape=(numberOfGenomes,))
+    powers = numberOfQueens ** np.arange(numberOfQueens - 1, -1, -1, dtype=np.int64)
+
+    for start in range(0, numberOfGenomes, chunkSize):
+        keys = np.arange(start, min(start + chunkSize, numberOfGenomes), dtype=np.int64)
+        population = (keys[:, None] // powers) % numberOfQueens
+        table[start:start + keys.shape[0]] = PopulationAssessor.evaluate_n_queen_histogram(population, countRowConflicts)
+
+    table.flush()
+    del table
+
+    temporaryMetadataPath = metadata_path(path) + ".tmp"
+    with open(temporaryMetadataPath, "w", encoding="utf-8") as file:
+        json.dump({"numberOfQueens": numberOfQueens, "countRowConflicts": countRowConflicts}, file)
+    os.replace(temporaryMetadataPath, metadata_path(path))
+    os.replace(temporaryPath, path)
+
+class LookupTableEvaluator:
+    """
+    Avalia os indivíduos consultando a tabela de colisões pré-calculada, com uma única indexação para toda a população.
+
+    A tabela é aberta como np.memmap somente leitura, então todos os processos que a usam compartilham a mesma
+    cópia no cache de páginas do sistema. Ao ser enviado para outro processo, o avaliador leva só o caminho
+    do arquivo e abre a tabela de novo no destino.
+
+    Pode ser passado diretamente como evaluate_population para run().
+    """
+    # A avaliação só lê a tabela.
+    threadSafe = True
+
+    def __init__(self, path: str = TABLE_PATH, countRowConflicts: bool = False):
+        """
+        Args:
+            path: Caminho da tabela criada por build_collision_table.
+            countRowConflicts: Modo de contagem esperado. Uma tabela criada no outro modo gera ValueError.
+        """
+        self.path = path
+        self.countRowConflicts = countRowConflicts
+        self.open()
+
+    def open(self):
+        try:
+            with open(metadata_path(self.path), "r", encoding="utf-8") as file:
+                metadata = json.load(file)
+        except FileNotFoundError:
+            raise ValueError(f"{self.path} não tem o arquivo {metadata_path(self.path)}. Crie a tabela de novo com build_collision_table.") from None
+
+        if metadata["countRowConflicts"] != self.countRowConflicts:
+            raise ValueError(f"{self.path} foi criada com countRowConflicts={metadata['countRowConflicts']}, mas o avaliador usa {self.countRowConflicts}.")
+
+        self.table = np.load(self.path, mmap_mode="r")
+        self.numberOfQueens = metadata["numberOfQueens"]
+        if self.table.dtype != np.uint8 or self.table.shape != (self.numberOfQueens**self.numberOfQueens,):
+            raise ValueError(f"{self.path} não é uma tabela de colisões de {self.numberOfQueens} rainhas.")
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path, "countRowConflicts": self.countRowConflicts}
+
+    def __setstate__(self, state: dict):
+        self.path = state["path"]
+        self.countRowConflicts = state["countRowConflicts"]
+        self.open()
+
+    def __call__(self, population: list[list[int]] | np.ndarray) -> list[int] | np.ndarray:
+        """
+        Avalia a população.
+
+        Args:
+            population: Lista ou array (numberOfIndividuals, numberOfQueens) de indivíduos, com genes de 0 a numberOfQueens - 1.
+
+        Returns:
+            A avaliação de cada indivíduo, no mesmo formato que evaluate_eight_queen_vector (lista)
+            ou evaluate_queen_array (array), conforme a entrada.
+
+        Raises:
+            ValueError: Se os indivíduos não tiverem numberOfQueens genes entre 0 e numberOfQueens - 1.
+        """
+        isArray = isinstance(population, np.ndarray)
+        if len(population) == 0:
+            return np.zeros(0, dtype=np.int64) if isArray else []
+
+        # Um gene fora do intervalo levaria a chave para a entrada de outro genótipo, então é rejeitado.
+        genomes = np.asarray(population)
+        if genomes.ndim != 2 or genomes.shape[1] != self.numberOfQueens:
+            raise ValueError(f"A tabela avalia indivíduos de {self.numberOfQueens} genes, mas recebeu o formato {genomes.shape}.")
+        if genomes.min() < 0 or genomes.max() >= self.numberOfQueens:
+            raise ValueError(f"Os genes devem estar entre 0 e {self.numberOfQueens - 1}.")
+
+        evaluates = self.table[genome_keys(genomes, self.numberOfQueens)].astype(np.int64)
+        return evaluates if isArray else evaluates.tolist()
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else TABLE_PATH
+    build_collision_table(path)
+    print(f"Tabela de colisões salva em: {path}")
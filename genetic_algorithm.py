@@ -1,5 +1,95 @@
 import numpy as np
 
+from random_context import random_generator
+
+class BinaryEncoding:
+    """
+    Classe com os métodos da codificação binária compactada.
+
+    Cada gene ocupa ceil(log2(numberOfQueens)) bits e os genes são guardados em palavras uint32, sem que
+    um gene fique dividido entre duas palavras. Para 8 rainhas são 24 bits em uma única palavra.
+    """
+    WORD_BITS = 32
+
+    @staticmethod
+    def layout(numberOfQueens: int) -> tuple[int, int, int]:
+        """
+        Calcula a disposição dos genes nas palavras.
+
+        Args:
+            numberOfQueens: Tamanho do tabuleiro.
+
+        Returns:
+            O número de bits por gene, de genes por palavra e de palavras por indivíduo.
+        """
+        bitsPerGene = max(1, int(numberOfQueens - 1).bit_length())
+        genesPerWord = BinaryEncoding.WORD_BITS // bitsPerGene
+        numberOfWords = -(-numberOfQueens // genesPerWord)
+        return bitsPerGene, genesPerWord, numberOfWords
+
+    @staticmethod
+    def gene_offsets(numberOfQueens: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna a palavra e o deslocamento em bits de cada gene.
+        """
+        bitsPerGene, genesPerWord, _ = BinaryEncoding.layout(numberOfQueens)
+        genes = np.arange(numberOfQueens)
+        return genes // genesPerWord, ((genes % genesPerWord) * bitsPerGene).astype(np.uint32)
+
+    @staticmethod
+    def encode_queen_binary(population: np.ndarray) -> np.ndarray:
+        """
+        Compacta os indivíduos na codificação binária.
+
+        Args:
+            population: Array (numberOfIndividuals, numberOfQueens) com os indivíduos.
+
+        Returns:
+            Array uint32 (numberOfIndividuals, numberOfWords).
+        """
+        population = np.asarray(population)
+        numberOfIndividuals, numberOfQueens = population.shape
+        _, _, numberOfWords = BinaryEncoding.layout(numberOfQueens)
+        geneWords, geneShifts = BinaryEncoding.gene_offsets(numberOfQueens)
+
+        shifted = population.astype(np.uint32) << geneShifts
+        packed = np.zeros((numberOfIndividuals, numberOfWords), dtype=np.uint32)
+        for word in range(numberOfWords):
+            packed[:, word] = np.bitwise_or.reduce(shifted[:, geneWords == word], axis=1)
+        return packed
+
+    @staticmethod
+    def decode_queen_binary(packed: np.ndarray, numberOfQueens: int = 8) -> np.ndarray:
+        """
+        Expande a codificação binária para um gene por coluna.
+
+        Valores de gene fora do tabuleiro, possíveis quando numberOfQueens não é potência de 2, são reduzidos módulo numberOfQueens.
+
+        Args:
+            packed: Array uint32 (numberOfIndividuals, numberOfWords).
+            numberOfQueens: Tamanho do tabuleiro.
+
+        Returns:
+            Array (numberOfIndividuals, numberOfQueens) com os indivíduos.
+        """
+        bitsPerGene, _, _ = BinaryEncoding.layout(numberOfQueens)
+        geneWords, geneShifts = BinaryEncoding.gene_offsets(numberOfQueens)
+
+        genes = (np.asarray(packed)[:, geneWords] >> geneShifts) & np.uint32((1 << bitsPerGene) - 1)
+        return genes.astype(np.int64) % numberOfQueens
+
+    @staticmethod
+    def used_bits_mask(numberOfQueens: int) -> np.ndarray:
+        """
+        Retorna, para cada palavra, a máscara dos bits ocupados por genes.
+        """
+        bitsPerGene, _, numberOfWords = BinaryEncoding.layout(numberOfQueens)
+        geneWords, geneShifts = BinaryEncoding.gene_offsets(numberOfQueens)
+
+        masks = np.zeros(numberOfWords, dtype=np.uint32)
+        np.bitwise_or.at(masks, geneWords, np.uint32((1 << bitsPerGene) - 1) << geneShifts)
+        return masks
+
 class PopulationGenerator:
     """
     Classe com os métodos de geração da população.
@@ -17,24 +107,73 @@ class PopulationGenerator:
             Lista de indíviduos aleatórios utilizando a representação de vetor de 8 posições.
         """
         numberOfQueens = 8
-        rng = np.random.default_rng(randomState) if randomState is not None else np.random.default_rng()
+        rng = random_generator(randomState, "generation")
         return [rng.permutation(numberOfQueens).tolist() for _ in range(numberOfIndividuals)]
 
+    @staticmethod
+    def generate_eight_queen_array(numberOfIndividuals: int, randomState: int = None) -> np.ndarray:
+        """
+        Gera individuos para o problema das 8 rainhas em um único array.
+
+        Args:
+            numberOfIndividuals: Número de indíviduos que serão gerados.
+            randomState: Seed para reprodutibilidade.
+
+        Returns:
+            Array (numberOfIndividuals, 8) com uma permutação aleatória por linha.
+        """
+        return PopulationGenerator.generate_n_queen_array(numberOfIndividuals, randomState, numberOfQueens=8)
+
+    @staticmethod
+    def generate_n_queen_array(numberOfIndividuals: int, randomState: int = None, numberOfQueens: int = 8) -> np.ndarray:
+        """
+        Gera individuos para o problema das N rainhas.
+
+        Args:
+            numberOfIndividuals: Número de indíviduos que serão gerados.
+            randomState: Seed para reprodutibilidade.
+            numberOfQueens: Tamanho do tabuleiro, ou seja, o número de rainhas.
+
+        Returns:
+            Array (numberOfIndividuals, numberOfQueens) com uma permutação aleatória por linha.
+        """
+        rng = random_generator(randomState, "generation")
+        return np.argsort(rng.random((numberOfIndividuals, numberOfQueens)), axis=1)
+
+    @staticmethod
+    def generate_queen_binary(numberOfIndividuals: int, randomState: int = None, numberOfQueens: int = 8) -> np.ndarray:
+        """
+        Gera individuos na codificação binária compactada.
+
+        Args:
+            numberOfIndividuals: Número de indíviduos que serão gerados.
+            randomState: Seed para reprodutibilidade.
+            numberOfQueens: Tamanho do tabuleiro.
+
+        Returns:
+            Array uint32 (numberOfIndividuals, numberOfWords) com uma permutação aleatória por linha.
+        """
+        return BinaryEncoding.encode_queen_binary(PopulationGenerator.generate_n_queen_array(numberOfIndividuals, randomState, numberOfQueens))
+
 class PopulationAssessor:
     """
     Classe com os métodos de avaliação da população.
     """
     @staticmethod
-    def evaluate_eight_queen_vector(population: list[list[int]]) -> list[int]:
+    def evaluate_eight_queen_vector(population: list[list[int]], countRowConflicts: bool = False) -> list[int]:
         """
         Avalia calculando o número de colisões entre os individuos do problema das 8 rainhas.
         
         Args:
             population: Lista de indíviduos aleatórios utilizando a representação de vetor de 8 posições.
+            countRowConflicts: Se True, também conta os pares de rainhas na mesma linha.
         
         Returns:
             Lista contendo a avaliação de cada indíviduo.
         """
+        if len(population) == 0:
+            return []
+
         numberOfQueens = len(population[0])
         evaluates = []
 
@@ -44,9 +183,139 @@ class PopulationAssessor:
                 for column_second in range(column_first + 1, numberOfQueens):
                     if abs(column_first - column_second) == abs(individual[column_first] - individual[column_second]):
                         collisions += 1
+                    elif countRowConflicts and individual[column_first] == individual[column_second]:
+                        collisions += 1
             evaluates.append(collisions)
 
         return evaluates
+
+    @staticmethod
+    def evaluate_queen_array(population: np.ndarray, countRowConflicts: bool = False) -> np.ndarray:
+        """
+        Avalia toda a população de uma vez, contando as colisões nas diagonais.
+
+        Args:
+            population: Array (numberOfIndividuals, numberOfQueens) com os indivíduos.
+            countRowConflicts: Se True, também conta os pares de rainhas na mesma linha.
+
+        Returns:
+            Array com a avaliação de cada indíviduo.
+        """
+        population = np.asarray(population)
+        if population.shape[0] == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        numberOfQueens = population.shape[1]
+        columns = np.arange(numberOfQueens)
+        columnDistance = np.abs(columns[:, None] - columns[None, :])
+        upperTriangle = columns[:, None] < columns[None, :]
+
+        rowDistance = np.abs(population[:, :, None] - population[:, None, :])
+        collisions = (rowDistance == columnDistance) & upperTriangle
+        if countRowConflicts:
+            collisions |= (rowDistance == 0) & upperTriangle
+
+        return collisions.sum(axis=(1, 2))
+
+    @staticmethod
+    def evaluate_n_queen_histogram(population: np.ndarray, countRowConflicts: bool = False) -> np.ndarray:
+        """
+        Avalia toda a população em O(n) por indivíduo, contando quantas rainhas ocupam cada diagonal.
+
+        Cada diagonal com k rainhas contribui com k * (k - 1) / 2 pares em colisão, o que resulta
+        exatamente na mesma contagem de evaluate_eight_queen_vector.
+
+        Args:
+            population: Array (numberOfIndividuals, numberOfQueens) com os indivíduos.
+            countRowConflicts: Se True, também conta os pares de rainhas na mesma linha.
+
+        Returns:
+            Array com a avaliação de cada indíviduo.
+        """
+        population = np.asarray(population, dtype=np.int64)
+        numberOfIndividuals = population.shape[0]
+        if numberOfIndividuals == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        numberOfQueens = population.shape[1]
+        columns = np.arange(numberOfQueens)
+        individualOffset = np.arange(numberOfIndividuals)[:, None]
+
+        def count_pairs(lines: np.ndarray, numberOfLines: int) -> np.ndarray:
+            keys = (lines + individualOffset * numberOfLines).ravel()
+            occupancy = np.bincount(keys, minlength=numberOfIndividuals * numberOfLines).reshape(numberOfIndividuals, numberOfLines)
+            return (occupancy * (occupancy - 1) // 2).sum(axis=1)
+
+        numberOfDiagonals = 2 * numberOfQueens - 1
+        collisions = count_pairs(population - columns + (numberOfQueens - 1), numberOfDiagonals)
+        collisions += count_pairs(population + columns, numberOfDiagonals)
+
+        if countRowConflicts:
+            collisions += count_pairs(population, numberOfQueens)
+
+        return collisions
+
+    @staticmethod
+    def evaluate_changed_genes_queen_array(original: np.ndarray,
+                                           originalEvaluates: np.ndarray,
+                                           modified: np.ndarray,
+                                           changedPositions: np.ndarray,
+                                           changedMask: np.ndarray,
+                                           countRowConflicts: bool = False) -> np.ndarray:
+        """
+        Atualiza a avaliação de indivíduos que tiveram apenas alguns genes alterados.
+
+        Somente os pares que envolvem um gene alterado são recontados, então o custo é O(k * n)
+        para k genes alterados, em vez de O(n²) da avaliação completa.
+
+        Args:
+            original: Array (m, numberOfQueens) com os indivíduos antes da alteração.
+            originalEvaluates: Array (m,) com a avaliação dos indivíduos originais.
+            modified: Array (m, numberOfQueens) com os indivíduos depois da alteração.
+            changedPositions: Array (m, k) com as colunas alteradas de cada indivíduo, sem repetições.
+            changedMask: Array (m, k) indicando quais entradas de changedPositions são válidas.
+            countRowConflicts: Se True, também conta os pares de rainhas na mesma linha. Precisa ser o mesmo
+                modo usado em originalEvaluates.
+
+        Returns:
+            Array (m,) com a avaliação dos indivíduos alterados.
+        """
+        original = np.asarray(original)
+        changedPositions = np.asarray(changedPositions)
+        changedMask = np.asarray(changedMask, dtype=bool)
+        columns = np.arange(original.shape[1])
+
+        def involved_collisions(individuals: np.ndarray) -> np.ndarray:
+            values = np.take_along_axis(individuals, changedPositions, axis=1)
+
+            columnDistance = np.abs(changedPositions[:, :, None] - columns)
+            rowDistance = np.abs(values[:, :, None] - individuals[:, None, :])
+            conflicts = (columnDistance == rowDistance) | (rowDistance == 0) if countRowConflicts else columnDistance == rowDistance
+            collisions = conflicts & (columnDistance > 0) & changedMask[:, :, None]
+
+            # Pares com as duas colunas alteradas foram contados duas vezes.
+            pairColumnDistance = np.abs(changedPositions[:, :, None] - changedPositions[:, None, :])
+            pairRowDistance = np.abs(values[:, :, None] - values[:, None, :])
+            pairConflicts = (pairColumnDistance == pairRowDistance) | (pairRowDistance == 0) if countRowConflicts else pairColumnDistance == pairRowDistance
+            repeated = pairConflicts & (pairColumnDistance > 0) & changedMask[:, :, None] & changedMask[:, None, :]
+
+            return collisions.sum(axis=(1, 2)) - repeated.sum(axis=(1, 2)) // 2
+
+        return np.asarray(originalEvaluates) - involved_collisions(original) + involved_collisions(np.asarray(modified))
+
+    @staticmethod
+    def evaluate_queen_binary(population: np.ndarray, numberOfQueens: int = 8) -> np.ndarray:
+        """
+        Avalia indivíduos na codificação binária compactada.
+
+        Args:
+            population: Array uint32 (numberOfIndividuals, numberOfWords).
+            numberOfQueens: Tamanho do tabuleiro.
+
+        Returns:
+            Array com a avaliação de cada indíviduo.
+        """
+        return PopulationAssessor.evaluate_n_queen_histogram(BinaryEncoding.decode_queen_binary(population, numberOfQueens))
     
 class StoppingCriteria:
     """
@@ -64,7 +333,36 @@ class StoppingCriteria:
             True ou False.
         """
         return True if minValue in evaluates else False
-    
+
+    @staticmethod
+    def stop_queen_array_min(evaluates: np.ndarray, minValue: int) -> bool:
+        """
+        Verifica se o critério de parada foi atendido.
+
+        Args:
+            evaluates: Array com as pontuações dos indivíduos.
+
+        Returns:
+            True ou False.
+        """
+        return bool(np.any(np.asarray(evaluates) == minValue))
+
+    @staticmethod
+    def population_diversity(population: list[list[int]] | np.ndarray) -> float:
+        """
+        Calcula a fração de genótipos distintos da população com uma única passada por um conjunto de hashes.
+
+        Args:
+            population: Lista ou array de indivíduos.
+
+        Returns:
+            Número de genótipos distintos dividido pelo tamanho da população.
+        """
+        if len(population) == 0:
+            return 0.0
+        genomes = np.ascontiguousarray(np.asarray(population))
+        return len({genome.tobytes() for genome in genomes}) / len(genomes)
+
 class ParentSelector:
     """
     Classe com os métodos de seleção de pais.
@@ -83,14 +381,10 @@ class ParentSelector:
         Returns:
             Uma lista com os pares de indivíduos selecionados.
         """
-        if randomState is not None:
-            dynamicSeed = hash((randomState, round)) % (2**32)
-            rng = np.random.default_rng(dynamicSeed)
-        else: 
-            rng = np.random.default_rng()
+        rng = random_generator(randomState, "selection", round)
 
         numberOfIndividuals = len(population)
-        evaluates = 1 / np.array(evaluates)
+        evaluates = ParentSelector.fitness_weights(evaluates)
         choiceProbabilities = np.array(evaluates)/sum(evaluates)
 
         cumulativeProbabilities = np.cumsum(choiceProbabilities)
@@ -107,7 +401,7 @@ class ParentSelector:
             secondSelectedIndex = np.searchsorted(cumulativeProbabilities, secondRandomNumber, side="right")
             secondSelectedIndex = min(secondSelectedIndex, numberOfIndividuals - 1)
 
-            while firstSelectedIndex == secondSelectedIndex:
+            while firstSelectedIndex == secondSelectedIndex and np.count_nonzero(evaluates) > 1:
                 secondRandomNumber = rng.random()
                 secondSelectedIndex = np.searchsorted(cumulativeProbabilities, secondRandomNumber, side="right")
                 secondSelectedIndex = min(secondSelectedIndex, numberOfIndividuals - 1)
@@ -115,6 +409,230 @@ class ParentSelector:
             selectedPairs.append((population[firstSelectedIndex], population[secondSelectedIndex]))
             
         return selectedPairs
+
+    @staticmethod
+    def select_parent_roulette_queen_array(population: np.ndarray, evaluates: np.ndarray, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Seleciona os indivíduos que irão reproduzir, sorteando todos os pares de uma vez.
+
+        Args:
+            population: Array (numberOfIndividuals, numberOfQueens) com os indivíduos.
+            evaluates: Array com as pontuações dos indivíduos.
+            round: Round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            Array (numberOfIndividuals, 2, numberOfQueens) com os pares de indivíduos selecionados.
+        """
+        population = np.asarray(population)
+        return population[ParentSelector.select_parent_index_roulette_queen_array(evaluates, round, randomState)]
+
+    @staticmethod
+    def select_parent_tournament_queen_array(population: np.ndarray, evaluates: np.ndarray, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Seleciona os indivíduos que irão reproduzir por torneios de 3 indivíduos.
+
+        Args:
+            population: Array (numberOfIndividuals, numberOfQueens) com os indivíduos.
+            evaluates: Array com as pontuações dos indivíduos.
+            round: Round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            Array (numberOfIndividuals, 2, numberOfQueens) com os pares de indivíduos selecionados.
+        """
+        population = np.asarray(population)
+        return population[ParentSelector.select_parent_index_tournament_queen_array(evaluates, round, randomState)]
+
+    @staticmethod
+    def select_parent_stochastic_universal_queen_array(population: np.ndarray, evaluates: np.ndarray, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Seleciona os indivíduos que irão reproduzir por amostragem universal estocástica.
+
+        Args:
+            population: Array (numberOfIndividuals, numberOfQueens) com os indivíduos.
+            evaluates: Array com as pontuações dos indivíduos.
+            round: Round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            Array (numberOfIndividuals, 2, numberOfQueens) com os pares de indivíduos selecionados.
+        """
+        population = np.asarray(population)
+        return population[ParentSelector.select_parent_index_stochastic_universal_queen_array(evaluates, round, randomState)]
+
+    @staticmethod
+    def fitness_weights(evaluates: np.ndarray, transform: str = "inverse") -> np.ndarray:
+        """
+        Converte as pontuações, em que menor é melhor, em pesos de seleção sem divisão por zero.
+
+        Args:
+            evaluates: Array com as pontuações dos indivíduos.
+            transform: "inverse" usa 1 / pontuação e, se houver pontuações 0, só esses indivíduos recebem peso.
+                "shifted_inverse" usa 1 / (1 + pontuação). "rank" dá peso N ao melhor e 1 ao pior.
+
+        Returns:
+            Array com o peso de cada indivíduo.
+        """
+        evaluates = np.asarray(evaluates, dtype=np.float64)
+
+        if transform == "inverse":
+            if np.any(evaluates == 0):
+                return (evaluates == 0).astype(np.float64)
+            return 1 / evaluates
+        if transform == "shifted_inverse":
+            return 1 / (1 + evaluates)
+        if transform == "rank":
+            ranks = np.empty(evaluates.shape[0], dtype=np.float64)
+            ranks[np.argsort(evaluates, kind="stable")] = np.arange(evaluates.shape[0], 0, -1)
+            return ranks
+
+        raise ValueError(f"Transformação desconhecida: {transform}.")
+
+    @staticmethod
+    def draw_distinct_partner(cumulativeProbabilities: np.ndarray, firstSelectedIndex: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """
+        Sorteia pela roleta um parceiro para cada índice, excluindo o próprio índice da roleta.
+
+        O número sorteado é reduzido ao intervalo sem a fatia do primeiro pai e depois deslocado por cima dela,
+        o que dá exatamente a distribuição condicional em uma única passada. Se o primeiro pai tem todo o peso
+        da roleta, o parceiro é sorteado uniformemente entre os outros indivíduos.
+
+        Args:
+            cumulativeProbabilities: Probabilidades acumuladas da roleta.
+            firstSelectedIndex: Array com o índice do primeiro pai de cada par.
+            rng: Gerador de números aleatórios.
+
+        Returns:
+            Array com o índice do segundo pai de cada par.
+        """
+        numberOfIndividuals = cumulativeProbabilities.shape[0]
+        probabilities = np.diff(cumulativeProbabilities, prepend=0.0)
+        firstProbability = probabilities[firstSelectedIndex]
+        firstStart = cumulativeProbabilities[firstSelectedIndex] - firstProbability
+
+        randomNumbers = rng.random(size=firstSelectedIndex.shape) * (1 - firstProbability)
+        randomNumbers = np.where(randomNumbers >= firstStart, randomNumbers + firstProbability, randomNumbers)
+        secondSelectedIndex = np.minimum(np.searchsorted(cumulativeProbabilities, randomNumbers, side="right"), numberOfIndividuals - 1)
+
+        # Sem peso fora do primeiro pai a redução acima sempre cai no último índice, então esses pares, e os
+        # arredondamentos na borda da fatia excluída, sorteiam um outro indivíduo qualquer.
+        uniform = (secondSelectedIndex == firstSelectedIndex) | (firstProbability >= 1 - 1e-12)
+        if np.any(uniform) and numberOfIndividuals > 1:
+            shift = 1 + rng.integers(0, numberOfIndividuals - 1, size=np.count_nonzero(uniform))
+            secondSelectedIndex[uniform] = (firstSelectedIndex[uniform] + shift) % numberOfIndividuals
+
+        return secondSelectedIndex
+
+    @staticmethod
+    def select_parent_index_roulette_queen_array(evaluates: np.ndarray, round: int, randomState: int = None, numberOfPairs: int = None, transform: str = "inverse") -> np.ndarray:
+        """
+        Sorteia pela roleta os índices dos pares de pais, sem repetir o mesmo indivíduo dentro de um par.
+
+        Args:
+            evaluates: Array com as pontuações dos indivíduos.
+            round: Round atual da execução.
+            randomState: É o estado definido para a execução.
+            numberOfPairs: Número de pares. None usa o tamanho da população.
+            transform: Transformação das pontuações em pesos, veja fitness_weights.
+
+        Returns:
+            Array (numberOfPairs, 2) com os índices dos pares selecionados.
+        """
+        rng = random_generator(randomState, "selection", round)
+
+        weights = ParentSelector.fitness_weights(evaluates, transform)
+        numberOfIndividuals = weights.shape[0]
+        numberOfPairs = numberOfIndividuals if numberOfPairs is None else numberOfPairs
+        cumulativeProbabilities = np.cumsum(weights / weights.sum())
+
+        firstSelectedIndex = np.searchsorted(cumulativeProbabilities, rng.random(size=numberOfPairs), side="right")
+        firstSelectedIndex = np.minimum(firstSelectedIndex, numberOfIndividuals - 1)
+        secondSelectedIndex = ParentSelector.draw_distinct_partner(cumulativeProbabilities, firstSelectedIndex, rng)
+
+        return np.stack((firstSelectedIndex, secondSelectedIndex), axis=1)
+
+    @staticmethod
+    def select_parent_index_stochastic_universal_queen_array(evaluates: np.ndarray, round: int, randomState: int = None, numberOfPairs: int = None, transform: str = "inverse") -> np.ndarray:
+        """
+        Sorteia os índices dos pares por amostragem universal estocástica: 2 * numberOfPairs ponteiros igualmente
+        espaçados a partir de um único número aleatório, embaralhados em pares depois.
+
+        Pares com o mesmo indivíduo duas vezes trocam o segundo pai com o de outro par, então cada indivíduo
+        continua aparecendo exatamente o número de vezes dado pelos ponteiros. Só quando um indivíduo ocupa
+        mais da metade dos ponteiros as trocas não bastam, e o parceiro que falta é sorteado pela roleta.
+
+        Args:
+            evaluates: Array com as pontuações dos indivíduos.
+            round: Round atual da execução.
+            randomState: É o estado definido para a execução.
+            numberOfPairs: Número de pares. None usa o tamanho da população.
+            transform: Transformação das pontuações em pesos, veja fitness_weights.
+
+        Returns:
+            Array (numberOfPairs, 2) com os índices dos pares selecionados.
+        """
+        rng = random_generator(randomState, "selection", round)
+
+        weights = ParentSelector.fitness_weights(evaluates, transform)
+        numberOfIndividuals = weights.shape[0]
+        numberOfPairs = numberOfIndividuals if numberOfPairs is None else numberOfPairs
+        cumulativeProbabilities = np.cumsum(weights / weights.sum())
+
+        numberOfPointers = 2 * numberOfPairs
+        pointers = (rng.random() + np.arange(numberOfPointers)) / numberOfPointers
+        selectedIndex = np.minimum(np.searchsorted(cumulativeProbabilities, pointers, side="right"), numberOfIndividuals - 1)
+        selectedIndex = rng.permutation(selectedIndex).reshape(numberOfPairs, 2)
+
+        for value in np.unique(selectedIndex[selectedIndex[:, 0] == selectedIndex[:, 1], 0]):
+            repeated = np.flatnonzero((selectedIndex[:, 0] == value) & (selectedIndex[:, 1] == value))
+            candidates = np.flatnonzero((selectedIndex[:, 0] != value) & (selectedIndex[:, 1] != value))
+            numberOfSwaps = min(repeated.shape[0], candidates.shape[0])
+            partners = rng.choice(candidates, size=numberOfSwaps, replace=False)
+            selectedIndex[repeated[:numberOfSwaps], 1], selectedIndex[partners, 1] = selectedIndex[partners, 1], value
+
+            remaining = repeated[numberOfSwaps:]
+            selectedIndex[remaining, 1] = ParentSelector.draw_distinct_partner(cumulativeProbabilities, selectedIndex[remaining, 0], rng)
+
+        return selectedIndex
+
+    @staticmethod
+    def select_parent_index_tournament_queen_array(evaluates: np.ndarray, round: int, randomState: int = None, numberOfPairs: int = None, tournamentSize: int = 3) -> np.ndarray:
+        """
+        Sorteia os índices dos pares por torneio: cada pai é o de menor pontuação entre tournamentSize sorteados.
+
+        O torneio do segundo pai sorteia apenas entre os indivíduos diferentes do primeiro.
+
+        Args:
+            evaluates: Array com as pontuações dos indivíduos.
+            round: Round atual da execução.
+            randomState: É o estado definido para a execução.
+            numberOfPairs: Número de pares. None usa o tamanho da população.
+            tournamentSize: Número de participantes de cada torneio.
+
+        Returns:
+            Array (numberOfPairs, 2) com os índices dos pares selecionados.
+        """
+        rng = random_generator(randomState, "selection", round)
+
+        evaluates = np.asarray(evaluates)
+        numberOfIndividuals = evaluates.shape[0]
+        numberOfPairs = numberOfIndividuals if numberOfPairs is None else numberOfPairs
+
+        def tournament_winner(contestants: np.ndarray) -> np.ndarray:
+            winner = np.argmin(evaluates[contestants], axis=1)
+            return np.take_along_axis(contestants, winner[:, None], axis=1)[:, 0]
+
+        firstSelectedIndex = tournament_winner(rng.integers(0, numberOfIndividuals, size=(numberOfPairs, tournamentSize)))
+
+        if numberOfIndividuals == 1:
+            return np.stack((firstSelectedIndex, firstSelectedIndex), axis=1)
+
+        contestants = rng.integers(0, numberOfIndividuals - 1, size=(numberOfPairs, tournamentSize))
+        contestants += contestants >= firstSelectedIndex[:, None]
+        secondSelectedIndex = tournament_winner(contestants)
+
+        return np.stack((firstSelectedIndex, secondSelectedIndex), axis=1)
     
 class CrossoverMethods:
     """
@@ -141,11 +659,7 @@ class CrossoverMethods:
             second_son = secondParent[:crossover_point] + firstParent[crossover_point:]
             return [first_son, second_son]
 
-        if randomState is not None:
-            dynamicSeed = hash((randomState, round)) % (2**32)
-            rng = np.random.default_rng(dynamicSeed)
-        else:
-            rng = np.random.default_rng()
+        rng = random_generator(randomState, "crossover", round)
 
         sons = []
         numberOfPairs = len(parents)
@@ -158,6 +672,201 @@ class CrossoverMethods:
                 sons.append(temporarySons[1])
 
         return sons
+
+    @staticmethod
+    def cut_point_queen_array(parents: np.ndarray, crossoverRate: float, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Reprodução entre os indivíduos utilizando a técnica ponto de corte, aplicada a todos os pares de uma vez.
+
+        Args:
+            parents: Array (numberOfPairs, 2, numberOfQueens) com os pares selecionados para reprodução.
+            crossoverRate: Taxa de cruzamento entre os indivíduos.
+            round: É o round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            Array (2 * numberOfCrossovers, numberOfQueens) com os filhos gerados.
+        """
+        sons, _, _ = CrossoverMethods.cut_point_with_changes_queen_array(parents, crossoverRate, round, randomState)
+        return sons
+
+    @staticmethod
+    def cut_point_with_changes_queen_array(parents: np.ndarray, crossoverRate: float, round: int, randomState: int = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Igual a cut_point_queen_array, mas também informa quais pares cruzaram e em qual ponto.
+
+        O filho 2i recebe a cabeça do primeiro pai do par crossedPairs[i] e o filho 2i + 1 a do segundo,
+        ambos cortados em crossoverPoints[i].
+
+        Args:
+            parents: Array (numberOfPairs, 2, numberOfQueens) com os pares selecionados para reprodução.
+            crossoverRate: Taxa de cruzamento entre os indivíduos.
+            round: É o round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            Os filhos gerados, os índices dos pares que cruzaram e o ponto de corte de cada um deles.
+        """
+        rng = random_generator(randomState, "crossover", round)
+
+        parents = np.asarray(parents)
+        numberOfPairs, _, numberOfQueens = parents.shape
+
+        crossedPairs = np.flatnonzero(rng.random(size=numberOfPairs) < crossoverRate)
+        selectedPairs = parents[crossedPairs]
+        crossoverPoints = rng.integers(1, numberOfQueens, size=crossedPairs.size)
+        headMask = np.arange(numberOfQueens)[None, :] < crossoverPoints[:, None]
+
+        firstParent = selectedPairs[:, 0]
+        secondParent = selectedPairs[:, 1]
+        firstSon = np.where(headMask, firstParent, secondParent)
+        secondSon = np.where(headMask, secondParent, firstParent)
+
+        return np.stack((firstSon, secondSon), axis=1).reshape(-1, numberOfQueens), crossedPairs, crossoverPoints
+
+    @staticmethod
+    def segment_points(rng: np.random.Generator, numberOfIndividuals: int, numberOfQueens: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Sorteia um segmento [início, fim) não vazio para cada indivíduo.
+
+        Returns:
+            Arrays com o início e o fim de cada segmento.
+        """
+        start = rng.integers(0, numberOfQueens, size=numberOfIndividuals)
+        end = rng.integers(start + 1, numberOfQueens + 1)
+        return start, end
+
+    @staticmethod
+    def order_crossover_queen_array(parents: np.ndarray, crossoverRate: float, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Reprodução por cruzamento de ordem (OX), aplicada a todos os pares de uma vez, que mantém os filhos como permutações.
+
+        Cada filho copia um segmento de um dos pais e completa as demais posições, a partir do fim do segmento,
+        com os genes que faltam na ordem em que aparecem no outro pai.
+
+        Args:
+            parents: Array (numberOfPairs, 2, numberOfQueens) com os pares selecionados para reprodução.
+            crossoverRate: Taxa de cruzamento entre os indivíduos.
+            round: É o round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            Array (2 * numberOfCrossovers, numberOfQueens) com os filhos gerados.
+        """
+        rng = random_generator(randomState, "crossover", round)
+
+        parents = np.asarray(parents)
+        numberOfPairs, _, numberOfQueens = parents.shape
+
+        selectedPairs = parents[rng.random(size=numberOfPairs) < crossoverRate]
+        start, end = CrossoverMethods.segment_points(rng, selectedPairs.shape[0], numberOfQueens)
+
+        def order_son(segmentParent: np.ndarray, orderParent: np.ndarray) -> np.ndarray:
+            positions = np.arange(numberOfQueens)
+            segmentMask = (positions >= start[:, None]) & (positions < end[:, None])
+            valueInSegment = np.zeros(segmentParent.shape, dtype=bool)
+            valueInSegment[np.nonzero(segmentMask)[0], segmentParent[segmentMask]] = True
+
+            # As posições e os genes do outro pai são percorridos a partir do fim do segmento, dando a volta no vetor.
+            rotated = (end[:, None] + positions) % numberOfQueens
+            orderValues = np.take_along_axis(orderParent, rotated, axis=1)
+            missingValues = ~np.take_along_axis(valueInSegment, orderValues, axis=1)
+            freePositions = ~np.take_along_axis(segmentMask, rotated, axis=1)
+
+            son = np.where(segmentMask, segmentParent, 0)
+            son[np.nonzero(freePositions)[0], rotated[freePositions]] = orderValues[missingValues]
+            return son
+
+        firstSon = order_son(selectedPairs[:, 0], selectedPairs[:, 1])
+        secondSon = order_son(selectedPairs[:, 1], selectedPairs[:, 0])
+        return np.stack((firstSon, secondSon), axis=1).reshape(-1, numberOfQueens)
+
+    @staticmethod
+    def partially_mapped_crossover_queen_array(parents: np.ndarray, crossoverRate: float, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Reprodução por cruzamento parcialmente mapeado (PMX), aplicada a todos os pares de uma vez, que mantém os filhos como permutações.
+
+        Cada filho copia um segmento de um dos pais e as demais posições do outro. Um gene de fora do segmento
+        que já apareceu no segmento é trocado pelo gene correspondente do mapeamento entre os dois segmentos,
+        até deixar de se repetir.
+
+        Args:
+            parents: Array (numberOfPairs, 2, numberOfQueens) com os pares selecionados para reprodução.
+            crossoverRate: Taxa de cruzamento entre os indivíduos.
+            round: É o round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            Array (2 * numberOfCrossovers, numberOfQueens) com os filhos gerados.
+        """
+        rng = random_generator(randomState, "crossover", round)
+
+        parents = np.asarray(parents)
+        numberOfPairs, _, numberOfQueens = parents.shape
+
+        selectedPairs = parents[rng.random(size=numberOfPairs) < crossoverRate]
+        start, end = CrossoverMethods.segment_points(rng, selectedPairs.shape[0], numberOfQueens)
+
+        def mapped_son(segmentParent: np.ndarray, otherParent: np.ndarray) -> np.ndarray:
+            positions = np.arange(numberOfQueens)
+            segmentMask = (positions >= start[:, None]) & (positions < end[:, None])
+            segmentRows = np.nonzero(segmentMask)[0]
+
+            # mapping[i, v] é o gene que substitui v: o gene do outro pai na posição em que v está no segmento.
+            mapping = np.tile(positions, (segmentParent.shape[0], 1))
+            mapping[segmentRows, segmentParent[segmentMask]] = otherParent[segmentMask]
+            valueInSegment = np.zeros(segmentParent.shape, dtype=bool)
+            valueInSegment[segmentRows, segmentParent[segmentMask]] = True
+
+            son = np.where(segmentMask, segmentParent, otherParent)
+            repeated = ~segmentMask & np.take_along_axis(valueInSegment, son, axis=1)
+            # Cada passo avança uma posição nas cadeias do mapeamento, que têm no máximo o tamanho do segmento.
+            while np.any(repeated):
+                son = np.where(repeated, np.take_along_axis(mapping, son, axis=1), son)
+                repeated = ~segmentMask & np.take_along_axis(valueInSegment, son, axis=1)
+            return son
+
+        firstSon = mapped_son(selectedPairs[:, 0], selectedPairs[:, 1])
+        secondSon = mapped_son(selectedPairs[:, 1], selectedPairs[:, 0])
+        return np.stack((firstSon, secondSon), axis=1).reshape(-1, numberOfQueens)
+
+    @staticmethod
+    def cut_point_queen_binary(parents: np.ndarray, crossoverRate: float, round: int, randomState: int = None, numberOfQueens: int = 8) -> np.ndarray:
+        """
+        Reprodução por ponto de corte na codificação binária, combinando as palavras com máscaras de bits.
+
+        Args:
+            parents: Array uint32 (numberOfPairs, 2, numberOfWords) com os pares selecionados para reprodução.
+            crossoverRate: Taxa de cruzamento entre os indivíduos.
+            round: É o round atual da execução.
+            randomState: É o estado definido para a execução.
+            numberOfQueens: Tamanho do tabuleiro.
+
+        Returns:
+            Array uint32 (2 * numberOfCrossovers, numberOfWords) com os filhos gerados.
+        """
+        rng = random_generator(randomState, "crossover", round)
+
+        parents = np.asarray(parents)
+        numberOfPairs, _, numberOfWords = parents.shape
+        bitsPerGene, genesPerWord, _ = BinaryEncoding.layout(numberOfQueens)
+
+        selectedPairs = parents[rng.random(size=numberOfPairs) < crossoverRate]
+        crossoverPoints = rng.integers(1, numberOfQueens, size=selectedPairs.shape[0])
+
+        # Os genes antes do ponto de corte ficam nos bits baixos das primeiras palavras.
+        cutWord = (crossoverPoints // genesPerWord)[:, None]
+        cutBit = ((crossoverPoints % genesPerWord) * bitsPerGene).astype(np.uint64)[:, None]
+        words = np.arange(numberOfWords)
+        partialMask = ((np.uint64(1) << cutBit) - np.uint64(1)).astype(np.uint32)
+        headMask = np.where(words < cutWord, np.uint32(0xFFFFFFFF), np.where(words == cutWord, partialMask, np.uint32(0)))
+
+        firstParent = selectedPairs[:, 0]
+        secondParent = selectedPairs[:, 1]
+        firstSon = (firstParent & headMask) | (secondParent & ~headMask)
+        secondSon = (secondParent & headMask) | (firstParent & ~headMask)
+
+        return np.stack((firstSon, secondSon), axis=1).reshape(-1, numberOfWords)
     
 class Modifier:
     """
@@ -191,11 +900,7 @@ class Modifier:
             mutateSon[genePosition] = newValue
             return mutateSon
 
-        if randomState is not None:
-            dynamicSeed = hash((randomState, round)) % (2**32)
-            rng = np.random.default_rng(dynamicSeed)
-        else:
-            rng = np.random.default_rng()
+        rng = random_generator(randomState, "mutation", round)
 
         numberOfSons = len(sons)
 
@@ -204,6 +909,160 @@ class Modifier:
                 sons[i] = apply_bit_flip(sons[i], rng)
 
         return sons
+
+    @staticmethod
+    def apply_bit_flip_queen_array(sons: np.ndarray, mutationRate: float, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Gerar mutações nos individuos, invertendo o bit do meio de um gene sorteado em cada filho mutado.
+
+        Args:
+            sons: Array (numberOfSons, numberOfQueens) com os indíviduos que podem sofrer mutação.
+            mutationRate: Taxa de mutação dos filhos.
+            round: É o round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            Array com os filhos mutados ou não.
+        """
+        mutateSons, _, _ = Modifier.apply_bit_flip_with_changes_queen_array(sons, mutationRate, round, randomState)
+        return mutateSons
+
+    @staticmethod
+    def apply_bit_flip_with_changes_queen_array(sons: np.ndarray, mutationRate: float, round: int, randomState: int = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Igual a apply_bit_flip_queen_array, mas também informa quais filhos e genes foram alterados.
+
+        Args:
+            sons: Array (numberOfSons, numberOfQueens) com os indíviduos que podem sofrer mutação.
+            mutationRate: Taxa de mutação dos filhos.
+            round: É o round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            Os filhos mutados ou não, os índices dos filhos mutados e a posição do gene alterado em cada um.
+        """
+        rng = random_generator(randomState, "mutation", round)
+
+        mutateSons = np.array(sons, copy=True)
+        numberOfSons, numberOfQueens = mutateSons.shape
+
+        bitsPerGene = max(1, int(numberOfQueens - 1).bit_length())
+        flipMask = 1 << (bitsPerGene // 2)
+
+        mutatedIndex = np.flatnonzero(rng.random(size=numberOfSons) < mutationRate)
+        genePositions = rng.integers(0, numberOfQueens, size=mutatedIndex.size)
+        mutateSons[mutatedIndex, genePositions] = (mutateSons[mutatedIndex, genePositions] ^ flipMask) % numberOfQueens
+
+        return mutateSons, mutatedIndex, genePositions
+
+    @staticmethod
+    def apply_swap_queen_array(sons: np.ndarray, mutationRate: float, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Gerar mutações nos individuos trocando de lugar dois genes sorteados, o que mantém os filhos como permutações.
+
+        Args:
+            sons: Array (numberOfSons, numberOfQueens) com os indíviduos que podem sofrer mutação.
+            mutationRate: Taxa de mutação dos filhos.
+            round: É o round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            Array com os filhos mutados ou não.
+        """
+        rng = random_generator(randomState, "mutation", round)
+
+        mutateSons = np.array(sons, copy=True)
+        numberOfSons, numberOfQueens = mutateSons.shape
+
+        mutatedIndex = np.flatnonzero(rng.random(size=numberOfSons) < mutationRate)
+        firstPositions = rng.integers(0, numberOfQueens, size=mutatedIndex.size)
+        # O deslocamento de 1 a numberOfQueens - 1 garante duas posições diferentes.
+        secondPositions = (firstPositions + rng.integers(1, max(2, numberOfQueens), size=mutatedIndex.size)) % numberOfQueens
+
+        firstValues = mutateSons[mutatedIndex, firstPositions]
+        mutateSons[mutatedIndex, firstPositions] = mutateSons[mutatedIndex, secondPositions]
+        mutateSons[mutatedIndex, secondPositions] = firstValues
+
+        return mutateSons
+
+    @staticmethod
+    def apply_inversion_queen_array(sons: np.ndarray, mutationRate: float, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Gerar mutações nos individuos invertendo a ordem dos genes de um segmento sorteado, o que mantém os filhos como permutações.
+
+        Args:
+            sons: Array (numberOfSons, numberOfQueens) com os indíviduos que podem sofrer mutação.
+            mutationRate: Taxa de mutação dos filhos.
+            round: É o round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            Array com os filhos mutados ou não.
+        """
+        rng = random_generator(randomState, "mutation", round)
+
+        mutateSons = np.array(sons, copy=True)
+        numberOfSons, numberOfQueens = mutateSons.shape
+
+        mutatedIndex = np.flatnonzero(rng.random(size=numberOfSons) < mutationRate)
+        # Segmentos com pelo menos dois genes, já que inverter um único gene não altera o filho.
+        start = rng.integers(0, max(1, numberOfQueens - 1), size=mutatedIndex.size)
+        end = rng.integers(np.minimum(start + 2, numberOfQueens), numberOfQueens + 1)
+
+        positions = np.arange(numberOfQueens)
+        inSegment = (positions >= start[:, None]) & (positions < end[:, None])
+        sourcePositions = np.where(inSegment, start[:, None] + end[:, None] - 1 - positions, positions)
+        mutateSons[mutatedIndex] = np.take_along_axis(mutateSons[mutatedIndex], sourcePositions, axis=1)
+
+        return mutateSons
+
+    @staticmethod
+    def apply_bit_flip_queen_binary(sons: np.ndarray, mutationRate: float, round: int, randomState: int = None, numberOfQueens: int = 8) -> np.ndarray:
+        """
+        Gerar mutações na codificação binária, aplicando a toda a população uma máscara XOR aleatória.
+
+        Aqui mutationRate é a probabilidade de cada bit ocupado por um gene ser invertido. Em vez de um número
+        aleatório por bit, as distâncias entre bits invertidos são sorteadas com a distribuição geométrica, então
+        a memória usada é proporcional ao número de inversões, e não ao tamanho da população.
+
+        Args:
+            sons: Array uint32 (numberOfSons, numberOfWords) com os indíviduos que podem sofrer mutação.
+            mutationRate: Probabilidade de inversão de cada bit.
+            round: É o round atual da execução.
+            randomState: É o estado definido para a execução.
+            numberOfQueens: Tamanho do tabuleiro.
+
+        Returns:
+            Array com os filhos mutados ou não.
+        """
+        rng = random_generator(randomState, "mutation", round)
+
+        sons = np.asarray(sons)
+        bitsPerGene, _, _ = BinaryEncoding.layout(numberOfQueens)
+        geneWords, geneShifts = BinaryEncoding.gene_offsets(numberOfQueens)
+
+        # Palavra e bit de cada um dos bits ocupados de um indivíduo.
+        usedWords = np.repeat(geneWords, bitsPerGene)
+        usedBits = (np.repeat(geneShifts, bitsPerGene) + np.tile(np.arange(bitsPerGene, dtype=np.uint32), numberOfQueens)).astype(np.uint32)
+        bitsPerIndividual = usedWords.shape[0]
+        totalBits = sons.shape[0] * bitsPerIndividual
+
+        if mutationRate <= 0 or totalBits == 0:
+            return sons.copy()
+
+        # Sorteia as distâncias em lotes até passar do último bit.
+        expectedFlips = totalBits * min(mutationRate, 1.0)
+        batchSize = int(expectedFlips + 4 * np.sqrt(expectedFlips)) + 16
+        positions = np.cumsum(rng.geometric(min(mutationRate, 1.0), size=batchSize)) - 1
+        while positions[-1] < totalBits:
+            positions = np.concatenate((positions, positions[-1] + np.cumsum(rng.geometric(min(mutationRate, 1.0), size=batchSize))))
+        positions = positions[positions < totalBits]
+
+        sonIndex, usedIndex = np.divmod(positions, bitsPerIndividual)
+        xorMask = np.zeros(sons.shape, dtype=np.uint32)
+        np.bitwise_or.at(xorMask, (sonIndex, usedWords[usedIndex]), np.uint32(1) << usedBits[usedIndex])
+
+        return sons ^ xorMask
     
 class SuvivorCriteria:
     """
@@ -233,11 +1092,7 @@ class SuvivorCriteria:
             Uma lista com os selecionados que irão sobreviver, e a pontuação desses individuos.
         """
         
-        if randomState is not None:
-            dynamicSeed = hash((randomState, round)) % (2**32)
-            rng = np.random.default_rng(dynamicSeed)
-        else:
-            rng = np.random.default_rng()
+        rng = random_generator(randomState, "survivor", round)
 
         newPopulationSize = len(newPopulation)
         if newPopulationSize >= populationSize:
@@ -252,7 +1107,7 @@ class SuvivorCriteria:
 
             selectedPlasterIndex = rng.choice(populationSize, size=(populationSize-newPopulationSize), replace=False)
             selectedPlasterPopulation = [oldPopulation[i] for i in selectedPlasterIndex]
-            selectedPlasterEvaluate = [oldGenerationEvaluate[i] for i in selectedIndex]
+            selectedPlasterEvaluate = [oldGenerationEvaluate[i] for i in selectedPlasterIndex]
 
             selectedPopulation = selectedPopulation + selectedPlasterPopulation
             selectedEvaluate = selectedEvaluate + selectedPlasterEvaluate
@@ -288,4 +1143,184 @@ class SuvivorCriteria:
         allIndividualsSorted = list(allIndividualsSorted)
         allScoresSorted = list(allScoresSorted)
 
-        return allIndividualsSorted[:populationSize], allScoresSorted[:populationSize]
\ No newline at end of file
+        return allIndividualsSorted[:populationSize], allScoresSorted[:populationSize]
+
+    @staticmethod
+    def random_switch_all_population_queen_array(oldPopulation: np.ndarray,
+                                                 newPopulation: np.ndarray,
+                                                 oldGenerationEvaluate: np.ndarray,
+                                                 newGenerationEvaluate: np.ndarray,
+                                                 populationSize: int,
+                                                 round: int = 0,
+                                                 randomState: int = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Troca toda a geração anterior pela atual, completando com indivíduos antigos se faltarem filhos.
+
+        Args:
+            oldPopulation: Array com os indíviduos da geração anterior.
+            newPopulation: Array com os indíviduos da geração atual.
+            oldGenerationEvaluate: Pontuação da geração anterior.
+            newGenerationEvaluate: Pontuação da geração atual.
+            populationSize: Número de indivíduos que a população deve ter.
+            round: É o round atual da execução.
+            randomState: É o estado definido para a execução.
+
+        Returns:
+            O array com os selecionados que irão sobreviver, e a pontuação desses individuos.
+        """
+        rng = random_generator(randomState, "survivor", round)
+
+        newPopulationSize = len(newPopulation)
+        selectedIndex = rng.choice(newPopulationSize, size=min(newPopulationSize, populationSize), replace=False)
+        selectedPopulation = np.asarray(newPopulation)[selectedIndex]
+        selectedEvaluate = np.asarray(newGenerationEvaluate)[selectedIndex]
+
+        if newPopulationSize < populationSize:
+            selectedPlasterIndex = rng.choice(len(oldPopulation), size=(populationSize-newPopulationSize), replace=False)
+            selectedPopulation = np.concatenate((selectedPopulation, np.asarray(oldPopulation)[selectedPlasterIndex]))
+            selectedEvaluate = np.concatenate((selectedEvaluate, np.asarray(oldGenerationEvaluate)[selectedPlasterIndex]))
+
+        return selectedPopulation, selectedEvaluate
+
+    @staticmethod
+    def elitist_replacement_queen_array(oldPopulation: np.ndarray,
+                                        newPopulation: np.ndarray,
+                                        oldGenerationEvaluate: np.ndarray,
+                                        newGenerationEvaluate: np.ndarray,
+                                        populationSize: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Seleciona somente os melhores individuos, seja parte da geração antiga ou da nova.
+
+        Args:
+            oldPopulation: Array com os indíviduos da geração anterior.
+            newPopulation: Array com os indíviduos da geração atual.
+            oldGenerationEvaluate: Pontuação da geração anterior.
+            newGenerationEvaluate: Pontuação da geração atual.
+            populationSize: Número de indivíduos que a população deve ter.
+
+        Returns:
+            O array com os selecionados que irão sobreviver, e a pontuação desses individuos.
+        """
+        oldPopulation = np.asarray(oldPopulation)
+        allIndividuals = np.concatenate((oldPopulation, np.asarray(newPopulation).reshape(-1, oldPopulation.shape[1])))
+        allScores = np.concatenate((oldGenerationEvaluate, newGenerationEvaluate))
+
+        selectedIndex = SuvivorCriteria.smallest_index_stable(allScores, populationSize)
+
+        return allIndividuals[selectedIndex], allScores[selectedIndex]
+
+    @staticmethod
+    def steady_state_replacement_queen_array(oldPopulation: np.ndarray,
+                                             newPopulation: np.ndarray,
+                                             oldGenerationEvaluate: np.ndarray,
+                                             newGenerationEvaluate: np.ndarray,
+                                             populationSize: int,
+                                             replaceCount: int = 2) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Substitui somente os piores indivíduos da geração anterior pelos melhores filhos, direto nos arrays recebidos.
+
+        Os replaceCount piores indivíduos disputam com os replaceCount melhores filhos, e os melhores dessa
+        disputa ocupam as posições dos piores. Em caso de empate o indivíduo antigo permanece.
+
+        Args:
+            oldPopulation: Array com os indíviduos da geração anterior. Se já for um array, é alterado no lugar.
+            newPopulation: Array com os indíviduos da geração atual.
+            oldGenerationEvaluate: Pontuação da geração anterior. Se já for um array, é alterada no lugar.
+            newGenerationEvaluate: Pontuação da geração atual.
+            populationSize: Número de indivíduos que a população deve ter.
+            replaceCount: Número máximo de indivíduos substituídos a cada geração.
+
+        Returns:
+            O array com os selecionados que irão sobreviver, e a pontuação desses individuos.
+        """
+        oldPopulation = np.asarray(oldPopulation)
+        newPopulation = np.asarray(newPopulation)
+        oldGenerationEvaluate = np.asarray(oldGenerationEvaluate)
+        newGenerationEvaluate = np.asarray(newGenerationEvaluate)
+        replaceCount = min(replaceCount, len(newPopulation), len(oldPopulation))
+
+        if replaceCount == 0:
+            return oldPopulation, oldGenerationEvaluate
+
+        numberOfOld = len(oldGenerationEvaluate)
+        worstIndex = numberOfOld - 1 - SuvivorCriteria.smallest_index_stable(-oldGenerationEvaluate[::-1], replaceCount)
+        bestSonIndex = SuvivorCriteria.smallest_index_stable(newGenerationEvaluate, replaceCount)
+
+        candidateScores = np.concatenate((oldGenerationEvaluate[worstIndex], newGenerationEvaluate[bestSonIndex]))
+        candidateIndividuals = np.concatenate((oldPopulation[worstIndex], newPopulation[bestSonIndex]))
+        winnerIndex = SuvivorCriteria.smallest_index_stable(candidateScores, replaceCount)
+
+        oldPopulation[worstIndex] = candidateIndividuals[winnerIndex]
+        oldGenerationEvaluate[worstIndex] = candidateScores[winnerIndex]
+
+        return oldPopulation, oldGenerationEvaluate
+
+    @staticmethod
+    def smallest_index_stable(evaluates: np.ndarray, numberOfSelected: int) -> np.ndarray:
+        """
+        Retorna os índices das menores pontuações em ordem, como np.argsort(evaluates, kind="stable")[:numberOfSelected],
+        mas usando seleção parcial. Funciona com pontuações inteiras ou reais.
+
+        O custo é O(M + c log c), em que c é o número de pontuações menores ou iguais à k-ésima. Com poucos
+        empates c fica perto de k, mas com contagens de colisões, em que os empates são comuns, c pode chegar
+        a M e o custo fica O(M log M), como o de uma ordenação completa.
+
+        Args:
+            evaluates: Array com as pontuações.
+            numberOfSelected: Número de índices retornados.
+
+        Returns:
+            Array com os índices selecionados, do melhor para o pior, com empates resolvidos pela posição.
+        """
+        evaluates = np.asarray(evaluates)
+        numberOfScores = evaluates.shape[0]
+        numberOfSelected = min(numberOfSelected, numberOfScores)
+
+        if numberOfSelected == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        # Todos os empates com a k-ésima menor pontuação entram como candidatos, então a posição decide entre eles.
+        if numberOfSelected < numberOfScores:
+            threshold = np.partition(evaluates, numberOfSelected - 1)[numberOfSelected - 1]
+            candidateIndex = np.flatnonzero(evaluates <= threshold)
+        else:
+            candidateIndex = np.arange(numberOfScores)
+
+        order = np.lexsort((candidateIndex, evaluates[candidateIndex]))
+        return candidateIndex[order[:numberOfSelected]]
+
+class BestIndividualSelector:
+    """
+    Classe com os métodos de escolha do melhor indivíduo ao final da execução.
+    """
+    @staticmethod
+    def get_best_queen_array(population: np.ndarray, evaluates: np.ndarray) -> tuple[list[int], int]:
+        """
+        Retorna o indivíduo de menor pontuação.
+
+        Args:
+            population: Array com os indivíduos da população final.
+            evaluates: Array com as pontuações dos indivíduos.
+
+        Returns:
+            O melhor indivíduo, como lista, e a sua pontuação.
+        """
+        bestIndex = int(np.argmin(evaluates))
+        return np.asarray(population)[bestIndex].tolist(), int(np.asarray(evaluates)[bestIndex])
+
+    @staticmethod
+    def get_best_queen_binary(population: np.ndarray, evaluates: np.ndarray, numberOfQueens: int = 8) -> tuple[list[int], int]:
+        """
+        Retorna o indivíduo de menor pontuação, decodificado da codificação binária.
+
+        Args:
+            population: Array uint32 com os indivíduos da população final.
+            evaluates: Array com as pontuações dos indivíduos.
+            numberOfQueens: Tamanho do tabuleiro.
+
+        Returns:
+            O melhor indivíduo, como lista, e a sua pontuação.
+        """
+        bestIndex = int(np.argmin(evaluates))
+        bestIndividual = BinaryEncoding.decode_queen_binary(np.asarray(population)[bestIndex:bestIndex + 1], numberOfQueens)[0]
+        return bestIndividual.tolist(), int(np.asarray(evaluates)[bestIndex])
\ No newline at end of file
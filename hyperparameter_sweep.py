@@ -0,0 +1,190 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import product
+
+import numpy as np
+
+from experiment_executor import run_seed_chunk
+
+def configuration_grid(parameterGrid: dict[str, list], strategyChoices: dict[str, dict] = None) -> list[dict]:
+    """
+    Monta todas as combinações dos parâmetros e das estratégias.
+
+    Args:
+        parameterGrid: Valores de cada parâmetro de run(), por exemplo {"POPULATION_SIZE": [20, 50]}.
+        strategyChoices: Opções nomeadas de cada operador de run(), por exemplo
+            {"survivor_selection_strategy": {"elitist": ..., "random_switch": ...}}.
+
+    Returns:
+        Lista de configurações com "name", o rótulo da tabela, e "arguments", os argumentos de run() que mudam.
+    """
+    strategyChoices = strategyChoices or {}
+    parameterNames = list(parameterGrid)
+    strategyNames = list(strategyChoices)
+
+    configurations = []
+    for values in product(*(parameterGrid[name] for name in parameterNames)):
+        for choices in product(*(strategyChoices[name] for name in strategyNames)):
+            arguments = dict(zip(parameterNames, values))
+            arguments.update({name: strategyChoices[name][choice] for name, choice in zip(strategyNames, choices)})
+            labels = [f"{name}={value}" for name, value in zip(parameterNames, values)] + [f"{name}={choice}" for name, choice in zip(strategyNames, choices)]
+            configurations.append({"name": ", ".join(labels), "arguments": arguments})
+    return configurations
+
+def summarize(results: list[tuple], minValue: int) -> dict:
+    """
+    Resume os resultados de uma configuração.
+
+    Returns:
+        Dicionário com o número de seeds, a média e o desvio padrão do round de parada e a taxa de sucesso.
+    """
+    if not results:
+        return {"seeds": 0, "meanEndRound": float("nan"), "stdEndRound": float("nan"), "successRate": 0.0}
+
+    endRounds = np.array([result[3] for result in results], dtype=np.float64)
+    successes = np.array([result[2] == minValue for result in results])
+    return {
+        "seeds": len(results),
+        "meanEndRound": float(endRounds.mean()),
+        "stdEndRound": float(endRounds.std()),
+        "successRate": float(successes.mean())
+    }
+
+def rank_key(summary: dict) -> tuple[float, float]:
+    """
+    Ordena pela maior taxa de sucesso e, em caso de empate, pelo menor round médio de parada.
+    """
+    return (-summary["successRate"], summary["meanEndRound"])
+
+def successive_halving(baseArguments: dict,
+                       configurations: list[dict],
+                       seeds: list[int],
+                       initialBudget: int = 20,
+                       reductionFactor: int = 2,
+                       numberOfWorkers: int = None,
+                       chunkSize: int = 10) -> list[dict]:
+    """
+    Avalia as configurações por successive halving, com um único pool de processos para todas.
+
+    Na primeira etapa cada configuração roda initialBudget seeds. A cada etapa, só a fração 1 / reductionFactor
+    melhor segue, com reductionFactor vezes mais seeds, até sobrar uma configuração ou acabarem as seeds.
+    Todas as configurações usam as mesmas seeds, na mesma ordem, e os resultados das etapas anteriores são
+    reaproveitados, então cada etapa executa só as seeds novas.
+
+    Se alguma execução de uma configuração gera uma exceção, a configuração é marcada como falha e sai da
+    disputa, mas as demais continuam.
+
+    Args:
+        baseArguments: Argumentos de run(), exceto RANDOM_STATE, comuns a todas as configurações.
+        configurations: Configurações no formato de configuration_grid.
+        seeds: Seeds disponíveis. O maior orçamento de uma configuração é len(seeds).
+        initialBudget: Número de seeds da primeira etapa.
+        reductionFactor: Fator de redução das configurações e de aumento das seeds a cada etapa.
+        numberOfWorkers: Número de processos. None usa todos os núcleos e 1 executa no processo atual.
+        chunkSize: Número de seeds por tarefa enviada ao pool.
+
+    Returns:
+        Uma linha por configuração, da melhor para a pior, com "name", "rung" (a última etapa alcançada),
+        "error" (a exceção que a eliminou, ou None) e o resumo de summarize. As que chegaram mais longe vêm
+        primeiro e as que falharam ficam no fim.
+    """
+    if reductionFactor < 2:
+        raise ValueError("reductionFactor deve ser pelo menos 2.")
+
+    seeds = list(seeds)
+    numberOfWorkers = numberOfWorkers if numberOfWorkers is not None else (os.cpu_count() or 1)
+    minValue = baseArguments["MIN_VALUE"]
+    allResults = [[] for _ in configurations]
+    errors = [None] * len(configurations)
+    rungs = [0] * len(configurations)
+    active = list(range(len(configurations)))
+    budget = min(initialBudget, len(seeds))
+    rung = 0
+
+    executor = ProcessPoolExecutor(max_workers=numberOfWorkers) if numberOfWorkers > 1 else None
+    try:
+        while True:
+            tasks = []
+            for configurationIndex in active:
+                runArguments = {**baseArguments, **configurations[configurationIndex]["arguments"]}
+                newSeeds = seeds[len(allResults[configurationIndex]):budget]
+                for i in range(0, len(newSeeds), chunkSize):
+                    chunk = newSeeds[i:i + chunkSize]
+                    if executor is None:
+                        tasks.append((configurationIndex, partial(run_seed_chunk, chunk, runArguments)))
+                    else:
+                        tasks.append((configurationIndex, executor.submit(run_seed_chunk, chunk, runArguments).result))
+
+            # As tarefas são recolhidas na ordem de envio, então os resultados seguem a ordem das seeds.
+            for configurationIndex, task in tasks:
+                if errors[configurationIndex] is not None:
+                    continue
+                try:
+                    allResults[configurationIndex].extend(task())
+                except Exception as error:
+                    errors[configurationIndex] = f"{type(error).__name__}: {error}"
+            for configurationIndex in active:
+                rungs[configurationIndex] = rung
+            active = [configurationIndex for configurationIndex in active if errors[configurationIndex] is None]
+
+            if len(active) <= 1 or budget >= len(seeds):
+                break
+
+            active.sort(key=lambda index: rank_key(summarize(allResults[index], minValue)))
+            active = active[:max(1, len(active) // reductionFactor)]
+            budget = min(budget * reductionFactor, len(seeds))
+            rung += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    table = [{"name": configuration["name"], "rung": rungs[index], "error": errors[index], **summarize(allResults[index], minValue)}
+             for index, configuration in enumerate(configurations)]
+    table.sort(key=lambda row: (row["error"] is not None, -row["rung"]) + rank_key(row))
+    return table
+
+def format_table(table: list[dict]) -> str:
+    """
+    Formata o resultado de successive_halving como uma tabela em texto.
+    """
+    nameWidth = max([len("Configuração")] + [len(row["name"]) for row in table])
+    lines = [f"{'#':>3} | {'Configuração':<{nameWidth}} | {'Etapa':>5} | {'Seeds':>6} | {'Round médio':>11} | {'Desvio':>9} | {'Sucesso':>7}"]
+    for position, row in enumerate(table, start=1):
+        if row.get("error") is not None:
+            lines.append(f"{position:>3} | {row['name']:<{nameWidth}} | {row['rung']:>5} | falhou: {row['error']}")
+            continue
+        lines.append(f"{position:>3} | {row['name']:<{nameWidth}} | {row['rung']:>5} | {row['seeds']:>6} | {row['meanEndRound']:>11.3f} | {row['stdEndRound']:>9.3f} | {row['successRate']:>7.2%}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    from genetic_algorithm import *
+    from runner import getBestIndividual
+
+    baseArguments = {
+        "NUMBER_OF_GENERATIONS": 1000,
+        "MIN_VALUE": 0,
+        "generate_population": PopulationGenerator.generate_eight_queen_vector,
+        "evaluate_population": PopulationAssessor.evaluate_eight_queen_vector,
+        "stopping_criterion": StoppingCriteria.stop_eight_queen_vector_min,
+        "parent_selection_strategy": ParentSelector.select_parent_roulette_eight_queen_vector,
+        "crossover_strategy": CrossoverMethods.cut_point_eight_eight_queen_vector,
+        "mutation_strategy": Modifier.apply_bit_flip_eight_queen_vector,
+        "return_best_individual_and_score_function": getBestIndividual
+    }
+
+    configurations = configuration_grid(
+        {
+            "POPULATION_SIZE": [10, 20, 50],
+            "CROSSOVER_RATE": [0.6, 0.8, 1.0],
+            "MUTATION_RATE": [0.03, 0.1, 0.3]
+        },
+        {
+            "survivor_selection_strategy": {
+                "elitista": SuvivorCriteria.elitist_replacement_eight_queen_vector,
+                "troca_aleatoria": SuvivorCriteria.random_switch_all_population_eight_queen_vector
+            }
+        })
+
+    table = successive_halving(baseArguments, configurations, seeds=list(range(640)), initialBudget=20)
+    print(format_table(table))
@@ -0,0 +1,112 @@
+from functools import partial
+from typing import Callable
+
+import numpy as np
+
+from genetic_algorithm import PopulationAssessor, ParentSelector, CrossoverMethods, Modifier
+
+class IncrementalEvaluator:
+    """
+    Conjunto de operadores da família de arrays que avaliam os filhos a partir da pontuação dos pais.
+
+    A seleção guarda a pontuação dos pais, o cruzamento recalcula só o segmento trocado de cada filho
+    e a mutação só a rainha alterada. Os métodos têm as mesmas assinaturas esperadas por run(), e a
+    avaliação devolve as pontuações já calculadas quando recebe os filhos produzidos pela mutação.
+    """
+    # Os operadores trocam informação pelos atributos, então a avaliação depende da última população produzida.
+    threadSafe = False
+
+    def __init__(self, evaluate_population: Callable = None, countRowConflicts: bool = False):
+        """
+        Args:
+            evaluate_population: A função de avaliação completa, usada na população inicial. Precisa contar as
+                colisões no mesmo modo de countRowConflicts. None usa evaluate_n_queen_histogram nesse modo.
+            countRowConflicts: Se True, as atualizações incrementais também contam os pares de rainhas na mesma linha.
+        """
+        if evaluate_population is None:
+            evaluate_population = partial(PopulationAssessor.evaluate_n_queen_histogram, countRowConflicts=countRowConflicts)
+        elif isinstance(evaluate_population, partial) and evaluate_population.keywords.get("countRowConflicts", countRowConflicts) != countRowConflicts:
+            raise ValueError("evaluate_population e IncrementalEvaluator usam modos diferentes de countRowConflicts.")
+
+        self.evaluate_population = evaluate_population
+        self.countRowConflicts = countRowConflicts
+        self.parentEvaluates = None
+        self.sons = None
+        self.sonsEvaluates = None
+
+    def evaluate_queen_array(self, population: np.ndarray) -> np.ndarray:
+        """
+        Avalia a população, reaproveitando as pontuações incrementais se ela for a última geração de filhos.
+
+        Args:
+            population: Array com os indivíduos.
+
+        Returns:
+            Array com a avaliação de cada indíviduo.
+        """
+        if population is self.sons and self.sonsEvaluates is not None:
+            return self.sonsEvaluates
+        return self.evaluate_population(population)
+
+    def select_parent_roulette_queen_array(self, population: np.ndarray, evaluates: np.ndarray, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Seleciona os pares pela roleta, guardando a pontuação de cada pai.
+        """
+        pairIndex = ParentSelector.select_parent_index_roulette_queen_array(evaluates, round, randomState)
+        self.parentEvaluates = np.asarray(evaluates)[pairIndex]
+        return np.asarray(population)[pairIndex]
+
+    def cut_point_queen_array(self, parents: np.ndarray, crossoverRate: float, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Cruza os pares pelo ponto de corte e calcula a pontuação dos filhos a partir dos pais.
+
+        Cada filho é comparado com o pai do qual herdou o maior segmento, então apenas o segmento
+        menor, com no máximo metade das rainhas, é recontado.
+        """
+        sons, crossedPairs, crossoverPoints = CrossoverMethods.cut_point_with_changes_queen_array(parents, crossoverRate, round, randomState)
+        numberOfQueens = sons.shape[1]
+        self.sons = sons
+        self.sonsEvaluates = None
+
+        if self.parentEvaluates is None or self.parentEvaluates.shape[0] != len(parents):
+            return sons
+
+        # O filho 2i tem a cabeça do pai 0, e o filho 2i + 1 a cabeça do pai 1.
+        crossoverPoints = np.repeat(crossoverPoints, 2)
+        headParent = np.tile([0, 1], crossedPairs.size)
+        tailIsShorter = crossoverPoints >= numberOfQueens - crossoverPoints
+        referenceParent = np.where(tailIsShorter, headParent, 1 - headParent)
+
+        pairs = np.repeat(crossedPairs, 2)
+        original = np.asarray(parents)[pairs, referenceParent]
+        originalEvaluates = self.parentEvaluates[pairs, referenceParent]
+
+        segmentStart = np.where(tailIsShorter, crossoverPoints, 0)
+        segmentLength = np.where(tailIsShorter, numberOfQueens - crossoverPoints, crossoverPoints)
+        offsets = np.arange(segmentLength.max(initial=0))
+        changedPositions = np.minimum(segmentStart[:, None] + offsets, numberOfQueens - 1)
+        changedMask = offsets < segmentLength[:, None]
+
+        self.sonsEvaluates = PopulationAssessor.evaluate_changed_genes_queen_array(original, originalEvaluates, sons, changedPositions, changedMask, self.countRowConflicts)
+        return sons
+
+    def apply_bit_flip_queen_array(self, sons: np.ndarray, mutationRate: float, round: int, randomState: int = None) -> np.ndarray:
+        """
+        Aplica o bit flip e atualiza a pontuação dos filhos mutados recontando apenas a rainha alterada.
+        """
+        mutateSons, mutatedIndex, genePositions = Modifier.apply_bit_flip_with_changes_queen_array(sons, mutationRate, round, randomState)
+
+        if sons is self.sons and self.sonsEvaluates is not None:
+            sonsEvaluates = self.sonsEvaluates.copy()
+            sonsEvaluates[mutatedIndex] = PopulationAssessor.evaluate_changed_genes_queen_array(np.asarray(sons)[mutatedIndex],
+                                                                                                self.sonsEvaluates[mutatedIndex],
+                                                                                                mutateSons[mutatedIndex],
+                                                                                                genePositions[:, None],
+                                                                                                np.ones((mutatedIndex.size, 1), dtype=bool),
+                                                                                                self.countRowConflicts)
+            self.sonsEvaluates = sonsEvaluates
+        else:
+            self.sonsEvaluates = None
+
+        self.sons = mutateSons
+        return mutateSons
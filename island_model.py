@@ -0,0 +1,272 @@
+import multiprocessing
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+
+import numpy as np
+
+from random_context import RandomContext
+from stepper import GeneticAlgorithmStepper
+
+TOPOLOGIES = ("ring", "fully_connected")
+
+def migration_sources(islandIndex: int, numberOfIslands: int, topology: str) -> list[int]:
+    """
+    Retorna as ilhas que enviam migrantes para uma ilha.
+
+    Args:
+        islandIndex: Índice da ilha que recebe os migrantes.
+        numberOfIslands: Número de ilhas.
+        topology: "ring", em que cada ilha recebe da anterior, ou "fully_connected", em que recebe de todas.
+
+    Returns:
+        Lista com os índices das ilhas de origem.
+    """
+    if numberOfIslands == 1:
+        return []
+    if topology == "ring":
+        return [(islandIndex - 1) % numberOfIslands]
+    if topology == "fully_connected":
+        return [source for source in range(numberOfIslands) if source != islandIndex]
+    raise ValueError(f"Topologia desconhecida: {topology}.")
+
+def island_seed(RANDOM_STATE: int, islandIndex: int) -> int:
+    """
+    Deriva a seed de uma ilha a partir da seed da execução.
+    """
+    if RANDOM_STATE is None:
+        return None
+    return int(np.random.SeedSequence([RANDOM_STATE, islandIndex]).generate_state(1, np.uint64)[0])
+
+def island_worker(islandIndex: int, sharedNames: dict, populationShape: tuple, populationDtype: str, barrier, errors, arguments: dict):
+    """
+    Evolui uma ilha, trocando migrantes com as vizinhas pela memória compartilhada.
+
+    Populações em lista voltam a ser listas depois de cada migração, então as famílias de listas e de arrays
+    recebem sempre o tipo que os seus operadores esperam.
+
+    Args:
+        islandIndex: Índice da ilha.
+        sharedNames: Nomes dos blocos de memória compartilhada.
+        populationShape: Formato (numberOfIslands, POPULATION_SIZE, ...) do bloco das populações.
+        populationDtype: Tipo dos genes.
+        barrier: Barreira usada para sincronizar as migrações. É abortada quando alguma ilha para.
+        errors: Fila onde a ilha coloca a descrição do erro, se terminar com uma exceção.
+        arguments: Parâmetros e operadores da execução, os mesmos de run().
+    """
+    blocks = {name: shared_memory.SharedMemory(name=sharedName) for name, sharedName in sharedNames.items()}
+    numberOfIslands = populationShape[0]
+    populations = np.ndarray(populationShape, dtype=populationDtype, buffer=blocks["populations"].buf)
+    scores = np.ndarray(populationShape[:2], dtype=np.int64, buffer=blocks["scores"].buf)
+    endRounds = np.ndarray(numberOfIslands, dtype=np.int64, buffer=blocks["endRounds"].buf)
+    stopFlag = np.ndarray(1, dtype=np.int64, buffer=blocks["stopFlag"].buf)
+
+    POPULATION_SIZE = arguments["POPULATION_SIZE"]
+    MIGRATION_INTERVAL = arguments["MIGRATION_INTERVAL"]
+    NUMBER_OF_MIGRANTS = min(arguments["NUMBER_OF_MIGRANTS"], POPULATION_SIZE)
+    RANDOM_STATE = RandomContext(island_seed(arguments["RANDOM_STATE"], islandIndex))
+    sources = migration_sources(islandIndex, numberOfIslands, arguments["TOPOLOGY"])
+    survivorUsesRandomState = GeneticAlgorithmStepper.accepts_random_state(arguments["survivor_selection_strategy"])
+
+    try:
+        endRound = 0
+        population = arguments["generate_population"](POPULATION_SIZE, RANDOM_STATE)
+        evaluates = arguments["evaluate_population"](population)
+        isList = isinstance(population, list)
+
+        for round in range(arguments["NUMBER_OF_GENERATIONS"]):
+            endRound = round+1
+
+            if stopFlag[0] == 1:
+                break
+
+            if arguments["stopping_criterion"](evaluates, arguments["MIN_VALUE"]) == True:
+                stopFlag[0] = 1
+                barrier.abort()
+                break
+
+            parents = arguments["parent_selection_strategy"](population, evaluates, round, RANDOM_STATE)
+            sons = arguments["crossover_strategy"](parents, arguments["CROSSOVER_RATE"], round, RANDOM_STATE)
+            mutateSons = arguments["mutation_strategy"](sons, arguments["MUTATION_RATE"], round, RANDOM_STATE)
+            sonsEvaluates = arguments["evaluate_population"](mutateSons)
+
+            if survivorUsesRandomState:
+                population, evaluates = arguments["survivor_selection_strategy"](population, mutateSons, evaluates, sonsEvaluates, POPULATION_SIZE, round, RANDOM_STATE)
+            else:
+                population, evaluates = arguments["survivor_selection_strategy"](population, mutateSons, evaluates, sonsEvaluates, POPULATION_SIZE)
+
+            if len(population) != POPULATION_SIZE:
+                raise ValueError(f"A seleção de sobreviventes retornou {len(population)} indivíduos em vez de {POPULATION_SIZE}.")
+
+            if sources and endRound % MIGRATION_INTERVAL == 0:
+                populations[islandIndex] = population
+                scores[islandIndex] = evaluates
+
+                # Entre as duas barreiras nenhuma ilha escreve, então todas leem as populações da mesma geração.
+                try:
+                    barrier.wait()
+                    migrants = []
+                    migrantsEvaluates = []
+                    for source in sources:
+                        bestIndex = np.argsort(scores[source], kind="stable")[:NUMBER_OF_MIGRANTS]
+                        migrants.append(populations[source][bestIndex])
+                        migrantsEvaluates.append(scores[source][bestIndex])
+                    barrier.wait()
+                except BrokenBarrierError:
+                    break
+
+                migrants = np.concatenate(migrants)
+                migrantsEvaluates = np.concatenate(migrantsEvaluates)
+                worstIndex = np.argsort(evaluates, kind="stable")[::-1][:len(migrants)]
+                population = np.array(population, copy=True)
+                evaluates = np.array(evaluates, copy=True)
+                population[worstIndex] = migrants[:len(worstIndex)]
+                evaluates[worstIndex] = migrantsEvaluates[:len(worstIndex)]
+                if isList:
+                    population, evaluates = population.tolist(), evaluates.tolist()
+
+        populations[islandIndex] = population
+        scores[islandIndex] = evaluates
+        endRounds[islandIndex] = endRound
+    except Exception as error:
+        errors.put(f"ilha {islandIndex}: {type(error).__name__}: {error}")
+        raise
+    finally:
+        # Uma ilha que termina antes libera as outras que estiverem esperando na barreira.
+        barrier.abort()
+        for block in blocks.values():
+            block.close()
+
+def run_islands(POPULATION_SIZE,
+                CROSSOVER_RATE,
+                MUTATION_RATE,
+                NUMBER_OF_GENERATIONS,
+                MIN_VALUE,
+                RANDOM_STATE,
+                generate_population,
+                evaluate_population,
+                stopping_criterion,
+                parent_selection_strategy,
+                crossover_strategy,
+                mutation_strategy,
+                survivor_selection_strategy,
+                return_best_individual_and_score_function,
+                NUMBER_OF_ISLANDS: int = 4,
+                MIGRATION_INTERVAL: int = 10,
+                NUMBER_OF_MIGRANTS: int = 2,
+                TOPOLOGY: str = "ring"):
+    """
+    Executa o algoritmo genético no modelo de ilhas, com cada subpopulação evoluindo em um processo.
+
+    A cada MIGRATION_INTERVAL gerações os NUMBER_OF_MIGRANTS melhores indivíduos de cada ilha substituem os
+    piores das ilhas vizinhas. Quando uma ilha atende ao critério de parada, todas param.
+    Os operadores podem ser da família de listas ou de arrays, mas a população precisa ter tamanho fixo e
+    indivíduos do mesmo comprimento.
+
+    Args:
+        POPULATION_SIZE: Tamanho da população de cada ilha.
+        CROSSOVER_RATE: Taxa de cruzamento.
+        MUTATION_RATE: Taxa de mutação dos filhos.
+        NUMBER_OF_GENERATIONS: Número de gerações que serão criadas.
+        MIN_VALUE: O valor minimo da função de custo.
+        RANDOM_STATE: O estado aleátorio definido. Cada ilha recebe um RandomContext derivado dele.
+        generate_population: A função reponsável por gerar a população.
+        evaluate_population: A função reponsável por avaliar os individuos.
+        stopping_criterion: A função reponsável por verificar se o critério de parada foi atendido.
+        parent_selection_strategy: A função reponsável por selecionar os pares para reprodução.
+        crossover_strategy: A função reponsável por realizar o cruzamento.
+        mutation_strategy: A função reponsável por selecionar alguns filhos e aplicar a mutação dos genes neles.
+        survivor_selection_strategy: A função reponsável por selecionar os sobreviventes que irão constituir a próxima geração.
+        return_best_individual_and_score_function: A reponsável por selecionar o melhor individuo ao final da execução do código e retornar ele e a sua pontuação.
+        NUMBER_OF_ISLANDS: Número de ilhas, ou seja, de processos.
+        MIGRATION_INTERVAL: Número de gerações entre as migrações.
+        NUMBER_OF_MIGRANTS: Número de indivíduos enviados por cada ilha de origem.
+        TOPOLOGY: "ring" ou "fully_connected".
+
+    Returns:
+        O melhor individuo encontrado entre todas as ilhas, a sua pontuação e o maior número de gerações executadas por uma ilha.
+    """
+    if TOPOLOGY not in TOPOLOGIES:
+        raise ValueError(f"Topologia desconhecida: {TOPOLOGY}.")
+
+    # Uma população de teste define o formato e o tipo do bloco compartilhado.
+    try:
+        sample = generate_population(POPULATION_SIZE, RandomContext(RANDOM_STATE))
+        isList = isinstance(sample, list)
+        sample = np.asarray(sample)
+    except ValueError:
+        raise ValueError("Os indivíduos gerados por generate_population precisam ter todos o mesmo comprimento.") from None
+    if sample.ndim < 2 or sample.shape[0] != POPULATION_SIZE:
+        raise ValueError(f"generate_population deve retornar {POPULATION_SIZE} indivíduos, mas retornou o formato {sample.shape}.")
+    populationShape = (NUMBER_OF_ISLANDS,) + sample.shape
+
+    sizes = {
+        "populations": int(np.prod(populationShape)) * sample.dtype.itemsize,
+        "scores": NUMBER_OF_ISLANDS * POPULATION_SIZE * 8,
+        "endRounds": NUMBER_OF_ISLANDS * 8,
+        "stopFlag": 8
+    }
+    blocks = {name: shared_memory.SharedMemory(create=True, size=size) for name, size in sizes.items()}
+
+    try:
+        np.ndarray(1, dtype=np.int64, buffer=blocks["stopFlag"].buf)[0] = 0
+
+        arguments = {
+            "POPULATION_SIZE": POPULATION_SIZE,
+            "CROSSOVER_RATE": CROSSOVER_RATE,
+            "MUTATION_RATE": MUTATION_RATE,
+            "NUMBER_OF_GENERATIONS": NUMBER_OF_GENERATIONS,
+            "MIN_VALUE": MIN_VALUE,
+            "RANDOM_STATE": RANDOM_STATE,
+            "generate_population": generate_population,
+            "evaluate_population": evaluate_population,
+            "stopping_criterion": stopping_criterion,
+            "parent_selection_strategy": parent_selection_strategy,
+            "crossover_strategy": crossover_strategy,
+            "mutation_strategy": mutation_strategy,
+            "survivor_selection_strategy": survivor_selection_strategy,
+            "MIGRATION_INTERVAL": MIGRATION_INTERVAL,
+            "NUMBER_OF_MIGRANTS": NUMBER_OF_MIGRANTS,
+            "TOPOLOGY": TOPOLOGY
+        }
+
+        context = multiprocessing.get_context()
+        barrier = context.Barrier(NUMBER_OF_ISLANDS)
+        errors = context.SimpleQueue()
+        sharedNames = {name: block.name for name, block in blocks.items()}
+
+        processes = [context.Process(target=island_worker,
+                                     args=(islandIndex, sharedNames, populationShape, sample.dtype.str, barrier, errors, arguments))
+                     for islandIndex in range(NUMBER_OF_ISLANDS)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        failed = [process.exitcode for process in processes if process.exitcode != 0]
+        if failed:
+            messages = []
+            while not errors.empty():
+                messages.append(errors.get())
+            details = "\n".join(messages) if messages else "sem detalhes"
+            raise RuntimeError(f"{len(failed)} ilha(s) terminaram com erro:\n{details}")
+
+        populations = np.ndarray(populationShape, dtype=sample.dtype, buffer=blocks["populations"].buf)
+        scores = np.ndarray(populationShape[:2], dtype=np.int64, buffer=blocks["scores"].buf)
+        endRounds = np.ndarray(NUMBER_OF_ISLANDS, dtype=np.int64, buffer=blocks["endRounds"].buf)
+
+        allIndividuals = populations.reshape((-1,) + sample.shape[1:]).copy()
+        allScores = scores.reshape(-1).copy()
+        endRound = int(endRounds.max())
+        del populations, scores, endRounds
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+    # A família de listas recebe listas, como em run().
+    if isList:
+        allIndividuals, allScores = allIndividuals.tolist(), allScores.tolist()
+
+    bestIndividual, bestScore = return_best_individual_and_score_function(allIndividuals, allScores)
+
+    return bestIndividual, bestScore, endRound
@@ -0,0 +1,153 @@
+import json
+from time import perf_counter_ns
+from typing import Callable
+
+import numpy as np
+
+from genetic_algorithm import StoppingCriteria
+from random_context import RandomContext
+
+class Profiler:
+    """
+    Registra o tempo de cada operador em cada geração e contadores da execução do algoritmo genético.
+
+    Um mesmo Profiler pode ser passado para várias chamadas de run(), e os dados são agregados entre elas.
+    """
+    def __init__(self):
+        self.originNs = perf_counter_ns()
+        self.events = []
+        self.generations = []
+        self.counters = {
+            "evaluations": 0,
+            "children": 0,
+            "mutations": 0
+        }
+        self.runIndex = -1
+        self.runSeeds = []
+        self.currentRound = None
+
+    def start_run(self, randomState):
+        """
+        Marca o início de uma nova execução.
+
+        Args:
+            randomState: Seed ou RandomContext da execução, guardada para identificar a execução no trace.
+                De um RandomContext é guardada a seed, ou a entropia sorteada quando a seed é None.
+        """
+        if isinstance(randomState, RandomContext):
+            randomState = randomState.seed if randomState.seed is not None else randomState.seedSequence.entropy
+
+        self.runIndex += 1
+        self.runSeeds.append(str(randomState))
+        self.currentRound = None
+
+    def start_generation(self, round: int):
+        self.currentRound = round
+
+    def end_generation(self, population, evaluates):
+        """
+        Registra a melhor pontuação e a diversidade da população ao final de uma geração.
+
+        A diversidade é a fração de genótipos distintos, calculada com um único conjunto de hashes.
+        """
+        self.generations.append({
+            "run": self.runIndex,
+            "round": self.currentRound,
+            "timeNs": perf_counter_ns() - self.originNs,
+            "bestScore": int(np.min(evaluates)),
+            "diversity": StoppingCriteria.population_diversity(population)
+        })
+
+    def wrap(self, name: str, function: Callable) -> Callable:
+        """
+        Envolve um operador, medindo a duração de cada chamada e atualizando os contadores do operador.
+
+        Args:
+            name: Nome do operador, o mesmo argumento de run().
+            function: O operador.
+
+        Returns:
+            Uma função com a mesma assinatura do operador.
+        """
+        def timed(*args, **kwargs):
+            if name == "mutation_strategy":
+                # Uma única cópia, que funciona tanto para arrays quanto para listas de indivíduos.
+                before = np.array(args[0], copy=True)
+
+            startNs = perf_counter_ns()
+            result = function(*args, **kwargs)
+            durationNs = perf_counter_ns() - startNs
+
+            self.events.append((self.runIndex, self.currentRound, name, startNs - self.originNs, durationNs))
+            if name == "evaluate_population":
+                self.counters["evaluations"] += len(args[0])
+            elif name == "crossover_strategy":
+                self.counters["children"] += len(result)
+            elif name == "mutation_strategy":
+                if len(before) > 0:
+                    changed = np.asarray(result).reshape(len(before), -1) != before.reshape(len(before), -1)
+                    self.counters["mutations"] += int(np.count_nonzero(changed.any(axis=1)))
+            return result
+
+        return timed
+
+    def summary(self) -> str:
+        """
+        Monta uma tabela com o tempo agregado de cada operador e os contadores.
+
+        Returns:
+            A tabela em texto.
+        """
+        totals = {}
+        for _, _, name, _, durationNs in self.events:
+            calls, totalNs = totals.get(name, (0, 0))
+            totals[name] = (calls + 1, totalNs + durationNs)
+        allNs = sum(totalNs for _, totalNs in totals.values()) or 1
+
+        lines = [f"{'Operador':<45} | {'Chamadas':>9} | {'Total (ms)':>11} | {'Média (µs)':>11} | {'%':>6}"]
+        for name, (calls, totalNs) in sorted(totals.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{name:<45} | {calls:>9} | {totalNs / 1e6:>11.3f} | {totalNs / calls / 1e3:>11.3f} | {100 * totalNs / allNs:>6.2f}")
+
+        lines.append("")
+        lines.append(f"Execuções: {self.runIndex + 1} | Gerações: {len(self.generations)}")
+        lines.append(f"Avaliações: {self.counters['evaluations']} | Filhos: {self.counters['children']} | Mutações: {self.counters['mutations']}")
+        if self.generations:
+            lines.append(f"Diversidade média: {np.mean([generation['diversity'] for generation in self.generations]):.5f}")
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path: str):
+        """
+        Salva a linha do tempo no formato Trace Event do Chrome, que pode ser aberto em chrome://tracing ou no Perfetto.
+
+        Cada execução aparece como uma thread, cada chamada de operador como um evento com duração,
+        e a melhor pontuação e a diversidade como contadores.
+
+        Args:
+            path: Caminho do arquivo JSON.
+        """
+        traceEvents = []
+        for runIndex, seed in enumerate(self.runSeeds):
+            traceEvents.append({"name": "thread_name", "ph": "M", "pid": 0, "tid": runIndex, "args": {"name": f"RANDOM_STATE {seed}"}})
+
+        for runIndex, round, name, startNs, durationNs in self.events:
+            traceEvents.append({
+                "name": name,
+                "ph": "X",
+                "pid": 0,
+                "tid": runIndex,
+                "ts": startNs / 1e3,
+                "dur": durationNs / 1e3,
+                "args": {"round": round}
+            })
+
+        for generation in self.generations:
+            traceEvents.append({
+                "name": f"run {generation['run']}",
+                "ph": "C",
+                "pid": 0,
+                "ts": generation["timeNs"] / 1e3,
+                "args": {"bestScore": generation["bestScore"], "diversity": generation["diversity"]}
+            })
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": traceEvents, "displayTimeUnit": "ms"}, file)
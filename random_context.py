@@ -0,0 +1,68 @@
+import numpy as np
+
+class RandomContext:
+    """
+    Fonte de aleatoriedade de uma execução, com um fluxo independente para cada operador.
+
+    Os fluxos são filhos de um único np.random.SeedSequence, criados uma vez por execução e
+    reaproveitados em todos os rounds. No modo legacy, cada chamada recria o gerador com
+    hash((seed, round)), reproduzindo os resultados das versões anteriores.
+    """
+    OPERATORS = ("generation", "selection", "crossover", "mutation", "survivor")
+
+    def __init__(self, seed: int = None, legacy: bool = False):
+        """
+        Args:
+            seed: Seed da execução. None usa entropia do sistema.
+            legacy: Se True, reproduz a geração de números aleatórios anterior, baseada em hash((seed, round)).
+        """
+        if legacy and seed is None:
+            raise ValueError("O modo legacy precisa de uma seed.")
+
+        self.seed = seed
+        self.legacy = legacy
+        self.seedSequence = np.random.SeedSequence(seed)
+        self.generators = {}
+
+    def generator(self, operator: str, round: int = None) -> np.random.Generator:
+        """
+        Retorna o gerador de um operador.
+
+        Args:
+            operator: Nome do operador, um dos OPERATORS.
+            round: Round atual da execução. None para a geração da população inicial.
+
+        Returns:
+            O gerador do operador.
+        """
+        if operator not in self.OPERATORS:
+            raise ValueError(f"Operador desconhecido: {operator}.")
+
+        if self.legacy:
+            return random_generator(self.seed, operator, round)
+
+        if operator not in self.generators:
+            childSequence = np.random.SeedSequence(self.seedSequence.entropy, spawn_key=(self.OPERATORS.index(operator),))
+            self.generators[operator] = np.random.default_rng(childSequence)
+        return self.generators[operator]
+
+def random_generator(randomState: "int | RandomContext | None", operator: str, round: int = None) -> np.random.Generator:
+    """
+    Retorna o gerador que um operador deve usar.
+
+    Args:
+        randomState: Seed inteira, RandomContext ou None.
+        operator: Nome do operador, um dos RandomContext.OPERATORS.
+        round: Round atual da execução. None para a geração da população inicial.
+
+    Returns:
+        Um RandomContext usa o fluxo do operador. Uma seed inteira cria um gerador novo com hash((seed, round)),
+        como nas versões anteriores, ou com a própria seed na geração da população. None usa entropia do sistema.
+    """
+    if isinstance(randomState, RandomContext):
+        return randomState.generator(operator, round)
+    if randomState is None:
+        return np.random.default_rng()
+    if round is None:
+        return np.random.default_rng(randomState)
+    return np.random.default_rng(hash((randomState, round)) % (2**32))
@@ -0,0 +1,203 @@
+import json
+import os
+from collections import Counter
+
+import numpy as np
+
+class ResultsStore:
+    """
+    Armazena os resultados das execuções em arquivos binários, um por coluna, com registros de tamanho fixo.
+
+    Cada resultado é acrescentado ao final dos arquivos assim que a execução termina, então uma falha
+    perde no máximo o registro que estava sendo escrito. A leitura é feita com np.memmap, sem copiar os dados.
+    """
+    # A coluna das seeds fica por último, então uma seed só aparece depois que o resto do registro foi escrito.
+    COLUMNS = {
+        "individuals": np.int32,
+        "scores": np.int64,
+        "end_rounds": np.int64,
+        "execution_times": np.float64,
+        "seeds": np.uint64
+    }
+
+    def __init__(self, directory: str, numberOfQueens: int = 8):
+        """
+        Abre o armazenamento, criando-o se ainda não existir.
+
+        Args:
+            directory: Pasta onde ficam os arquivos das colunas.
+            numberOfQueens: Tamanho de cada indivíduo. Ignorado se o armazenamento já existir.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+        metadataPath = os.path.join(directory, "metadata.json")
+        if os.path.isfile(metadataPath):
+            with open(metadataPath, "r", encoding="utf-8") as file:
+                numberOfQueens = json.load(file)["numberOfQueens"]
+        else:
+            with open(metadataPath, "w", encoding="utf-8") as file:
+                json.dump({"numberOfQueens": numberOfQueens}, file)
+
+        self.numberOfQueens = numberOfQueens
+        self.recordShapes = {name: (numberOfQueens,) if name == "individuals" else () for name in self.COLUMNS}
+        self.recordSizes = {name: np.dtype(dtype).itemsize * int(np.prod(self.recordShapes[name])) for name, dtype in self.COLUMNS.items()}
+        self.files = {}
+
+        # Descarta um registro incompleto deixado por uma interrupção durante a escrita.
+        self.count = min(self.column_size(name) // self.recordSizes[name] for name in self.COLUMNS)
+        for name in self.COLUMNS:
+            with open(self.column_path(name), "ab") as file:
+                file.truncate(self.count * self.recordSizes[name])
+
+    def column_path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.bin")
+
+    def column_size(self, name: str) -> int:
+        path = self.column_path(name)
+        return os.path.getsize(path) if os.path.isfile(path) else 0
+
+    def append(self, seed: int, individual: list[int], score: int, endRound: int, executionTime: float):
+        """
+        Acrescenta o resultado de uma execução.
+
+        Args:
+            seed: Seed da execução.
+            individual: Melhor indivíduo encontrado.
+            score: Pontuação do melhor indivíduo.
+            endRound: Round de parada.
+            executionTime: Tempo de execução em segundos.
+        """
+        self.append_many([seed], [individual], [score], [endRound], [executionTime])
+
+    def append_many(self, seeds: list[int], individuals: list[list[int]], scores: list[int], endRounds: list[int], executionTimes: list[float]):
+        """
+        Acrescenta vários resultados de uma vez.
+
+        Args:
+            seeds: Seeds das execuções.
+            individuals: Melhores indivíduos encontrados.
+            scores: Pontuações dos melhores indivíduos.
+            endRounds: Rounds de parada.
+            executionTimes: Tempos de execução em segundos.
+        """
+        values = {
+            "seeds": seeds,
+            "individuals": individuals,
+            "scores": scores,
+            "end_rounds": endRounds,
+            "execution_times": executionTimes
+        }
+
+        for name, dtype in self.COLUMNS.items():
+            column = np.asarray(values[name], dtype=dtype).reshape((-1,) + self.recordShapes[name])
+            if name not in self.files:
+                self.files[name] = open(self.column_path(name), "ab")
+            self.files[name].write(column.tobytes())
+            self.files[name].flush()
+
+        self.count += len(seeds)
+
+    def read(self, name: str) -> np.ndarray:
+        """
+        Lê uma coluna sem copiar os dados.
+
+        Args:
+            name: Nome da coluna, uma das chaves de COLUMNS.
+
+        Returns:
+            Um np.memmap somente leitura com um registro por execução.
+        """
+        self.flush()
+        if self.count == 0:
+            return np.zeros((0,) + self.recordShapes[name], dtype=self.COLUMNS[name])
+        return np.memmap(self.column_path(name), dtype=self.COLUMNS[name], mode="r", shape=(self.count,) + self.recordShapes[name])
+
+    def completed_seeds(self) -> Counter:
+        """
+        Retorna quantas vezes cada seed já foi executada.
+        """
+        return Counter(self.read("seeds").tolist())
+
+    def pending_seeds(self, seeds: list[int]) -> list[int]:
+        """
+        Filtra as seeds que ainda não foram executadas, preservando a ordem.
+
+        Args:
+            seeds: Lista completa de seeds planejadas.
+
+        Returns:
+            As seeds que faltam executar.
+        """
+        completed = self.completed_seeds()
+        pending = []
+        for seed in seeds:
+            if completed[seed] > 0:
+                completed[seed] -= 1
+            else:
+                pending.append(seed)
+        return pending
+
+    def save_plan(self, seeds: list[int]):
+        """
+        Salva a lista de seeds planejadas, para que uma execução interrompida possa ser retomada.
+        """
+        np.save(os.path.join(self.directory, "plan.npy"), np.asarray(seeds, dtype=np.uint64))
+
+    def load_plan(self) -> list[int]:
+        """
+        Carrega a lista de seeds planejadas, ou None se ela ainda não foi salva.
+        """
+        path = os.path.join(self.directory, "plan.npy")
+        return np.load(path).tolist() if os.path.isfile(path) else None
+
+    def delete_plan(self):
+        """
+        Apaga a lista de seeds planejadas, indicando que a varredura terminou.
+        """
+        path = os.path.join(self.directory, "plan.npy")
+        if os.path.isfile(path):
+            os.remove(path)
+
+    def flush(self):
+        for file in self.files.values():
+            file.flush()
+
+    def close(self):
+        for file in self.files.values():
+            file.close()
+        self.files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def from_json(jsonPath: str, directory: str) -> "ResultsStore":
+        """
+        Converte um results.json no formato antigo para o armazenamento em colunas.
+
+        O armazenamento convertido não tem plano e as seeds são fictícias, então ele deve ficar em uma pasta
+        separada da usada pelas novas varreduras.
+
+        Args:
+            jsonPath: Caminho do results.json.
+            directory: Pasta onde o armazenamento será criado.
+
+        Returns:
+            O armazenamento criado.
+        """
+        with open(jsonPath, "r", encoding="utf-8") as file:
+            results = json.load(file)
+
+        # O formato antigo não guardava as seeds, então elas ficam com o índice da execução.
+        numberOfQueens = len(results["Individuals"][0]) if results["Individuals"] else 8
+        store = ResultsStore(directory, numberOfQueens=numberOfQueens)
+        store.append_many(list(range(len(results["Scores"]))),
+                          results["Individuals"],
+                          results["Scores"],
+                          results["End Rounds"],
+                          results["Execution Times"])
+        return store
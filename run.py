@@ -1,4 +1,6 @@
+import os
 from genetic_algorithm import *
+from stepper import GeneticAlgorithmStepper
 
 POPULATION_SIZE: int = 20
 CROSSOVER_RATE: float = 0.8
@@ -10,6 +12,9 @@ RANDOM_STATE: int = 42
 # Individuos distintos que chegaram no 0: 41, 42, 769, 18, 27, 89, 746
 # 41 termina de primeira, 42 é o que eu uso pra testar
 
+CHECKPOINT_PATH: str = None # Pasta onde o estado é salvo. Se ela existir, a execução continua dela.
+CHECKPOINT_INTERVAL: int = 100
+
 generate_population = PopulationGenerator.generate_eight_queen_vector
 evaluate_population = PopulationAssessor.evaluate_eight_queen_vector 
 stopping_criterion = StoppingCriteria.stop_eight_queen_vector_min
@@ -19,22 +24,28 @@ mutation_strategy = Modifier.apply_bit_flip_eight_queen_vector
 survivor_selection_strategy = SuvivorCriteria.random_switch_all_population_eight_queen_vector
 
 
-endRound = 0
-population = generate_population(POPULATION_SIZE, RANDOM_STATE)
-evaluates = evaluate_population(population)
-
-for round in range(NUMBER_OF_GENERATIONS):
-    endRound = round+1
-
-    if stopping_criterion(evaluates, MIN_VALUE) == True:
-        break
-
-    parents = parent_selection_strategy(population, evaluates, round, RANDOM_STATE)
-    sons = crossover_strategy(parents, CROSSOVER_RATE, round, RANDOM_STATE)
-    mutateSons = mutation_strategy(sons, MUTATION_RATE, round, RANDOM_STATE)
-    sonsEvaluates = evaluate_population(mutateSons)
-
-    population, evaluates =  survivor_selection_strategy(population, mutateSons, evaluates, sonsEvaluates, POPULATION_SIZE, round, RANDOM_STATE)
+stepper = GeneticAlgorithmStepper(POPULATION_SIZE,
+    CROSSOVER_RATE,
+    MUTATION_RATE,
+    NUMBER_OF_GENERATIONS,
+    MIN_VALUE,
+    RANDOM_STATE,
+    generate_population,
+    evaluate_population,
+    stopping_criterion,
+    parent_selection_strategy,
+    crossover_strategy,
+    mutation_strategy,
+    survivor_selection_strategy)
+
+if CHECKPOINT_PATH is not None and os.path.isdir(CHECKPOINT_PATH):
+    stepper.load_checkpoint(CHECKPOINT_PATH)
+
+for round, population, evaluates in stepper:
+    if CHECKPOINT_PATH is not None and (round+1) % CHECKPOINT_INTERVAL == 0:
+        stepper.save_checkpoint(CHECKPOINT_PATH)
+
+population, evaluates, endRound = stepper.population, stepper.evaluates, stepper.endRound
 
 print(f"\nPopulação Final alcançada no round {endRound}, número de indivíduos: {len(population)}:")
 for i in range(len(population)):
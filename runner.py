@@ -0,0 +1,78 @@
+from genetic_algorithm import *
+from stepper import GeneticAlgorithmStepper
+
+def run(POPULATION_SIZE,
+        CROSSOVER_RATE,
+        MUTATION_RATE,
+        NUMBER_OF_GENERATIONS,
+        MIN_VALUE,
+        RANDOM_STATE,
+        generate_population, 
+        evaluate_population, 
+        stopping_criterion, 
+        parent_selection_strategy, 
+        crossover_strategy, 
+        mutation_strategy, 
+        survivor_selection_strategy,
+        return_best_individual_and_score_function,
+        USE_RANDOM_CONTEXT: bool = False,
+        PROFILER = None,
+        STAGNATION_CRITERION = None):
+    """
+    Executa o algoritmo genético.
+
+    Args:
+        POPULATION_SIZE: Tamanho da população que vai ser gerada.
+        CROSSOVER_RATE: Taxa de cruzamento.
+        MUTATION_RATE: Taxa de mutação dos filhos.
+        NUMBER_OF_GENERATIONS: Número de gerações que serão criadas.
+        MIN_VALUE: O valor minimo da função de custo.
+        RANDOM_STATE: O estado aleátorio definido.
+        generate_population: A função reponsável por gerar a população.
+        evaluate_population: A função reponsável por avaliar os individuos.
+        stopping_criterion: A função reponsável por verificar se o critério de parada foi atendido.
+        parent_selection_strategy: A função reponsável por selecionar os pares para reprodução.
+        crossover_strategy: A função reponsável por realizar o cruzamento.
+        mutation_strategy: A função reponsável por selecionar alguns filhos e aplicar a mutação dos genes neles.
+        survivor_selection_strategy: A função reponsável por selecionar os sobreviventes que irão constituir a próxima geração.
+        return_best_individual_and_score_function: A reponsável por selecionar o melhor individuo ao final da execução do código e retornar ele e a sua pontuação.
+        USE_RANDOM_CONTEXT: Se True, uma seed inteira vira um RandomContext, com um fluxo independente por operador.
+            Se False, os operadores recriam o gerador a cada chamada, reproduzindo os resultados anteriores.
+        PROFILER: Um profiling.Profiler opcional, que mede cada operador em cada geração. None não adiciona custo.
+        STAGNATION_CRITERION: Um stagnation.StagnationCriterion opcional, que encerra ou recomeça a execução
+            quando a melhor pontuação para de melhorar ou a população perde a diversidade.
+
+    Returns:
+        O melhor individuo encontrado e o número de execuções.
+    """
+
+    stepper = GeneticAlgorithmStepper(POPULATION_SIZE,
+        CROSSOVER_RATE,
+        MUTATION_RATE,
+        NUMBER_OF_GENERATIONS,
+        MIN_VALUE,
+        RANDOM_STATE,
+        generate_population,
+        evaluate_population,
+        stopping_criterion,
+        parent_selection_strategy,
+        crossover_strategy,
+        mutation_strategy,
+        survivor_selection_strategy,
+        USE_RANDOM_CONTEXT,
+        PROFILER,
+        STAGNATION_CRITERION)
+
+    while stepper.step():
+        pass
+
+    population, evaluates, endRound = stepper.population, stepper.evaluates, stepper.endRound
+
+    bestIndividual, bestScore = return_best_individual_and_score_function(population, evaluates)
+
+    return bestIndividual, bestScore, endRound
+
+def getBestIndividual(individuals: list[list[int]], scores: list[int]) -> list[list[int], int]:
+    minValue = min(scores)
+    minValueIndex = scores.index(minValue)
+    return individuals[minValueIndex], scores[minValueIndex]
@@ -0,0 +1,157 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import count, islice
+from typing import Iterable
+
+import numpy as np
+
+from experiment_executor import run_seed_chunk
+
+# Número de soluções de cada tabuleiro n x n, com todas as imagens (OEIS A000170) e só as classes de simetria (OEIS A002562).
+NUMBER_OF_SOLUTIONS = {1: 1, 2: 0, 3: 0, 4: 2, 5: 10, 6: 4, 7: 40, 8: 92, 9: 352, 10: 724, 11: 2680, 12: 14200, 13: 73712, 14: 365596}
+NUMBER_OF_CLASSES = {1: 1, 2: 0, 3: 0, 4: 1, 5: 2, 6: 1, 7: 6, 8: 12, 9: 46, 10: 92, 11: 341, 12: 1787, 13: 9233, 14: 45752}
+
+def is_permutation(individual: list[int] | np.ndarray) -> bool:
+    """
+    Verifica se o indivíduo tem uma rainha em cada linha.
+
+    As funções de avaliação contam só as colisões nas diagonais, então um indivíduo com pontuação 0 pode ter
+    duas rainhas na mesma linha e não ser uma solução do problema.
+    """
+    individual = np.asarray(individual)
+    return bool(np.array_equal(np.sort(individual), np.arange(individual.shape[0])))
+
+def symmetric_images(individual: list[int] | np.ndarray) -> np.ndarray:
+    """
+    Gera as 8 imagens de uma solução pelas simetrias do tabuleiro (rotações e reflexões).
+
+    Na representação de vetor, inverter a ordem espelha as colunas, n - 1 - valor espelha as linhas e a permutação
+    inversa espelha pela diagonal principal. Combinadas, essas operações geram as 8 simetrias.
+
+    Args:
+        individual: Permutação de 0 a n - 1 com a linha da rainha de cada coluna.
+
+    Returns:
+        Array (8, n) com as imagens, possivelmente repetidas.
+    """
+    individual = np.asarray(individual, dtype=np.int64)
+    numberOfQueens = individual.shape[0]
+    if not is_permutation(individual):
+        raise ValueError("A solução precisa ser uma permutação de 0 a n - 1.")
+
+    inverse = np.empty_like(individual)
+    inverse[individual] = np.arange(numberOfQueens)
+
+    images = []
+    for base in (individual, inverse):
+        images.extend([base, base[::-1], numberOfQueens - 1 - base, numberOfQueens - 1 - base[::-1]])
+    return np.stack(images)
+
+def canonical_form(individual: list[int] | np.ndarray) -> tuple[int, ...]:
+    """
+    Retorna a menor imagem, em ordem lexicográfica, entre as 8 simetrias da solução.
+
+    Duas soluções têm a mesma forma canônica se e somente se uma é rotação ou reflexão da outra.
+    """
+    return min(tuple(image.tolist()) for image in symmetric_images(individual))
+
+def orbit_size(individual: list[int] | np.ndarray) -> int:
+    """
+    Retorna o número de soluções distintas obtidas pelas simetrias da solução.
+    """
+    return len({tuple(image.tolist()) for image in symmetric_images(individual)})
+
+def harvest_solutions(runArguments: dict,
+                      numberOfSolutions: int = 92,
+                      seeds: Iterable[int] = None,
+                      numberOfWorkers: int = None,
+                      countImages: bool = True,
+                      maxInFlight: int = None,
+                      maxRuns: int = None,
+                      numberOfQueens: int = None) -> tuple[dict[tuple[int, ...], tuple[int, list[int], int]], int]:
+    """
+    Executa seeds em paralelo até encontrar numberOfSolutions soluções distintas ou concluir maxRuns execuções,
+    cancelando o trabalho restante.
+
+    Cada indivíduo com pontuação igual a MIN_VALUE e uma rainha por linha é identificado pela forma canônica, e uma classe
+    de simetria já encontrada não é contada de novo.
+    As seeds são enviadas ao pool aos poucos, com no máximo maxInFlight execuções pendentes, então ao atingir
+    a meta sobra pouco trabalho em andamento, e as execuções que ainda não começaram são canceladas.
+
+    Args:
+        runArguments: Argumentos de run(), exceto RANDOM_STATE, passados por nome. As funções precisam ser serializáveis.
+        numberOfSolutions: Número de soluções distintas desejadas.
+        seeds: Seeds das execuções, podendo ser um iterador infinito. None usa 0, 1, 2, ...
+        numberOfWorkers: Número de processos. None usa todos os núcleos e 1 executa no processo atual.
+        countImages: Se True, cada classe de simetria encontrada entra no resultado com todas as suas imagens distintas,
+            então para n = 8 é possível chegar às 92 soluções. Se False, entra só a solução encontrada de cada classe,
+            no máximo 12 para n = 8.
+        maxInFlight: Número máximo de execuções pendentes no pool. None usa 2 por processo.
+        maxRuns: Número máximo de execuções. None só para ao atingir a meta ou quando as seeds acabam.
+        numberOfQueens: Tamanho do tabuleiro, usado para validar a meta. None usa o tamanho dos indivíduos de generate_population.
+
+    Returns:
+        Um dicionário de cada solução para (seed, solução, round de parada) da primeira execução que encontrou a sua
+        classe, e o número de execuções concluídas. Com countImages, as chaves são todas as imagens das classes
+        encontradas; sem, as chaves são as formas canônicas e os valores guardam a solução como foi encontrada.
+        Ao atingir a meta, o dicionário tem pelo menos numberOfSolutions entradas, e pode passar dela porque a última
+        classe entra inteira. Se maxRuns for atingido antes da meta, o dicionário tem menos entradas.
+
+    Raises:
+        ValueError: Se numberOfSolutions for maior que o número de soluções que existem para o tabuleiro.
+    """
+    if numberOfQueens is None:
+        numberOfQueens = len(runArguments["generate_population"](1, 0)[0])
+    knownSolutions = (NUMBER_OF_SOLUTIONS if countImages else NUMBER_OF_CLASSES).get(numberOfQueens)
+    if knownSolutions is not None and numberOfSolutions > knownSolutions:
+        kind = "soluções" if countImages else "classes de simetria de soluções"
+        raise ValueError(f"O tabuleiro de {numberOfQueens} rainhas tem apenas {knownSolutions} {kind}, mas foram pedidas {numberOfSolutions}.")
+
+    seeds = iter(count() if seeds is None else seeds)
+    if maxRuns is not None:
+        seeds = islice(seeds, maxRuns)
+    numberOfWorkers = numberOfWorkers if numberOfWorkers is not None else (os.cpu_count() or 1)
+    maxInFlight = maxInFlight if maxInFlight is not None else 2 * numberOfWorkers
+    minValue = runArguments["MIN_VALUE"]
+
+    solutions = {}
+    numberOfRuns = 0
+
+    def collect(results) -> bool:
+        nonlocal numberOfRuns
+        for seed, bestIndividual, bestScore, endRound, _ in results:
+            numberOfRuns += 1
+            if bestScore != minValue or not is_permutation(bestIndividual):
+                continue
+            key = canonical_form(bestIndividual)
+            # A forma canônica é uma das imagens, então também marca as classes já expandidas.
+            if key in solutions:
+                continue
+            if countImages:
+                for image in symmetric_images(key):
+                    solutions.setdefault(tuple(image.tolist()), (seed, image.tolist(), endRound))
+            else:
+                solutions[key] = (seed, list(bestIndividual), endRound)
+            if len(solutions) >= numberOfSolutions:
+                return True
+        return False
+
+    if numberOfWorkers == 1:
+        for seed in seeds:
+            if collect(run_seed_chunk([seed], runArguments)):
+                break
+        return solutions, numberOfRuns
+
+    executor = ProcessPoolExecutor(max_workers=numberOfWorkers)
+    try:
+        pending = {executor.submit(run_seed_chunk, [seed], runArguments) for seed in islice(seeds, maxInFlight)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            if any(collect(future.result()) for future in done):
+                break
+            pending |= {executor.submit(run_seed_chunk, [seed], runArguments) for seed in islice(seeds, len(done))}
+    finally:
+        # Não espera as execuções em andamento, cujos resultados seriam descartados de qualquer forma.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return solutions, numberOfRuns
@@ -0,0 +1,125 @@
+import numpy as np
+
+from genetic_algorithm import StoppingCriteria
+from random_context import RandomContext
+
+ACTIONS = ("stop", "restart")
+
+class StagnationCriterion:
+    """
+    Acompanha a melhor pontuação e a diversidade da população a cada geração e detecta quando a execução estagnou.
+
+    A melhor pontuação é atualizada de forma incremental e a diversidade é calculada com um único conjunto de hashes
+    dos genótipos, então cada geração custa O(tamanho da população). Ao estagnar, a execução para ou recomeça com
+    uma população nova, mantendo o melhor indivíduo encontrado.
+
+    Pode ser passado como STAGNATION_CRITERION para run(), e o mesmo objeto pode ser usado em várias execuções.
+    """
+    def __init__(self, window: int = 50, minDiversity: float = 0.0, action: str = "restart", maxRestarts: int = None):
+        """
+        Args:
+            window: Número de gerações seguidas sem melhora da melhor pontuação que caracteriza a estagnação.
+            minDiversity: Fração de genótipos distintos abaixo da qual a população é considerada colapsada,
+                o que também caracteriza a estagnação. 0 desativa esse critério.
+            action: "stop" encerra a execução e "restart" gera uma população nova.
+            maxRestarts: Número máximo de recomeços por execução. Depois dele a estagnação encerra a execução.
+                None não limita.
+        """
+        if window < 1:
+            raise ValueError("window deve ser pelo menos 1.")
+        if action not in ACTIONS:
+            raise ValueError(f"Ação desconhecida: {action}.")
+
+        self.window = window
+        self.minDiversity = minDiversity
+        self.action = action
+        self.maxRestarts = maxRestarts
+        self.totalRestarts = 0
+        self.totalStops = 0
+        self.start_run()
+
+    def start_run(self):
+        """
+        Zera o estado da execução atual.
+        """
+        self.bestScore = None
+        self.generationsWithoutImprovement = 0
+        self.diversity = 1.0
+        self.restarts = 0
+
+    def update(self, population: list[list[int]] | np.ndarray, evaluates: list[int] | np.ndarray) -> str:
+        """
+        Registra uma geração e decide o que a execução deve fazer.
+
+        Args:
+            population: População sobrevivente da geração.
+            evaluates: Pontuações da população.
+
+        Returns:
+            "continue", "stop" ou "restart".
+        """
+        best = min(evaluates)
+        if self.bestScore is None or best < self.bestScore:
+            self.bestScore = best
+            self.generationsWithoutImprovement = 0
+        else:
+            self.generationsWithoutImprovement += 1
+
+        # A diversidade custa uma passada por toda a população, então só é medida quando o critério está ativo.
+        if self.minDiversity > 0:
+            self.diversity = StoppingCriteria.population_diversity(population)
+
+        stagnated = self.generationsWithoutImprovement >= self.window or self.diversity < self.minDiversity
+        if not stagnated:
+            return "continue"
+
+        if self.action == "restart" and (self.maxRestarts is None or self.restarts < self.maxRestarts):
+            return "restart"
+
+        self.totalStops += 1
+        return "stop"
+
+    def restart(self, population, evaluates, generate_population, evaluate_population, populationSize: int, randomState):
+        """
+        Gera uma população nova e coloca nela o melhor indivíduo da população atual, no lugar do pior.
+
+        Args:
+            population: População atual.
+            evaluates: Pontuações da população atual.
+            generate_population: A mesma função de geração passada para run().
+            evaluate_population: A mesma função de avaliação passada para run().
+            populationSize: Tamanho da população.
+            randomState: O estado aleatório da execução.
+
+        Returns:
+            A nova população e as suas pontuações.
+        """
+        self.restarts += 1
+        self.totalRestarts += 1
+
+        bestIndex = int(np.argmin(evaluates))
+        bestIndividual = np.array(population[bestIndex], copy=True) if isinstance(population, np.ndarray) else list(population[bestIndex])
+        bestScore = evaluates[bestIndex]
+
+        newPopulation = generate_population(populationSize, StagnationCriterion.restart_state(randomState, self.restarts))
+        newEvaluates = evaluate_population(newPopulation)
+
+        worstIndex = int(np.argmax(newEvaluates))
+        newPopulation[worstIndex] = bestIndividual
+        newEvaluates[worstIndex] = bestScore
+
+        self.generationsWithoutImprovement = 0
+        self.diversity = 1.0
+        return newPopulation, newEvaluates
+
+    @staticmethod
+    def restart_state(randomState, restartIndex: int):
+        """
+        Deriva o estado aleatório usado para gerar a população de um recomeço.
+
+        Uma seed inteira geraria sempre a mesma população inicial, então cada recomeço recebe uma seed derivada dela.
+        Um RandomContext já avança o seu fluxo de geração e None já é imprevisível, então ambos são mantidos.
+        """
+        if randomState is None or isinstance(randomState, RandomContext):
+            return randomState
+        return int(np.random.SeedSequence([randomState, restartIndex]).generate_state(1, np.uint64)[0])
@@ -0,0 +1,279 @@
+import inspect
+import os
+import shutil
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+from random_context import RandomContext
+
+class GenerationState(NamedTuple):
+    round: int
+    population: list[list[int]] | np.ndarray
+    evaluates: list[int] | np.ndarray
+
+class GeneticAlgorithmStepper:
+    """
+    Executa o algoritmo genético uma geração por vez, com os mesmos operadores de run().
+
+    Iterar sobre o objeto entrega o estado ao final de cada geração, o que permite acompanhar o progresso,
+    parar antes ou intercalar várias execuções. O estado completo pode ser salvo em arquivos .npy e restaurado,
+    continuando a execução exatamente como se ela não tivesse sido interrompida.
+    """
+    def __init__(self,
+                 POPULATION_SIZE,
+                 CROSSOVER_RATE,
+                 MUTATION_RATE,
+                 NUMBER_OF_GENERATIONS,
+                 MIN_VALUE,
+                 RANDOM_STATE,
+                 generate_population,
+                 evaluate_population,
+                 stopping_criterion,
+                 parent_selection_strategy,
+                 crossover_strategy,
+                 mutation_strategy,
+                 survivor_selection_strategy,
+                 USE_RANDOM_CONTEXT: bool = False,
+                 PROFILER = None,
+                 STAGNATION_CRITERION = None):
+        """
+        Args:
+            Os mesmos de run(), exceto return_best_individual_and_score_function.
+            Se survivor_selection_strategy aceitar round e randomState, eles também são passados.
+        """
+        if USE_RANDOM_CONTEXT and not isinstance(RANDOM_STATE, RandomContext):
+            RANDOM_STATE = RandomContext(RANDOM_STATE)
+
+        self.survivorUsesRandomState = GeneticAlgorithmStepper.accepts_random_state(survivor_selection_strategy)
+
+        if PROFILER is not None:
+            PROFILER.start_run(RANDOM_STATE)
+            generate_population = PROFILER.wrap("generate_population", generate_population)
+            evaluate_population = PROFILER.wrap("evaluate_population", evaluate_population)
+            stopping_criterion = PROFILER.wrap("stopping_criterion", stopping_criterion)
+            parent_selection_strategy = PROFILER.wrap("parent_selection_strategy", parent_selection_strategy)
+            crossover_strategy = PROFILER.wrap("crossover_strategy", crossover_strategy)
+            mutation_strategy = PROFILER.wrap("mutation_strategy", mutation_strategy)
+            survivor_selection_strategy = PROFILER.wrap("survivor_selection_strategy", survivor_selection_strategy)
+
+        if STAGNATION_CRITERION is not None:
+            STAGNATION_CRITERION.start_run()
+
+        self.POPULATION_SIZE = POPULATION_SIZE
+        self.CROSSOVER_RATE = CROSSOVER_RATE
+        self.MUTATION_RATE = MUTATION_RATE
+        self.NUMBER_OF_GENERATIONS = NUMBER_OF_GENERATIONS
+        self.MIN_VALUE = MIN_VALUE
+        self.RANDOM_STATE = RANDOM_STATE
+        self.generate_population = generate_population
+        self.evaluate_population = evaluate_population
+        self.stopping_criterion = stopping_criterion
+        self.parent_selection_strategy = parent_selection_strategy
+        self.crossover_strategy = crossover_strategy
+        self.mutation_strategy = mutation_strategy
+        self.survivor_selection_strategy = survivor_selection_strategy
+        self.PROFILER = PROFILER
+        self.STAGNATION_CRITERION = STAGNATION_CRITERION
+
+        self.population = None
+        self.evaluates = None
+        self.nextRound = 0
+        self.endRound = 0
+        self.finished = False
+
+    @staticmethod
+    def accepts_random_state(function) -> bool:
+        """
+        Verifica se a seleção de sobreviventes recebe round e randomState depois de populationSize.
+        """
+        try:
+            parameters = inspect.signature(function).parameters
+        except (TypeError, ValueError):
+            return False
+        return "round" in parameters and "randomState" in parameters
+
+    def start(self):
+        """
+        Gera e avalia a população inicial, se isso ainda não foi feito.
+        """
+        if self.population is None:
+            self.population = self.generate_population(self.POPULATION_SIZE, self.RANDOM_STATE)
+            self.evaluates = self.evaluate_population(self.population)
+
+    def step(self) -> bool:
+        """
+        Executa uma geração.
+
+        Returns:
+            True se uma geração foi executada e False se a execução terminou, pelo critério de parada,
+            pela estagnação ou pelo número de gerações.
+        """
+        if self.finished:
+            return False
+        self.start()
+
+        if self.nextRound >= self.NUMBER_OF_GENERATIONS:
+            self.finished = True
+            return False
+
+        round = self.nextRound
+        self.endRound = round+1
+
+        if self.PROFILER is not None:
+            self.PROFILER.start_generation(round)
+
+        if self.stopping_criterion(self.evaluates, self.MIN_VALUE) == True:
+            self.finished = True
+            return False
+
+        parents = self.parent_selection_strategy(self.population, self.evaluates, round, self.RANDOM_STATE)
+        sons = self.crossover_strategy(parents, self.CROSSOVER_RATE, round, self.RANDOM_STATE)
+        mutateSons = self.mutation_strategy(sons, self.MUTATION_RATE, round, self.RANDOM_STATE)
+        sonsEvaluates = self.evaluate_population(mutateSons)
+
+        if self.survivorUsesRandomState:
+            self.population, self.evaluates = self.survivor_selection_strategy(self.population, mutateSons, self.evaluates, sonsEvaluates, self.POPULATION_SIZE, round, self.RANDOM_STATE)
+        else:
+            self.population, self.evaluates = self.survivor_selection_strategy(self.population, mutateSons, self.evaluates, sonsEvaluates, self.POPULATION_SIZE)
+        self.nextRound = round+1
+
+        if self.PROFILER is not None:
+            self.PROFILER.end_generation(self.population, self.evaluates)
+
+        if self.STAGNATION_CRITERION is not None:
+            action = self.STAGNATION_CRITERION.update(self.population, self.evaluates)
+            if action == "stop":
+                self.finished = True
+            elif action == "restart":
+                self.population, self.evaluates = self.STAGNATION_CRITERION.restart(self.population, self.evaluates, self.generate_population, self.evaluate_population, self.POPULATION_SIZE, self.RANDOM_STATE)
+
+        return True
+
+    def __iter__(self) -> Iterator[GenerationState]:
+        """
+        Executa as gerações restantes, entregando o estado ao final de cada uma.
+        """
+        while self.step():
+            yield GenerationState(self.nextRound - 1, self.population, self.evaluates)
+
+    def save_checkpoint(self, directory: str):
+        """
+        Salva o estado completo da execução em arquivos .npy.
+
+        Os arquivos são escritos em uma pasta temporária que só então substitui a anterior, então uma interrupção
+        durante a escrita mantém o checkpoint anterior. O estado do PROFILER não é salvo.
+
+        Args:
+            directory: Pasta do checkpoint.
+        """
+        self.start()
+        temporaryDirectory = directory + ".tmp"
+        oldDirectory = directory + ".old"
+        shutil.rmtree(temporaryDirectory, ignore_errors=True)
+        os.makedirs(temporaryDirectory)
+
+        isList = not isinstance(self.population, np.ndarray)
+        criterion = self.STAGNATION_CRITERION
+        hasCriterion = criterion is not None and criterion.bestScore is not None
+        state = np.array([
+            self.nextRound,
+            self.endRound,
+            self.finished,
+            isList,
+            hasCriterion,
+            criterion.bestScore if hasCriterion else 0,
+            criterion.generationsWithoutImprovement if hasCriterion else 0,
+            criterion.restarts if hasCriterion else 0
+        ], dtype=np.int64)
+
+        np.save(os.path.join(temporaryDirectory, "population.npy"), np.asarray(self.population))
+        np.save(os.path.join(temporaryDirectory, "evaluates.npy"), np.asarray(self.evaluates))
+        np.save(os.path.join(temporaryDirectory, "rng.npy"), GeneticAlgorithmStepper.random_state_array(self.RANDOM_STATE))
+        np.save(os.path.join(temporaryDirectory, "state.npy"), state)
+
+        if os.path.isdir(directory):
+            shutil.rmtree(oldDirectory, ignore_errors=True)
+            os.replace(directory, oldDirectory)
+        os.replace(temporaryDirectory, directory)
+        shutil.rmtree(oldDirectory, ignore_errors=True)
+
+    def load_checkpoint(self, directory: str):
+        """
+        Restaura o estado salvo por save_checkpoint.
+
+        O stepper precisa ter sido criado com os mesmos parâmetros, operadores e RANDOM_STATE da execução salva.
+
+        Args:
+            directory: Pasta do checkpoint. Se ela não existir, mas a cópia anterior existir, a cópia é usada.
+        """
+        if not os.path.isdir(directory) and os.path.isdir(directory + ".old"):
+            directory = directory + ".old"
+
+        state = np.load(os.path.join(directory, "state.npy"))
+        population = np.load(os.path.join(directory, "population.npy"))
+        evaluates = np.load(os.path.join(directory, "evaluates.npy"))
+        nextRound, endRound, finished, isList, hasCriterion, bestScore, generationsWithoutImprovement, restarts = state.tolist()
+
+        self.population = population.tolist() if isList else population
+        self.evaluates = evaluates.tolist() if isList else evaluates
+        self.nextRound = nextRound
+        self.endRound = endRound
+        self.finished = bool(finished)
+        GeneticAlgorithmStepper.restore_random_state(self.RANDOM_STATE, np.load(os.path.join(directory, "rng.npy")))
+
+        if self.STAGNATION_CRITERION is not None:
+            self.STAGNATION_CRITERION.start_run()
+            if hasCriterion:
+                self.STAGNATION_CRITERION.bestScore = bestScore
+                self.STAGNATION_CRITERION.generationsWithoutImprovement = generationsWithoutImprovement
+                self.STAGNATION_CRITERION.restarts = restarts
+
+    @staticmethod
+    def random_state_array(randomState) -> np.ndarray:
+        """
+        Converte o estado dos geradores de um RandomContext em um array.
+
+        Uma seed inteira não tem estado a salvar, pois os operadores recriam o gerador a partir de (seed, round).
+        None usa entropia do sistema a cada chamada, então a continuação não é reproduzível.
+
+        Returns:
+            Array (len(RandomContext.OPERATORS), 7) de uint64: se o gerador existe, o estado e o incremento do
+            PCG64 em duas palavras cada, has_uint32 e uinteger.
+        """
+        states = np.zeros((len(RandomContext.OPERATORS), 7), dtype=np.uint64)
+        if not isinstance(randomState, RandomContext):
+            return states
+
+        mask = (1 << 64) - 1
+        for operatorIndex, operator in enumerate(RandomContext.OPERATORS):
+            if operator not in randomState.generators:
+                continue
+            bitGeneratorState = randomState.generators[operator].bit_generator.state
+            if bitGeneratorState["bit_generator"] != "PCG64":
+                raise ValueError(f"Gerador não suportado: {bitGeneratorState['bit_generator']}.")
+            value, increment = bitGeneratorState["state"]["state"], bitGeneratorState["state"]["inc"]
+            states[operatorIndex] = [1, value >> 64, value & mask, increment >> 64, increment & mask,
+                                     bitGeneratorState["has_uint32"], bitGeneratorState["uinteger"]]
+        return states
+
+    @staticmethod
+    def restore_random_state(randomState, states: np.ndarray):
+        """
+        Restaura nos geradores de um RandomContext o estado salvo por random_state_array.
+        """
+        if not isinstance(randomState, RandomContext):
+            return
+
+        for operatorIndex, operator in enumerate(RandomContext.OPERATORS):
+            exists, valueHigh, valueLow, incrementHigh, incrementLow, hasUint32, uinteger = (int(value) for value in states[operatorIndex])
+            if not exists:
+                randomState.generators.pop(operator, None)
+                continue
+            generator = randomState.generator(operator)
+            generator.bit_generator.state = {
+                "bit_generator": "PCG64",
+                "state": {"state": (valueHigh << 64) | valueLow, "inc": (incrementHigh << 64) | incrementLow},
+                "has_uint32": hasUint32,
+                "uinteger": uinteger
+            }
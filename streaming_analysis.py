@@ -0,0 +1,263 @@
+from typing import Iterator
+
+import numpy as np
+
+from results_store import ResultsStore
+from solution_harvester import canonical_form
+
+# Maior número de genótipos possíveis (n^n) para o qual os distintos são marcados em um array de bytes.
+DISTINCT_TABLE_LIMIT = 2**27
+
+class RunningStatistics:
+    """
+    Acumula contagem, média, desvio padrão, mínimo e máximo de uma coluna recebida em blocos.
+
+    Cada bloco é resumido por numpy e combinado ao acumulado com a fórmula de Chan para a soma dos quadrados
+    dos desvios, a versão em blocos do algoritmo de Welford. A memória usada não depende do número de valores.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.sumOfSquares = 0.0
+        self.min = None
+        self.max = None
+
+    def update(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        if values.shape[0] == 0:
+            return
+
+        chunkCount = values.shape[0]
+        chunkMean = values.mean()
+        chunkSumOfSquares = np.square(values - chunkMean).sum()
+
+        total = self.count + chunkCount
+        delta = chunkMean - self.mean
+        self.mean += delta * chunkCount / total
+        self.sumOfSquares += chunkSumOfSquares + delta**2 * self.count * chunkCount / total
+        self.count = total
+
+        chunkMin, chunkMax = values.min(), values.max()
+        self.min = chunkMin if self.min is None else min(self.min, chunkMin)
+        self.max = chunkMax if self.max is None else max(self.max, chunkMax)
+
+    @property
+    def std(self) -> float:
+        """
+        Desvio padrão populacional, o mesmo de np.std.
+        """
+        return float(np.sqrt(self.sumOfSquares / self.count)) if self.count > 0 else 0.0
+
+class IntegerHistogram:
+    """
+    Conta as ocorrências de cada valor inteiro não negativo, crescendo conforme aparecem valores maiores.
+    """
+    def __init__(self):
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def update(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.int64).reshape(-1)
+        if values.shape[0] == 0:
+            return
+        chunkCounts = np.bincount(values)
+        if chunkCounts.shape[0] > self.counts.shape[0]:
+            self.counts = np.pad(self.counts, (0, chunkCounts.shape[0] - self.counts.shape[0]))
+        self.counts[:chunkCounts.shape[0]] += chunkCounts
+
+class DistinctSolutions:
+    """
+    Conta os indivíduos distintos que atingiram a pontuação mínima, as soluções válidas e as classes de simetria.
+
+    Para tabuleiros pequenos cada genótipo é codificado em base n e marcado em um array de n^n bytes, com tamanho
+    fixo. Para os maiores, os genótipos ficam em um conjunto, limitado pelo número de genótipos distintos.
+    """
+    def __init__(self, numberOfQueens: int, numberOfExamples: int = 5):
+        self.numberOfQueens = numberOfQueens
+        self.numberOfExamples = numberOfExamples
+        self.zeroScoreCount = 0
+        self.distinctCount = 0
+        self.examples = []
+        self.validSolutions = set()
+        self.classes = set()
+
+        if numberOfQueens**numberOfQueens <= DISTINCT_TABLE_LIMIT:
+            self.seen = np.zeros(numberOfQueens**numberOfQueens, dtype=np.bool_)
+            self.powers = numberOfQueens ** np.arange(numberOfQueens - 1, -1, -1, dtype=np.int64)
+        else:
+            self.seen = set()
+
+    def update(self, individuals: np.ndarray):
+        """
+        Registra os indivíduos de pontuação mínima de um bloco.
+
+        Args:
+            individuals: Array (numberOfIndividuals, numberOfQueens) só com os indivíduos de pontuação mínima.
+        """
+        self.zeroScoreCount += individuals.shape[0]
+        if individuals.shape[0] == 0:
+            return
+
+        if isinstance(self.seen, set):
+            newIndividuals = []
+            for individual in individuals:
+                key = individual.tobytes()
+                if key not in self.seen:
+                    self.seen.add(key)
+                    newIndividuals.append(individual)
+        else:
+            if individuals.min() < 0 or individuals.max() >= self.numberOfQueens:
+                raise ValueError("Os genes precisam estar entre 0 e numberOfQueens - 1.")
+            keys = individuals.astype(np.int64) @ self.powers
+            # np.unique ordena as chaves, então return_index mantém a ordem de aparição de cada genótipo novo.
+            keys, firstIndex = np.unique(keys, return_index=True)
+            isNew = ~self.seen[keys]
+            self.seen[keys[isNew]] = True
+            newIndividuals = individuals[np.sort(firstIndex[isNew])]
+
+        newIndividuals = np.asarray(newIndividuals).reshape(-1, self.numberOfQueens)
+        self.distinctCount += newIndividuals.shape[0]
+        for individual in newIndividuals[:self.numberOfExamples - len(self.examples)]:
+            self.examples.append(tuple(individual.tolist()))
+
+        isPermutation = np.all(np.sort(newIndividuals, axis=1) == np.arange(self.numberOfQueens), axis=1)
+        for individual in newIndividuals[isPermutation]:
+            self.validSolutions.add(tuple(individual.tolist()))
+            self.classes.add(canonical_form(individual))
+
+class BinnedSeries:
+    """
+    Resume uma coluna por blocos de execuções consecutivas, com um número fixo de pontos para o gráfico.
+    """
+    def __init__(self, totalCount: int, numberOfBins: int = 1000):
+        self.binSize = max(1, -(-totalCount // numberOfBins))
+        numberOfBins = max(1, -(-totalCount // self.binSize))
+        self.sums = np.zeros(numberOfBins, dtype=np.float64)
+        self.counts = np.zeros(numberOfBins, dtype=np.int64)
+
+    def update(self, startIndex: int, values: np.ndarray):
+        bins = (startIndex + np.arange(values.shape[0])) // self.binSize
+        self.sums += np.bincount(bins, weights=values, minlength=self.sums.shape[0])[:self.sums.shape[0]]
+        self.counts += np.bincount(bins, minlength=self.counts.shape[0])[:self.counts.shape[0]]
+
+    def means(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna o índice da primeira execução de cada bloco e a média do bloco.
+        """
+        filled = self.counts > 0
+        return (np.arange(self.sums.shape[0]) * self.binSize)[filled], self.sums[filled] / self.counts[filled]
+
+def iterate_chunks(store: ResultsStore, chunkSize: int = 1_000_000) -> Iterator[tuple[int, dict[str, np.ndarray]]]:
+    """
+    Lê as colunas do armazenamento em blocos.
+
+    Cada bloco é lido do arquivo para um array novo, em vez de fatiar um np.memmap, então as páginas já
+    analisadas não continuam contando na memória do processo.
+
+    Returns:
+        Um iterador de (índice da primeira execução, dicionário com cada coluna no bloco).
+    """
+    store.flush()
+    for startIndex in range(0, store.count, chunkSize):
+        numberOfRecords = min(chunkSize, store.count - startIndex)
+        chunk = {}
+        for name, dtype in store.COLUMNS.items():
+            recordShape = store.recordShapes[name]
+            values = np.fromfile(store.column_path(name), dtype=dtype, count=numberOfRecords * int(np.prod(recordShape)), offset=startIndex * store.recordSizes[name])
+            chunk[name] = values.reshape((numberOfRecords,) + recordShape)
+        yield startIndex, chunk
+
+class StreamingAnalysis:
+    """
+    Analisa os resultados em blocos, com memória limitada independente do número de execuções.
+    """
+    def __init__(self, numberOfQueens: int, totalCount: int, minValue: int = 0, numberOfBins: int = 1000):
+        self.minValue = minValue
+        self.endRounds = RunningStatistics()
+        self.executionTimes = RunningStatistics()
+        self.scores = RunningStatistics()
+        self.endRoundHistogram = IntegerHistogram()
+        self.scoreHistogram = IntegerHistogram()
+        self.scoreSeries = BinnedSeries(totalCount, numberOfBins)
+        self.solutions = DistinctSolutions(numberOfQueens)
+
+    def update(self, startIndex: int, chunk: dict[str, np.ndarray]):
+        """
+        Acrescenta um bloco de resultados, no formato de iterate_chunks.
+        """
+        self.endRounds.update(chunk["end_rounds"])
+        self.executionTimes.update(chunk["execution_times"])
+        self.scores.update(chunk["scores"])
+        self.endRoundHistogram.update(chunk["end_rounds"])
+        self.scoreHistogram.update(chunk["scores"])
+        self.scoreSeries.update(startIndex, chunk["scores"])
+        self.solutions.update(chunk["individuals"][chunk["scores"] == self.minValue])
+
+    def report_lines(self) -> list[str]:
+        """
+        Monta as linhas de estatísticas do relatório.
+        """
+        lines = [
+            f"O número de execuções foi: {self.endRounds.count}",
+            f"|- Número médio de gerações: {self.endRounds.mean:.5f} | Desvio padrão: {self.endRounds.std:.5f} | Mínimo: {self.endRounds.min:.0f} | Máximo: {self.endRounds.max:.0f}",
+            f"|- Tempo médio de execução: {self.executionTimes.mean:.5f} | Desvio padrão: {self.executionTimes.std:.5f} | Mínimo: {self.executionTimes.min:.5f} | Máximo: {self.executionTimes.max:.5f}",
+            f"|- Pontuação média do melhor individuo encontrado: {self.scores.mean:.5f} | Desvio padrão: {self.scores.std:.5f} | Mínimo: {self.scores.min:.0f} | Máximo: {self.scores.max:.0f}",
+            "|",
+            f"|- Número de individuos que alcançaram a melhor pontuação: {self.solutions.zeroScoreCount}",
+            f"|- Número de individuos únicos que alcançaram a melhor pontuação: {self.solutions.distinctCount}",
+            f"|- Número de soluções válidas distintas (uma rainha por linha): {len(self.solutions.validSolutions)}",
+            f"|- Número de soluções distintas a menos de rotações e reflexões: {len(self.solutions.classes)}",
+            "|- Exemplares:"
+        ]
+        lines.extend(f"|- - {individual}" for individual in self.solutions.examples)
+        return lines
+
+    def plot(self, path: str):
+        """
+        Salva os gráficos agregados: histogramas do round de parada e da pontuação e a pontuação média por bloco de execuções.
+
+        O custo de desenhar não cresce com o número de execuções, e os pontos são rasterizados dentro do PDF.
+        """
+        import matplotlib.pyplot as plt
+
+        figure, (endRoundAxis, scoreAxis, seriesAxis) = plt.subplots(1, 3, figsize=(18, 6), gridspec_kw={"width_ratios": [2, 1, 2]})
+
+        rounds = np.nonzero(self.endRoundHistogram.counts)[0]
+        endRoundAxis.bar(rounds, self.endRoundHistogram.counts[rounds], width=1.0, color="orange")
+        endRoundAxis.set_yscale("log")
+        endRoundAxis.set_title("Round de parada", weight="bold")
+        endRoundAxis.set_xlabel("Round", weight="bold")
+        endRoundAxis.set_ylabel("Execuções", weight="bold")
+
+        scoreValues = np.arange(self.scoreHistogram.counts.shape[0])
+        scoreAxis.bar(scoreValues, self.scoreHistogram.counts, color="orange")
+        scoreAxis.set_yscale("log")
+        scoreAxis.set_xticks(scoreValues)
+        scoreAxis.set_title("Pontuação do melhor individuo", weight="bold")
+        scoreAxis.set_xlabel("Pontuação", weight="bold")
+
+        startIndexes, meanScores = self.scoreSeries.means()
+        seriesAxis.scatter(startIndexes, meanScores, color="orange", marker="p", s=5, rasterized=True)
+        seriesAxis.set_title(f"Pontuação média a cada {self.scoreSeries.binSize} execuções", weight="bold")
+        seriesAxis.set_xlabel("Execução", weight="bold")
+        seriesAxis.set_ylabel("Pontuação média", weight="bold")
+
+        figure.suptitle(f"Resultados de {self.endRounds.count} execuções", weight="bold")
+        figure.savefig(path, dpi=300, bbox_inches="tight", pad_inches=0.15)
+        plt.close(figure)
+
+def analyze_store(store: ResultsStore, chunkSize: int = 1_000_000, minValue: int = 0) -> StreamingAnalysis:
+    """
+    Percorre todo o armazenamento em blocos e retorna a análise.
+
+    Args:
+        store: Armazenamento com os resultados.
+        chunkSize: Número de execuções lidas por bloco.
+        minValue: Pontuação que caracteriza uma solução.
+
+    Returns:
+        A análise preenchida.
+    """
+    analysis = StreamingAnalysis(store.numberOfQueens, store.count, minValue)
+    for startIndex, chunk in iterate_chunks(store, chunkSize):
+        analysis.update(startIndex, chunk)
+    return analysis
@@ -0,0 +1,41 @@
+import numpy as np
+
+from batched_genetic_algorithm import run_batched, uniform, seed_keys
+from genetic_algorithm import PopulationAssessor
+
+SEEDS = list(range(12))
+
+def test_batched_run_matches_single_runs():
+    # Cada execução do lote deve dar o mesmo resultado que a mesma seed executada sozinha.
+    bestIndividuals, bestScores, endRounds = run_batched(20, 0.8, 0.03, 30, 0, SEEDS)
+
+    for i, seed in enumerate(SEEDS):
+        singleIndividual, singleScore, singleEndRound = run_batched(20, 0.8, 0.03, 30, 0, [seed])
+        assert np.array_equal(bestIndividuals[i], singleIndividual[0])
+        assert bestScores[i] == singleScore[0]
+        assert endRounds[i] == singleEndRound[0]
+
+def test_finished_runs_are_removed_without_changing_the_others():
+    # Com 30 gerações parte das execuções termina cedo e sai do lote, e parte chega ao limite.
+    bestIndividuals, bestScores, endRounds = run_batched(20, 0.8, 0.03, 30, 0, SEEDS)
+
+    finished = endRounds < 30
+    assert finished.any() and not finished.all()
+    assert np.all(bestScores[finished] == 0)
+    assert np.all(bestScores[~finished] > 0)
+    assert np.array_equal(PopulationAssessor.evaluate_n_queen_histogram(bestIndividuals), bestScores)
+
+    # Tirar as execuções que terminam cedo não pode alterar as que continuam.
+    remaining = [seed for seed, done in zip(SEEDS, finished) if not done]
+    remainingIndividuals, remainingScores, remainingEndRounds = run_batched(20, 0.8, 0.03, 30, 0, remaining)
+    assert np.array_equal(remainingIndividuals, bestIndividuals[~finished])
+    assert np.array_equal(remainingScores, bestScores[~finished])
+    assert np.array_equal(remainingEndRounds, endRounds[~finished])
+
+def test_uniform_depends_only_on_the_run_key():
+    keys = seed_keys([3, 7, 11])
+    together = uniform(keys, 5, 1, (4, 2))
+    assert together.shape == (3, 4, 2)
+    assert np.all((together >= 0) & (together < 1))
+    assert np.array_equal(together[1], uniform(keys[1:2], 5, 1, (4, 2))[0])
+    assert not np.array_equal(together[0], uniform(keys[:1], 6, 1, (4, 2))[0])
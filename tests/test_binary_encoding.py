@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from genetic_algorithm import BinaryEncoding, CrossoverMethods, Modifier, PopulationAssessor, PopulationGenerator
+
+NUMBERS_OF_QUEENS = [1, 2, 3, 8, 11, 32]
+
+@pytest.mark.parametrize("numberOfQueens", NUMBERS_OF_QUEENS)
+def test_encoding_round_trip(numberOfQueens):
+    population = PopulationGenerator.generate_n_queen_array(500, 0, numberOfQueens)
+    packed = BinaryEncoding.encode_queen_binary(population)
+
+    _, _, numberOfWords = BinaryEncoding.layout(numberOfQueens)
+    assert packed.dtype == np.uint32 and packed.shape == (500, numberOfWords)
+    assert np.array_equal(BinaryEncoding.decode_queen_binary(packed, numberOfQueens), population)
+    assert not np.any(packed & ~BinaryEncoding.used_bits_mask(numberOfQueens))
+
+@pytest.mark.parametrize("numberOfQueens", NUMBERS_OF_QUEENS)
+def test_binary_evaluation_matches_decoded(numberOfQueens):
+    packed = PopulationGenerator.generate_queen_binary(500, 1, numberOfQueens)
+    decoded = BinaryEncoding.decode_queen_binary(packed, numberOfQueens)
+    assert np.array_equal(PopulationAssessor.evaluate_queen_binary(packed, numberOfQueens), PopulationAssessor.evaluate_n_queen_histogram(decoded))
+
+@pytest.mark.parametrize("numberOfQueens", [2, 3, 8, 11, 32])
+def test_binary_crossover_matches_array_crossover(numberOfQueens):
+    # Os dois operadores consomem os números aleatórios na mesma ordem, então os filhos devem ser iguais.
+    parents = PopulationGenerator.generate_n_queen_array(400, 2, numberOfQueens).reshape(200, 2, numberOfQueens)
+    packedParents = BinaryEncoding.encode_queen_binary(parents.reshape(-1, numberOfQueens)).reshape(200, 2, -1)
+
+    sons = CrossoverMethods.cut_point_queen_array(parents, 0.8, 3, 5)
+    packedSons = CrossoverMethods.cut_point_queen_binary(packedParents, 0.8, 3, 5, numberOfQueens)
+    assert np.array_equal(BinaryEncoding.decode_queen_binary(packedSons, numberOfQueens), sons)
+
+@pytest.mark.parametrize("mutationRate", [0.0, 0.05, 0.5, 1.0])
+@pytest.mark.parametrize("numberOfQueens", [1, 8, 11, 32])
+def test_binary_mutation_only_flips_used_bits(numberOfQueens, mutationRate):
+    packed = PopulationGenerator.generate_queen_binary(2000, 3, numberOfQueens)
+    mutated = Modifier.apply_bit_flip_queen_binary(packed, mutationRate, 0, 4, numberOfQueens)
+    flipped = packed ^ mutated
+
+    bitsPerGene, _, _ = BinaryEncoding.layout(numberOfQueens)
+    usedBits = 2000 * numberOfQueens * bitsPerGene
+    numberOfFlips = int(np.unpackbits(flipped.view(np.uint8)).sum())
+
+    assert not np.any(flipped & ~BinaryEncoding.used_bits_mask(numberOfQueens))
+    assert abs(numberOfFlips - mutationRate * usedBits) <= 5 * np.sqrt(usedBits * mutationRate * (1 - mutationRate)) + 1
+    assert np.array_equal(mutated, Modifier.apply_bit_flip_queen_binary(packed, mutationRate, 0, 4, numberOfQueens))
@@ -0,0 +1,42 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from chunked_evaluator import ChunkedEvaluator
+from fitness_cache import CachedEvaluator
+from genetic_algorithm import PopulationAssessor, PopulationGenerator
+from incremental_fitness import IncrementalEvaluator
+
+def small_chunks(evaluate_population) -> ChunkedEvaluator:
+    # Blocos de 10 indivíduos de 8 rainhas, avaliados por 2 threads.
+    return ChunkedEvaluator(evaluate_population, memoryBudget=2 * 10 * 64, bytesPerIndividual=lambda numberOfQueens: 64, numberOfWorkers=2)
+
+@pytest.mark.parametrize("evaluate_population", [PopulationAssessor.evaluate_queen_array,
+                                                 partial(PopulationAssessor.evaluate_n_queen_histogram, countRowConflicts=True)],
+                         ids=["function", "partial"])
+def test_functions_use_threads(evaluate_population):
+    population = PopulationGenerator.generate_n_queen_array(95, 0, 8)
+
+    with small_chunks(evaluate_population) as evaluator:
+        evaluates = evaluator(population)
+        assert evaluator.executor is not None
+
+    assert np.array_equal(evaluates, evaluate_population(population))
+
+def test_stateful_evaluators_run_serially():
+    population = PopulationGenerator.generate_n_queen_array(95, 0, 8)
+    cache = CachedEvaluator(PopulationAssessor.evaluate_n_queen_histogram)
+
+    for evaluate_population in (cache, IncrementalEvaluator().evaluate_queen_array):
+        with small_chunks(evaluate_population) as evaluator:
+            evaluates = evaluator(population)
+            assert evaluator.executor is None
+        assert np.array_equal(evaluates, PopulationAssessor.evaluate_n_queen_histogram(population))
+
+    assert cache.misses == 95
+
+def test_thread_safe_marker():
+    assert ChunkedEvaluator.is_thread_safe(PopulationAssessor.evaluate_queen_array)
+    assert not ChunkedEvaluator.is_thread_safe(CachedEvaluator(PopulationAssessor.evaluate_queen_array))
+    assert not ChunkedEvaluator.is_thread_safe(partial(IncrementalEvaluator().evaluate_queen_array))
@@ -0,0 +1,39 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from genetic_algorithm import PopulationAssessor, PopulationGenerator
+
+NUMBERS_OF_QUEENS = [1, 2, 3, 8]
+
+def all_genomes(numberOfQueens: int) -> np.ndarray:
+    return np.array(list(itertools.product(range(numberOfQueens), repeat=numberOfQueens)), dtype=np.int64)
+
+@pytest.mark.parametrize("countRowConflicts", [False, True])
+@pytest.mark.parametrize("numberOfQueens", NUMBERS_OF_QUEENS)
+def test_histogram_matches_pairwise_counts(numberOfQueens, countRowConflicts):
+    # Todos os genótipos para tabuleiros pequenos e uma amostra aleatória para 8 rainhas.
+    if numberOfQueens <= 3:
+        population = all_genomes(numberOfQueens)
+    else:
+        population = PopulationGenerator.generate_n_queen_array(2000, 0, numberOfQueens)
+
+    expected = PopulationAssessor.evaluate_eight_queen_vector(population.tolist(), countRowConflicts)
+    histogram = PopulationAssessor.evaluate_n_queen_histogram(population, countRowConflicts)
+
+    assert histogram.tolist() == expected
+    assert PopulationAssessor.evaluate_queen_array(population, countRowConflicts).tolist() == expected
+
+def test_histogram_known_boards():
+    solution = np.array([[0, 4, 7, 5, 2, 6, 1, 3]])
+    diagonal = np.array([[0, 1, 2, 3, 4, 5, 6, 7]])
+    sameRow = np.zeros((1, 8), dtype=np.int64)
+
+    assert PopulationAssessor.evaluate_n_queen_histogram(solution).tolist() == [0]
+    assert PopulationAssessor.evaluate_n_queen_histogram(diagonal).tolist() == [28]
+    assert PopulationAssessor.evaluate_n_queen_histogram(sameRow).tolist() == [0]
+    assert PopulationAssessor.evaluate_n_queen_histogram(sameRow, countRowConflicts=True).tolist() == [28]
+
+def test_histogram_empty_population():
+    assert PopulationAssessor.evaluate_n_queen_histogram(np.zeros((0, 8), dtype=np.int64)).shape == (0,)
@@ -0,0 +1,55 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from genetic_algorithm import PopulationAssessor, PopulationGenerator
+from incremental_fitness import IncrementalEvaluator
+
+NUMBERS_OF_QUEENS = [1, 2, 3, 8]
+
+@pytest.mark.parametrize("countRowConflicts", [False, True])
+@pytest.mark.parametrize("numberOfQueens", NUMBERS_OF_QUEENS)
+def test_changed_genes_matches_full_evaluation(numberOfQueens, countRowConflicts):
+    # Uma sequência aleatória de mutações, cada uma alterando de 1 a numberOfQueens genes distintos.
+    rng = np.random.default_rng(numberOfQueens)
+    population = PopulationGenerator.generate_n_queen_array(200, 1, numberOfQueens)
+    evaluates = PopulationAssessor.evaluate_n_queen_histogram(population, countRowConflicts)
+
+    for _ in range(30):
+        numberOfChanges = rng.integers(1, numberOfQueens + 1)
+        changedPositions = np.argsort(rng.random(size=population.shape), axis=1)[:, :numberOfChanges]
+        changedMask = rng.random(size=changedPositions.shape) < 0.8
+
+        modified = population.copy()
+        newValues = rng.integers(0, numberOfQueens, size=changedPositions.shape)
+        rows = np.broadcast_to(np.arange(population.shape[0])[:, None], changedPositions.shape)
+        modified[rows[changedMask], changedPositions[changedMask]] = newValues[changedMask]
+
+        evaluates = PopulationAssessor.evaluate_changed_genes_queen_array(population, evaluates, modified, changedPositions, changedMask, countRowConflicts)
+        population = modified
+
+        assert evaluates.tolist() == PopulationAssessor.evaluate_n_queen_histogram(population, countRowConflicts).tolist()
+
+@pytest.mark.parametrize("countRowConflicts", [False, True])
+@pytest.mark.parametrize("numberOfQueens", [2, 3, 8])
+def test_incremental_operators_match_full_evaluation(numberOfQueens, countRowConflicts):
+    # O ponto de corte precisa de pelo menos 2 rainhas, então o tabuleiro 1x1 só entra no teste acima.
+    evaluator = IncrementalEvaluator(countRowConflicts=countRowConflicts)
+    population = PopulationGenerator.generate_n_queen_array(100, 2, numberOfQueens)
+    evaluates = evaluator.evaluate_queen_array(population)
+
+    for round in range(20):
+        parents = evaluator.select_parent_roulette_queen_array(population, evaluates, round, 7)
+        sons = evaluator.cut_point_queen_array(parents, 0.8, round, 7)
+        sons = evaluator.apply_bit_flip_queen_array(sons, 0.3, round, 7)
+
+        assert evaluator.sonsEvaluates is not None
+        sonsEvaluates = evaluator.evaluate_queen_array(sons)
+        assert sonsEvaluates.tolist() == PopulationAssessor.evaluate_n_queen_histogram(sons, countRowConflicts).tolist()
+
+        population, evaluates = np.concatenate((population, sons))[-100:], np.concatenate((evaluates, sonsEvaluates))[-100:]
+
+def test_mismatched_counting_mode_is_rejected():
+    with pytest.raises(ValueError):
+        IncrementalEvaluator(partial(PopulationAssessor.evaluate_n_queen_histogram, countRowConflicts=True))
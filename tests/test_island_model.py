@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from genetic_algorithm import *
+from island_model import run_islands, TOPOLOGIES
+from runner import getBestIndividual
+
+LIST_OPERATORS = (PopulationGenerator.generate_eight_queen_vector,
+                  PopulationAssessor.evaluate_eight_queen_vector,
+                  StoppingCriteria.stop_eight_queen_vector_min,
+                  ParentSelector.select_parent_roulette_eight_queen_vector,
+                  CrossoverMethods.cut_point_eight_eight_queen_vector,
+                  Modifier.apply_bit_flip_eight_queen_vector,
+                  SuvivorCriteria.elitist_replacement_eight_queen_vector,
+                  getBestIndividual)
+
+ARRAY_OPERATORS = (PopulationGenerator.generate_eight_queen_array,
+                   PopulationAssessor.evaluate_queen_array,
+                   StoppingCriteria.stop_queen_array_min,
+                   ParentSelector.select_parent_tournament_queen_array,
+                   CrossoverMethods.cut_point_queen_array,
+                   Modifier.apply_bit_flip_queen_array,
+                   SuvivorCriteria.random_switch_all_population_queen_array,
+                   BestIndividualSelector.get_best_queen_array)
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+@pytest.mark.parametrize("operators", [LIST_OPERATORS, ARRAY_OPERATORS], ids=["list", "array"])
+def test_run_islands_with_migrations(operators, topology):
+    # MIN_VALUE = -1 nunca é atingido, então todas as ilhas fazem as 30 gerações e migram 6 vezes.
+    bestIndividual, bestScore, endRound = run_islands(20, 0.8, 0.1, 30, -1, 3, *operators,
+                                                      NUMBER_OF_ISLANDS=3, MIGRATION_INTERVAL=5, TOPOLOGY=topology)
+
+    assert endRound == 30
+    assert len(bestIndividual) == 8
+    assert bestScore == PopulationAssessor.evaluate_eight_queen_vector([list(bestIndividual)])[0]
+
+@pytest.mark.parametrize("operators", [LIST_OPERATORS, ARRAY_OPERATORS], ids=["list", "array"])
+def test_run_islands_stops_at_min_value(operators):
+    bestIndividual, bestScore, endRound = run_islands(20, 0.8, 0.1, 1000, 0, 3, *operators, NUMBER_OF_ISLANDS=2)
+
+    assert bestScore == 0
+    assert endRound < 1000
+
+def test_run_islands_reports_survivor_errors():
+    def keep_sons(oldPopulation, newPopulation, oldGenerationEvaluate, newGenerationEvaluate, populationSize):
+        return newPopulation, newGenerationEvaluate
+
+    operators = ARRAY_OPERATORS[:6] + (keep_sons, ARRAY_OPERATORS[7])
+    with pytest.raises(RuntimeError, match="seleção de sobreviventes"):
+        run_islands(20, 0.8, 0.1, 30, -1, 3, *operators, NUMBER_OF_ISLANDS=2)
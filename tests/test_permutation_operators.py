@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from genetic_algorithm import *
+
+CROSSOVERS = [CrossoverMethods.order_crossover_queen_array, CrossoverMethods.partially_mapped_crossover_queen_array]
+MUTATIONS = [Modifier.apply_swap_queen_array, Modifier.apply_inversion_queen_array]
+
+def assert_permutations(population, numberOfQueens):
+    assert np.array_equal(np.sort(population, axis=1), np.broadcast_to(np.arange(numberOfQueens), population.shape))
+
+@pytest.mark.parametrize("crossover", CROSSOVERS, ids=["order", "partially_mapped"])
+@pytest.mark.parametrize("numberOfQueens", [2, 8, 32])
+def test_crossover_keeps_permutations(crossover, numberOfQueens):
+    population = PopulationGenerator.generate_n_queen_array(400, 3, numberOfQueens)
+    parents = population.reshape(-1, 2, numberOfQueens)
+    original = parents.copy()
+
+    for round in range(5):
+        sons = crossover(parents, 1.0, round, 11)
+        assert sons.shape == population.shape
+        assert_permutations(sons, numberOfQueens)
+
+    assert np.array_equal(parents, original)
+
+@pytest.mark.parametrize("crossover", CROSSOVERS, ids=["order", "partially_mapped"])
+def test_crossover_of_equal_parents_copies_them(crossover):
+    individuals = PopulationGenerator.generate_n_queen_array(50, 5, 8)
+    parents = np.stack((individuals, individuals), axis=1)
+
+    sons = crossover(parents, 1.0, 0, 7)
+
+    assert np.array_equal(sons, np.repeat(individuals, 2, axis=0))
+
+@pytest.mark.parametrize("crossover", CROSSOVERS, ids=["order", "partially_mapped"])
+def test_crossover_is_reproducible(crossover):
+    parents = PopulationGenerator.generate_n_queen_array(200, 1, 8).reshape(-1, 2, 8)
+
+    sons = crossover(parents, 0.8, 3, 42)
+
+    assert np.array_equal(sons, crossover(parents, 0.8, 3, 42))
+    assert sons.shape[0] % 2 == 0 and 0 < sons.shape[0] < 200
+
+@pytest.mark.parametrize("mutation", MUTATIONS, ids=["swap", "inversion"])
+@pytest.mark.parametrize("numberOfQueens", [2, 8, 32])
+def test_mutation_keeps_permutations(mutation, numberOfQueens):
+    sons = PopulationGenerator.generate_n_queen_array(300, 9, numberOfQueens)
+    original = sons.copy()
+
+    mutateSons = mutation(sons, 1.0, 0, 13)
+
+    assert_permutations(mutateSons, numberOfQueens)
+    # Com taxa 1 todos os filhos mudam, já que as duas operações mexem em pelo menos dois genes distintos.
+    assert np.all(np.any(mutateSons != original, axis=1))
+    assert np.array_equal(sons, original)
+
+@pytest.mark.parametrize("mutation", MUTATIONS, ids=["swap", "inversion"])
+def test_mutation_rate(mutation):
+    sons = PopulationGenerator.generate_n_queen_array(2000, 4, 8)
+
+    assert np.array_equal(mutation(sons, 0.0, 0, 1), sons)
+
+    changed = np.any(mutation(sons, 0.25, 0, 1) != sons, axis=1).mean()
+    assert changed == pytest.approx(0.25, abs=0.05)
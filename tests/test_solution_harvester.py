@@ -0,0 +1,50 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from genetic_algorithm import *
+from solution_harvester import NUMBER_OF_CLASSES, canonical_form, harvest_solutions, is_permutation
+
+# Tabuleiro 6 x 6, que tem só 4 soluções em uma única classe de simetria, então poucas execuções bastam.
+RUN_ARGUMENTS = {
+    "POPULATION_SIZE": 20,
+    "CROSSOVER_RATE": 0.8,
+    "MUTATION_RATE": 0.1,
+    "NUMBER_OF_GENERATIONS": 200,
+    "MIN_VALUE": 0,
+    "generate_population": partial(PopulationGenerator.generate_n_queen_array, numberOfQueens=6),
+    "evaluate_population": PopulationAssessor.evaluate_n_queen_histogram,
+    "stopping_criterion": StoppingCriteria.stop_queen_array_min,
+    "parent_selection_strategy": ParentSelector.select_parent_tournament_queen_array,
+    "crossover_strategy": CrossoverMethods.cut_point_queen_array,
+    "mutation_strategy": Modifier.apply_bit_flip_queen_array,
+    "survivor_selection_strategy": SuvivorCriteria.elitist_replacement_queen_array,
+    "return_best_individual_and_score_function": BestIndividualSelector.get_best_queen_array
+}
+
+def assert_solutions(solutions):
+    for _, solution, _ in solutions.values():
+        assert is_permutation(solution)
+        assert PopulationAssessor.evaluate_n_queen_histogram(np.array([solution]))[0] == 0
+
+@pytest.mark.parametrize("numberOfWorkers", [1, 2])
+def test_count_images_returns_every_image(numberOfWorkers):
+    solutions, numberOfRuns = harvest_solutions(RUN_ARGUMENTS, 4, numberOfWorkers=numberOfWorkers, maxRuns=200)
+
+    assert len(solutions) == 4
+    assert_solutions(solutions)
+    assert all(list(key) == solution for key, (_, solution, _) in solutions.items())
+    assert len({canonical_form(key) for key in solutions}) == NUMBER_OF_CLASSES[6]
+    assert numberOfRuns >= 1
+
+def test_count_classes_returns_one_entry_per_class():
+    solutions, _ = harvest_solutions(RUN_ARGUMENTS, 1, numberOfWorkers=1, countImages=False, maxRuns=200)
+
+    assert len(solutions) == 1
+    assert_solutions(solutions)
+    assert all(key == canonical_form(solution) for key, (_, solution, _) in solutions.items())
+
+def test_more_solutions_than_exist_raises():
+    with pytest.raises(ValueError):
+        harvest_solutions(RUN_ARGUMENTS, 5, numberOfWorkers=1)